@@ -2,21 +2,43 @@
 """Fail CI if pip-audit filtered report contains CVSS >= 7.0."""
 from __future__ import annotations
 
+import itertools
 import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional in CI; stdlib json accepts bytes too
+    _loads = json.loads
+
 
 def get_score(v: dict) -> float | None:
-    cvss_v3 = v.get("cvss_v3") or {}
-    base = cvss_v3.get("base_score")
-    if isinstance(base, (int, float)):
-        return float(base)
+    cvss_v3 = v.get("cvss_v3")
+    if cvss_v3:
+        base = cvss_v3.get("base_score")
+        if type(base) is float or type(base) is int:
+            return float(base)
     s = v.get("score")
-    try:
-        return float(s) if s is not None else None
-    except Exception:
-        return None
+    if type(s) is float or type(s) is int:
+        return float(s)
+    if type(s) is str:
+        try:
+            return float(s)
+        except ValueError:
+            return None
+    return None
+
+
+def _iter_high(data: dict) -> Iterator[tuple[str, str, float, str | None]]:
+    for dep in data.get("dependencies", []):
+        for v in dep.get("vulns", []):
+            score = get_score(v)
+            if score is not None and score >= 7.0:
+                yield (dep.get("name", ""), v.get("id", ""), score, v.get("description"))
 
 
 def main() -> int:
@@ -26,26 +48,21 @@ def main() -> int:
         return 0
 
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = _loads(p.read_bytes())
     except Exception as exc:
         print("Failed to read pip-audit-filtered.json; skipping check:", exc)
         return 0
 
-    high: list[tuple[str, str, float, str | None]] = []
-    for dep in data.get("dependencies", []):
-        for v in dep.get("vulns", []):
-            score = get_score(v)
-            if score is not None and score >= 7.0:
-                high.append((dep.get("name", ""), v.get("id", ""), score, v.get("description")))
-
-    if high:
-        print("High severity vulnerabilities found:")
-        for name, vid, score, desc in high:
-            print(f"- {name} {vid} (CVSS {score})")
-        return 1
+    high = _iter_high(data)
+    first = next(high, None)
+    if first is None:
+        print("No high severity (CVSS>=7.0) vulnerabilities found.")
+        return 0
 
-    print("No high severity (CVSS>=7.0) vulnerabilities found.")
-    return 0
+    print("High severity vulnerabilities found:")
+    for name, vid, score, _desc in itertools.chain([first], high):
+        print(f"- {name} {vid} (CVSS {score})")
+    return 1
 
 
 if __name__ == "__main__":
@@ -3,35 +3,90 @@
 This package provides tools for fetching Issues and Wiki pages from Redmine,
 processing attachments (OCR, PDF extraction), converting Textile to Markdown,
 and generating structured Markdown files for RAG applications.
+
+Public symbols are loaded lazily (PEP 562) so that importing the package,
+e.g. for ``redmine-ka --help``, does not pull in the client, processor and
+generator stacks until they are actually used.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2.0.0"
 
-from .client import RedmineClient
-from .config import AppConfig, OutputConfig, RedmineConfig
-from .converter import TextileConverter, textile_to_markdown
-from .generator import MarkdownGenerator
-from .models import (
-    AttachmentInfo,
-    ExtractedContent,
-    IssueMetadata,
-    JournalEntry,
-    ProcessingMethod,
-    WikiPageMetadata,
-)
-from .processors import (
-    BaseProcessor,
-    DocxProcessor,
-    FallbackProcessor,
-    ImageProcessor,
-    PdfProcessor,
-    ProcessorFactory,
-    SpreadsheetProcessor,
-)
+if TYPE_CHECKING:
+    from .client import RedmineClient
+    from .config import AppConfig, OutputConfig, RedmineConfig
+    from .converter import TextileConverter, textile_to_markdown
+    from .generator import MarkdownGenerator
+    from .models import (
+        AttachmentInfo,
+        AttachmentKind,
+        ExtractedContent,
+        IssueMetadata,
+        JournalEntry,
+        ProcessingMethod,
+        WikiPageMetadata,
+    )
+    from .processors import (
+        BaseProcessor,
+        DocxProcessor,
+        FallbackProcessor,
+        ImageProcessor,
+        PdfProcessor,
+        ProcessorFactory,
+        SpreadsheetProcessor,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_MAP: dict[str, str] = {
+    "RedmineClient": ".client",
+    "AppConfig": ".config",
+    "OutputConfig": ".config",
+    "RedmineConfig": ".config",
+    "TextileConverter": ".converter",
+    "textile_to_markdown": ".converter",
+    "MarkdownGenerator": ".generator",
+    "AttachmentInfo": ".models",
+    "AttachmentKind": ".models",
+    "ExtractedContent": ".models",
+    "IssueMetadata": ".models",
+    "JournalEntry": ".models",
+    "ProcessingMethod": ".models",
+    "WikiPageMetadata": ".models",
+    "BaseProcessor": ".processors",
+    "DocxProcessor": ".processors",
+    "FallbackProcessor": ".processors",
+    "ImageProcessor": ".processors",
+    "PdfProcessor": ".processors",
+    "ProcessorFactory": ".processors",
+    "SpreadsheetProcessor": ".processors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public symbol on first access and cache it in the module namespace."""
+    module_name = _LAZY_MAP.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded symbols in ``dir()`` output."""
+    return sorted(set(globals()) | set(_LAZY_MAP))
+
 
 __all__ = [
     "AppConfig",
     "AttachmentInfo",
+    "AttachmentKind",
     "BaseProcessor",
     "DocxProcessor",
     "ExtractedContent",
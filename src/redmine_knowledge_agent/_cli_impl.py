@@ -0,0 +1,423 @@
+"""Implementation of the Redmine Knowledge Agent CLI commands.
+
+The command signatures live in ``__main__``, which only imports typer; this
+module holds the command bodies and is imported on first invocation.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import structlog
+import typer
+
+from .client import RedmineClient
+from .config import AppConfig
+from .converter import textile_to_markdown
+from .generator import MarkdownGenerator
+from .processors import ProcessorFactory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from .__main__ import FetchMode
+    from .models import AttachmentInfo, ExtractedContent
+
+# Constants
+DESCRIPTION_TRUNCATE_LENGTH = 60
+PREFETCH_QUEUE_SIZE = 64
+PREFETCH_THREAD_NAME = "redmine-ka-prefetch"
+ATTACHMENT_THREAD_PREFIX = "redmine-ka-attachment"
+
+T = TypeVar("T")
+
+logger = structlog.get_logger(__name__)
+
+
+# Stdlib logging levels accepted in config
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# (level, log_format) of the active logging configuration
+_configured_logging: tuple[str, str] | None = None
+
+
+# Shared structlog processor chain; the renderer is appended per log format
+_BASE_PROCESSORS: tuple[Callable[..., Any], ...] = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+)
+
+_RENDERERS: dict[str, Callable[..., Any]] = {
+    "json": structlog.processors.JSONRenderer(),
+    "console": structlog.dev.ConsoleRenderer(),
+}
+
+
+def setup_logging(level: str = "INFO", log_format: str = "console") -> None:
+    """Configure structlog logging.
+
+    Repeated calls with the same arguments are no-ops, so hosts that invoke
+    the CLI in-process do not rebuild the configuration every time.
+
+    Args:
+        level: Log level (DEBUG, INFO, WARNING, ERROR).
+        log_format: Output format (json or console).
+
+    """
+    global _configured_logging  # noqa: PLW0603 - process-wide logging state
+
+    key = (level, log_format)
+    if _configured_logging == key:
+        return
+
+    logging.basicConfig(
+        level=_LOG_LEVELS[level.upper()],
+        format="%(message)s",
+    )
+
+    structlog.configure(
+        processors=[*_BASE_PROCESSORS, _RENDERERS.get(log_format, _RENDERERS["console"])],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    _configured_logging = key
+
+
+def list_projects(config: Path) -> None:
+    """List all accessible Redmine projects."""
+    app_config = AppConfig.from_yaml(config)
+    setup_logging(app_config.logging.level, app_config.logging.format)
+
+    client = RedmineClient(app_config.redmine)
+    projects = client.list_projects()
+
+    typer.echo(f"\n找到 {len(projects)} 個專案:\n")
+    for proj in projects:
+        typer.echo(f"  [{proj['identifier']}] {proj['name']}")
+        if proj.get("description"):
+            desc = (
+                proj["description"][:DESCRIPTION_TRUNCATE_LENGTH] + "..."
+                if len(proj["description"]) > DESCRIPTION_TRUNCATE_LENGTH
+                else proj["description"]
+            )
+            typer.echo(f"      {desc}")
+
+
+@dataclass
+class _ProducerError:
+    """Exception raised by a prefetch producer, forwarded to the consumer."""
+
+    error: Exception
+
+
+_END_OF_STREAM = object()
+
+
+def _prefetch(items: Iterable[T], maxsize: int = PREFETCH_QUEUE_SIZE) -> Iterator[T]:
+    """Iterate items produced by a background thread through a bounded queue.
+
+    This overlaps the producer (e.g. paginated Redmine API calls) with the
+    work done by the consumer on each item. Exceptions raised by the
+    producer are re-raised in the consumer. If the consumer stops early,
+    the producer stops at its next item.
+
+    Args:
+        items: Iterable to consume in the background.
+        maxsize: Maximum number of items buffered ahead of the consumer.
+
+    Yields:
+        Items from ``items`` in order.
+
+    """
+    queue: Queue[Any] = Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+            except Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except Exception as e:  # noqa: BLE001 - re-raised in the consumer
+            put(_ProducerError(e))
+        finally:
+            put(_END_OF_STREAM)
+
+    threading.Thread(target=produce, name=PREFETCH_THREAD_NAME, daemon=True).start()
+    try:
+        while True:
+            item = queue.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+@lru_cache(maxsize=8192)
+def _pad5(value: int) -> str:
+    """Zero-pad an issue ID to five digits (memoized)."""
+    return f"{value:05d}"
+
+
+def _list_filenames(directory: Path) -> set[str]:
+    """Return the names of entries in a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _download_and_process(
+    client: RedmineClient,
+    processor_factory: ProcessorFactory,
+    attachment: AttachmentInfo,
+    att_path: Path,
+    existing: set[str],
+    after: Future[ExtractedContent] | None = None,
+) -> ExtractedContent:
+    """Download an attachment if not already present, then extract its content.
+
+    ``after`` is the job of an earlier attachment with the same filename. It
+    is waited for first, so the file is never written by two threads at once
+    and a finished download is reused rather than fetched again.
+    """
+    if after is not None:
+        wait([after])
+    if attachment.filename not in existing:
+        client.download_attachment(attachment.content_url, att_path)
+        existing.add(attachment.filename)
+    return processor_factory.process_file(att_path, attachment.content_type)
+
+
+def _process_attachments(
+    client: RedmineClient,
+    processor_factory: ProcessorFactory,
+    attachments: list[AttachmentInfo],
+    att_dir: Path,
+    *,
+    dir_listings: dict[Path, set[str]],
+    executor: Executor,
+    failure_message: str,
+    **log_context: Any,
+) -> dict[int, ExtractedContent]:
+    """Download and process attachments concurrently.
+
+    Args:
+        client: Redmine client used for downloads.
+        processor_factory: Factory used to extract attachment content.
+        attachments: Attachments to process.
+        att_dir: Directory the attachments are stored in.
+        dir_listings: Known filenames per attachment directory for this run
+            (updated in place).
+        executor: Worker pool shared by all attachments in this run.
+        failure_message: Log message used when an attachment fails.
+        **log_context: Extra fields added to failure log entries.
+
+    Returns:
+        Dict mapping attachment ID to extracted content.
+
+    """
+    extracted_contents: dict[int, ExtractedContent] = {}
+
+    # List each directory once per run instead of probing every file
+    existing = dir_listings.get(att_dir)
+    if existing is None:
+        existing = _list_filenames(att_dir)
+        att_dir.mkdir(parents=True, exist_ok=True)
+        dir_listings[att_dir] = existing
+
+    futures: dict[Future[ExtractedContent], AttachmentInfo] = {}
+    # Latest job per filename; same-named attachments share one target path
+    by_filename: dict[str, Future[ExtractedContent]] = {}
+    for att in attachments:
+        future = executor.submit(
+            _download_and_process,
+            client,
+            processor_factory,
+            att,
+            att_dir / att.filename,
+            existing,
+            by_filename.get(att.filename),
+        )
+        by_filename[att.filename] = future
+        futures[future] = att
+
+    for future in as_completed(futures):
+        att = futures[future]
+        try:
+            extracted_contents[att.id] = future.result()
+        except (OSError, ValueError) as e:
+            logger.warning(
+                failure_message,
+                filename=att.filename,
+                error=str(e),
+                **log_context,
+            )
+
+    return extracted_contents
+
+
+def fetch(
+    config: Path,
+    mode: FetchMode,  # noqa: ARG001 - reserved for incremental mode (not yet implemented)
+    projects: str | None,
+    skip_attachments: bool,
+    skip_wiki: bool,
+) -> None:
+    """Fetch issues and wiki pages from Redmine and generate Markdown files."""
+    app_config = AppConfig.from_yaml(config)
+    setup_logging(app_config.logging.level, app_config.logging.format)
+
+    client = RedmineClient(
+        app_config.redmine,
+        cache_path=(
+            app_config.state.get_state_path()
+            if app_config.state.backend == "sqlite" and app_config.state.cache_responses
+            else None
+        ),
+        download_workers=app_config.processing.max_workers,
+    )
+    processor_factory = ProcessorFactory(app_config.processing)
+
+    # Filter outputs if specific projects requested
+    outputs_to_process = app_config.outputs
+    if projects:
+        project_set = frozenset(p.strip() for p in projects.split(","))
+        outputs_to_process = [
+            out for out in app_config.outputs if not project_set.isdisjoint(out.projects)
+        ]
+
+    total_issues = 0
+    total_wiki = 0
+    dir_listings: dict[Path, set[str]] = {}
+
+    # One bounded pool for all attachment downloads and processing in this run
+    with ThreadPoolExecutor(
+        max_workers=app_config.processing.max_workers,
+        thread_name_prefix=ATTACHMENT_THREAD_PREFIX,
+    ) as attachment_pool:
+        for output_config in outputs_to_process:
+            output_path = output_config.get_output_path()
+            generator = MarkdownGenerator(output_path)
+
+            for project_id in output_config.projects:
+                typer.echo(f"\n處理專案: {project_id}")
+
+                # Fetch issues
+                try:
+                    issue_count = 0
+                    for issue in _prefetch(
+                        client.get_project_issues(
+                            project_id,
+                            include_subprojects=output_config.include_subprojects,
+                        ),
+                    ):
+                        # Process attachments
+                        extracted_contents: dict[int, ExtractedContent] = {}
+
+                        if not skip_attachments and issue.attachments:
+                            extracted_contents = _process_attachments(
+                                client,
+                                processor_factory,
+                                issue.attachments,
+                                output_path
+                                / project_id
+                                / "issues"
+                                / "attachments"
+                                / _pad5(issue.id),
+                                dir_listings=dir_listings,
+                                executor=attachment_pool,
+                                failure_message="Failed to process attachment",
+                                issue_id=issue.id,
+                            )
+
+                        # Generate markdown
+                        generator.save_issue(issue, extracted_contents)
+                        issue_count += 1
+
+                        if issue_count % 10 == 0:
+                            typer.echo(f"  已處理 {issue_count} 個 issues...")
+
+                    total_issues += issue_count
+                    typer.echo(f"  完成: {issue_count} 個 issues")
+
+                except (OSError, RuntimeError) as e:
+                    logger.exception(
+                        "Failed to process project issues", project=project_id, error=str(e)
+                    )
+                    typer.echo(f"  ❌ 處理 issues 失敗: {e}", err=True)
+
+                # Fetch wiki pages
+                if not skip_wiki:
+                    try:
+                        wiki_count = 0
+                        for wiki_page in _prefetch(client.get_project_wiki_pages(project_id)):
+                            # Process attachments
+                            extracted_contents = {}
+
+                            if not skip_attachments and wiki_page.attachments:  # pragma: no branch
+                                extracted_contents = _process_attachments(
+                                    client,
+                                    processor_factory,
+                                    wiki_page.attachments,
+                                    output_path / project_id / "wiki" / "attachments",
+                                    dir_listings=dir_listings,
+                                    executor=attachment_pool,
+                                    failure_message="Failed to process wiki attachment",
+                                    page=wiki_page.title,
+                                )
+
+                            generator.save_wiki_page(wiki_page, extracted_contents)
+                            wiki_count += 1
+
+                        total_wiki += wiki_count
+                        typer.echo(f"  完成: {wiki_count} 個 wiki 頁面")
+
+                    except (OSError, RuntimeError) as e:
+                        logger.exception("Failed to process wiki", project=project_id, error=str(e))
+
+    typer.echo(f"\n✅ 完成! 共處理 {total_issues} 個 issues, {total_wiki} 個 wiki 頁面")
+
+
+def convert_textile(input_file: Path, output_file: Path | None) -> None:
+    """Convert a Textile file to Markdown."""
+    content = input_file.read_text(encoding="utf-8")
+    markdown = textile_to_markdown(content)
+
+    if output_file:
+        output_file.write_text(markdown, encoding="utf-8")
+        typer.echo(f"已轉換並儲存至: {output_file}")
+    else:
+        typer.echo(markdown)
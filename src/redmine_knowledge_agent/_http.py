@@ -0,0 +1,346 @@
+"""HTTP transport helpers for the Redmine session.
+
+Provides a requests transport adapter that revalidates repeated GETs with
+``If-None-Match`` / ``If-Modified-Since`` and serves ``304 Not Modified``
+responses from a SQLite cache in the state file, so unchanged resources are
+not re-downloaded on the next run. Also provides the retry policy used for
+rate-limited requests and a token bucket for client-side request pacing. When orjson is
+installed, responses built by the adapter decode JSON with it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+orjson: Any = None
+try:
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+HTTP_CACHE_MAX_ENTRIES = 10_000
+RETRY_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_BACKOFF_MAX = 30.0
+RETRY_BACKOFF_JITTER = 0.5
+RATE_LIMIT_MIN_FRACTION = 1 / 16
+RATE_LIMIT_RECOVERY_FRACTION = 1 / 20
+
+
+def rate_limit_retry(max_retries: int) -> Retry:
+    """Build the retry policy for rate-limited GET requests.
+
+    429 and 503 responses are retried after the delay given by
+    ``Retry-After`` (seconds or HTTP-date). Without that header, exponential
+    backoff with jitter is used. Connection errors are not retried. Once
+    retries are exhausted the last response is returned as-is, so callers
+    see the original status code.
+
+    Args:
+        max_retries: Maximum number of retries per request.
+
+    Returns:
+        urllib3 Retry configuration for ``HTTPAdapter(max_retries=...)``.
+
+    """
+    return Retry(
+        total=max_retries,
+        connect=0,
+        read=0,
+        status=max_retries,
+        allowed_methods=frozenset({"GET"}),
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_BACKOFF_MAX,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class TokenBucket:
+    """Thread-safe token bucket with multiplicative decrease on throttling.
+
+    Requests are paced at ``rate`` per second with bursts of up to
+    ``capacity``. When the server throttles anyway, :meth:`throttle` halves
+    the rate (down to 1/16 of the configured rate), and each successful
+    request restores 1/20 of the configured rate via :meth:`relax`.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize bucket.
+
+        Args:
+            rate: Sustained requests per second.
+            capacity: Burst size in requests (defaults to ``max(1, rate)``).
+
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            # Reserve the token now so concurrent callers queue up behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self) -> None:
+        """Halve the request rate after the server signalled throttling."""
+        with self._lock:
+            self.rate = max(self.max_rate * RATE_LIMIT_MIN_FRACTION, self.rate / 2)
+
+    def relax(self) -> None:
+        """Step the request rate back towards the configured maximum."""
+        with self._lock:
+            self.rate = min(
+                self.max_rate,
+                self.rate + self.max_rate * RATE_LIMIT_RECOVERY_FRACTION,
+            )
+
+
+def _was_throttled(response: Response) -> bool:
+    """Check whether a response, or any retry leading to it, was a 429."""
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    retries = getattr(response.raw, "retries", None)
+    history = getattr(retries, "history", ())
+    return any(entry.status == HTTPStatus.TOO_MANY_REQUESTS for entry in history)
+
+
+class _OrjsonResponse(Response):
+    """Response whose ``json()`` decodes the body with orjson."""
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the body as JSON, falling back to requests for edge cases."""
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return orjson.loads(self.content)
+        except orjson.JSONDecodeError:
+            # e.g. non-UTF-8 bodies, which requests decodes via its charset detection
+            return super().json()
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    """Validators and body of a previously received 200 response."""
+
+    etag: str | None
+    last_modified: str | None
+    content: bytes
+
+
+class ResponseCache:
+    """SQLite store of GET response bodies and their validators, keyed by URL.
+
+    Entries live in an ``http_cache`` table of the state file so that they
+    survive between runs. Bodies are zlib-compressed, and the least recently
+    used entries are evicted beyond ``max_entries``. The connection is shared
+    between threads behind a lock.
+    """
+
+    def __init__(self, path: Path, max_entries: int = HTTP_CACHE_MAX_ENTRIES) -> None:
+        """Open (and if needed create) the cache table.
+
+        Args:
+            path: SQLite state file.
+            max_entries: Maximum number of cached responses.
+
+        Raises:
+            sqlite3.Error: If the state file cannot be opened as a database.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "body BLOB NOT NULL, accessed REAL NOT NULL)",
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS http_cache_accessed ON http_cache (accessed)",
+        )
+
+    def get(self, key: str) -> _CachedResponse | None:
+        """Return the cached response for a key and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE http_cache SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        etag, last_modified, body = row
+        return _CachedResponse(etag, last_modified, zlib.decompress(body))
+
+    def put(self, key: str, entry: _CachedResponse) -> None:
+        """Store a response, evicting the least recently used ones."""
+        body = zlib.compress(entry.content)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.last_modified, body, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM http_cache WHERE key IN ("
+                "SELECT key FROM http_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+def _cache_key(request: PreparedRequest) -> str:
+    """Key a GET by URL and API key, since Redmine answers per user."""
+    api_key = request.headers.get("X-Redmine-API-Key", "")
+    user = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return f"{user} {request.url}"
+
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """Transport adapter that caches GET bodies and revalidates them.
+
+    With a :class:`ResponseCache`, responses carrying an ``ETag`` or
+    ``Last-Modified`` header are cached. Later GETs for the same URL, in this
+    or a later run, send the matching conditional headers, and a
+    ``304 Not Modified`` reply is turned back into a 200 response with the
+    cached body, so callers never see the 304. Streaming requests (attachment
+    downloads) bypass the cache.
+
+    When a rate limiter is given, every request takes a token first, and the
+    limiter is told about throttled and successful responses. Responses decode
+    JSON with orjson when it is installed.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize adapter.
+
+        Args:
+            cache: Optional persistent response cache; without it, requests
+                are sent unconditionally.
+            rate_limiter: Optional token bucket pacing outgoing requests.
+            **kwargs: Passed through to ``HTTPAdapter``.
+
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+    def send(  # type: ignore[override]
+        self,
+        request: PreparedRequest,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, pacing it and revalidating cached GETs."""
+        if self.rate_limiter is None:
+            return self._send_conditional(request, **kwargs)
+
+        self.rate_limiter.acquire()
+        response = self._send_conditional(request, **kwargs)
+        if _was_throttled(response):
+            self.rate_limiter.throttle()
+        elif response.ok:
+            self.rate_limiter.relax()
+        return response
+
+    def _send_conditional(
+        self,
+        request: PreparedRequest,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, adding conditional headers for cached GETs."""
+        if (
+            self.cache is None
+            or request.method != "GET"
+            or kwargs.get("stream")
+            or request.url is None
+        ):
+            return super().send(request, **kwargs)
+
+        key = _cache_key(request)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+            response.status_code = HTTPStatus.OK
+            response.reason = "OK"
+            response._content = cached.content  # noqa: SLF001 - no public setter for the body
+            return response
+
+        if response.status_code == HTTPStatus.OK:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.cache.put(key, _CachedResponse(etag, last_modified, response.content))
+
+        return response
+
+    def build_response(
+        self,
+        req: PreparedRequest,
+        resp: BaseHTTPResponse,
+    ) -> Response:
+        """Build the response, switching JSON decoding to orjson when available."""
+        response = super().build_response(req, resp)
+        if orjson is not None:
+            response.__class__ = _OrjsonResponse
+        return response
+
+    def close(self) -> None:
+        """Close pooled connections and the response cache."""
+        super().close()
+        if self.cache is not None:
+            self.cache.close()
@@ -5,20 +5,111 @@ Provides high-level interface for fetching Issues and Wiki pages.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from datetime import datetime
+import functools
+import itertools
+import shutil
+import sqlite3
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 import requests
 import structlog
 from redminelib import Redmine  # type: ignore[import-untyped]
+from requests.adapters import DEFAULT_POOLSIZE
 
+from . import __version__
+from ._http import ConditionalCacheAdapter, ResponseCache, TokenBucket, rate_limit_retry
 from .config import RedmineConfig
 from .models import IssueMetadata, WikiPageMetadata
 
 logger = structlog.get_logger(__name__)
 
+# Headers sent with every request; the API key is added per client by python-redmine
+BASE_HEADERS = MappingProxyType(
+    {
+        "User-Agent": f"redmine-knowledge-agent/{__version__}",
+        "Accept": "application/json",
+    },
+)
+
+# Attachment downloads: (connect, read) timeout in seconds and copy block size
+DOWNLOAD_TIMEOUT = (5, 60)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> Iterator[R]:
+    """Apply ``func`` to items on a thread pool, yielding results in input order.
+
+    At most ``2 * max_workers`` calls are in flight, so ``items`` is consumed
+    lazily and results stream out as they complete.
+
+    Args:
+        func: Function to apply to each item.
+        items: Items to process.
+        max_workers: Number of worker threads.
+
+    Yields:
+        Results of ``func`` in the same order as ``items``.
+
+    """
+    window = 2 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _redmine_timestamp(value: datetime) -> str:
+    """Format a datetime for Redmine's ``updated_on`` filter (UTC, ISO 8601).
+
+    Naive datetimes are taken to be UTC, matching python-redmine's parsing.
+
+    Args:
+        value: Datetime to format.
+
+    Returns:
+        Timestamp such as ``2024-01-15T08:30:00Z``.
+
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _has_journals(issue: Any) -> bool:
+    """Check whether an issue resource already holds its journals.
+
+    python-redmine refreshes included relations on attribute access, so
+    ``hasattr(issue, "journals")`` would itself issue a detail request. The
+    decoded payload is inspected instead; python-redmine pre-seeds every
+    include key there with None, so only a non-None value counts.
+
+    Args:
+        issue: Issue resource.
+
+    Returns:
+        True if the payload includes journals.
+
+    """
+    raw = getattr(issue, "raw", None)
+    return callable(raw) and raw().get("journals") is not None
+
 
 class RedmineClient:
     """Client for interacting with Redmine API."""
@@ -27,16 +118,24 @@ class RedmineClient:
         self,
         config: RedmineConfig,
         redmine_instance: Redmine | None = None,
+        cache_path: Path | None = None,
+        download_workers: int = 0,
     ) -> None:
         """Initialize the Redmine client.
 
         Args:
             config: Redmine configuration.
             redmine_instance: Optional pre-configured Redmine instance (for testing).
+            cache_path: Optional SQLite state file in which GET responses are
+                cached for revalidation on later runs.
+            download_workers: Number of threads that may call
+                ``download_attachment`` concurrently.
 
         """
         self.config = config
         self._redmine = redmine_instance
+        self.cache_path = cache_path
+        self.download_workers = download_workers
 
     @property
     def redmine(self) -> Redmine:
@@ -45,9 +144,42 @@ class RedmineClient:
             self._redmine = Redmine(
                 self.config.url,
                 key=self.config.api_key,
+                # python-redmine adds the API key to this dict, so pass a copy
+                requests={"headers": dict(BASE_HEADERS)},
+            )
+            # Revalidate GETs cached by earlier runs with ETag / Last-Modified,
+            # retry rate-limited GETs, pace requests if configured, and keep
+            # one reusable keep-alive connection per concurrent request: page
+            # fetches and detail fetches each run max_concurrent_requests at
+            # once, attachment downloads share the session, plus the caller
+            self._redmine.engine.session.mount(
+                f"{self.config.url}/",
+                ConditionalCacheAdapter(
+                    cache=self._open_cache(),
+                    pool_maxsize=max(
+                        DEFAULT_POOLSIZE,
+                        2 * self.config.max_concurrent_requests + self.download_workers + 1,
+                    ),
+                    max_retries=rate_limit_retry(self.config.max_retries),
+                    rate_limiter=(
+                        TokenBucket(self.config.requests_per_second)
+                        if self.config.requests_per_second
+                        else None
+                    ),
+                ),
             )
         return self._redmine
 
+    def _open_cache(self) -> ResponseCache | None:
+        """Open the response cache, or run without it if the file is unusable."""
+        if self.cache_path is None:
+            return None
+        try:
+            return ResponseCache(self.cache_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Response cache disabled", path=str(self.cache_path), error=str(e))
+            return None
+
     def list_projects(self) -> list[dict[str, Any]]:
         """List all accessible projects.
 
@@ -110,32 +242,36 @@ class RedmineClient:
             if include_subprojects:
                 params["subproject_id"] = "!*"  # Include all subprojects
 
-            # Fetch issues
-            issues = self.redmine.issue.filter(**params)
-
-            for issue in issues:  # pragma: no branch
-                # Check updated_after filter
-                if (
-                    updated_after
-                    and hasattr(issue, "updated_on")
-                    and issue.updated_on <= updated_after
-                ):  # pragma: no branch
-                    continue
-
-                try:
-                    # Refresh to get full details including journals
-                    full_issue = self.redmine.issue.get(
-                        issue.id,
-                        include=["attachments", "journals"],
-                    )
-                    yield IssueMetadata.from_redmine_issue(full_issue)
-                except (ConnectionError, TimeoutError, ValueError) as e:
-                    logger.warning(
-                        "Failed to fetch issue details",
-                        issue_id=issue.id,
-                        error=str(e),
-                    )
-                    continue
+            cutoff = _redmine_timestamp(updated_after) if updated_after else None
+            if cutoff:
+                # Let Redmine drop issues older than the cutoff
+                params["updated_on"] = f">={cutoff}"
+
+            listed = self._iter_issue_pages(params)
+            selected: Iterable[Any] = listed
+            if cutoff:
+                # Results are sorted newest first: stop at the first issue
+                # not after the cutoff (and stop requesting further pages).
+                # Compared as UTC timestamps, since python-redmine decodes
+                # them as naive datetimes.
+                selected = itertools.takewhile(
+                    lambda issue: (
+                        not (
+                            hasattr(issue, "updated_on")
+                            and _redmine_timestamp(issue.updated_on) <= cutoff
+                        )
+                    ),
+                    listed,
+                )
+
+            # Fill in missing details concurrently, preserving order
+            for metadata in _bounded_map(
+                self._resolve_issue,
+                selected,
+                self.config.max_concurrent_requests,
+            ):
+                if metadata is not None:
+                    yield metadata
 
         except (ConnectionError, TimeoutError, RuntimeError) as e:
             logger.exception(
@@ -145,6 +281,89 @@ class RedmineClient:
             )
             raise
 
+    def _fetch_issue_page(self, params: dict[str, Any], offset: int) -> list[Any]:
+        """Fetch one page of listed issues.
+
+        Args:
+            params: Issue filter parameters.
+            offset: Index of the first issue on the page.
+
+        Returns:
+            Issue resources on the page.
+
+        """
+        return list(
+            self.redmine.issue.filter(**params, limit=self.config.page_size, offset=offset),
+        )
+
+    def _iter_issue_pages(self, params: dict[str, Any]) -> Iterator[Any]:
+        """Yield listed issues page by page.
+
+        Once the first page reports ``total_count``, the remaining pages are
+        requested concurrently (bounded, in order); otherwise pages are
+        requested one at a time until a short page. Listing lazily lets
+        detail fetches overlap the list requests.
+
+        Args:
+            params: Issue filter parameters.
+
+        Yields:
+            Issue resources from the list endpoint.
+
+        """
+        page_size = self.config.page_size
+        first = self.redmine.issue.filter(**params, limit=page_size, offset=0)
+        page = list(first)
+        yield from page
+
+        total_count = getattr(first, "total_count", None)
+        if isinstance(total_count, int):
+            for page in _bounded_map(
+                functools.partial(self._fetch_issue_page, params),
+                range(page_size, total_count, page_size),
+                self.config.max_concurrent_requests,
+            ):
+                yield from page
+            return
+
+        # Total unknown: page sequentially until a short page
+        offset = 0
+        while len(page) == page_size:
+            offset += page_size
+            page = self._fetch_issue_page(params, offset)
+            yield from page
+
+    def _resolve_issue(self, issue: Any) -> IssueMetadata | None:
+        """Build metadata for a listed issue, fetching details only if needed.
+
+        The list response is used as-is when it already carries journals;
+        otherwise the issue is re-fetched with attachments and journals.
+        Fetch failures are logged and the issue is skipped.
+
+        Args:
+            issue: Issue resource from the list endpoint.
+
+        Returns:
+            IssueMetadata, or None if the issue could not be fetched.
+
+        """
+        if _has_journals(issue):
+            return IssueMetadata.from_redmine_issue(issue)
+
+        try:
+            full_issue = self.redmine.issue.get(
+                issue.id,
+                include=["attachments", "journals"],
+            )
+            return IssueMetadata.from_redmine_issue(full_issue)
+        except (ConnectionError, TimeoutError, ValueError) as e:
+            logger.warning(
+                "Failed to fetch issue details",
+                issue_id=issue.id,
+                error=str(e),
+            )
+            return None
+
     def get_issue(self, issue_id: int) -> IssueMetadata:
         """Fetch a single issue by ID.
 
@@ -256,17 +475,18 @@ class RedmineClient:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Use the API key for authentication
-            response = requests.get(
+            # Reuse the Redmine session's pooled keep-alive connections; the
+            # session already carries the API key header
+            with self.redmine.engine.session.get(
                 content_url,
-                headers={"X-Redmine-API-Key": self.config.api_key},
                 stream=True,
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            with output_path.open("wb") as f:
-                f.writelines(response.iter_content(chunk_size=8192))
+                timeout=DOWNLOAD_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any Content-Encoding, then copy in large blocks
+                response.raw.decode_content = True
+                with output_path.open("wb") as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
 
             logger.debug("Downloaded attachment", url=content_url, path=str(output_path))
 
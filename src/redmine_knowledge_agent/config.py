@@ -5,20 +5,104 @@ Supports YAML config with multiple output directories and per-project settings.
 
 from __future__ import annotations
 
+import copy
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# ``${VAR_NAME}`` references resolved from the environment
+_ENV_REF_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _env_ref(value: object) -> str | None:
+    """Return the variable name if ``value`` is a ``${VAR_NAME}`` reference."""
+    if isinstance(value, str):
+        match = _ENV_REF_RE.fullmatch(value)
+        if match:
+            return match.group(1)
+    return None
+
+
+# Longest image side (pixels) sent to OCR; larger images are downscaled
+OCR_MAX_DIMENSION = 2400
+
+# Parsed YAML cache: resolved path -> (mtime_ns, size, data)
+YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+
+
+def _load_yaml_cached(config_path: Path) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Entries are validated against the file's mtime and size. A deep copy is
+    returned so callers cannot mutate the cached data.
+
+    Args:
+        config_path: Resolved path to the YAML file.
+
+    Returns:
+        Parsed YAML data.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+
+    """
+    st = config_path.stat()
+    key = str(config_path)
+
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    with config_path.open(encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    if len(_YAML_CACHE) > YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
 
 class RedmineConfig(BaseModel):
     """Redmine server configuration."""
 
     url: str = Field(..., description="Redmine server URL")
     api_key: str = Field(..., description="API key for authentication")
+    max_concurrent_requests: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent API requests for detail fetches",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Retries for rate-limited (429/503) requests",
+    )
+    requests_per_second: float | None = Field(
+        default=None,
+        gt=0,
+        description="Client-side request rate limit (None for unlimited)",
+    )
+    page_size: int = Field(
+        default=100,
+        ge=1,
+        le=100,
+        description="Issues per list request (Redmine caps this at 100)",
+    )
 
     @field_validator("url")
     @classmethod
@@ -30,14 +114,32 @@ class RedmineConfig(BaseModel):
     @classmethod
     def resolve_env_var(cls, v: str) -> str:
         """Resolve environment variable references like ${VAR_NAME}."""
-        if isinstance(v, str) and v.startswith("${") and v.endswith("}"):
-            env_var = v[2:-1]
-            resolved = os.environ.get(env_var)
-            if not resolved:
-                msg = f"Environment variable {env_var} is not set"
-                raise ValueError(msg)
-            return resolved
-        return v
+        env_var = _env_ref(v)
+        if env_var is None:
+            return v
+        resolved = os.environ.get(env_var)
+        if not resolved:
+            msg = f"Environment variable {env_var} is not set"
+            raise ValueError(msg)
+        return resolved
+
+
+def _resolve_path(
+    path: str,
+    cached: tuple[str, str, Path] | None,
+) -> tuple[str, str, Path]:
+    """Resolve a configured path, reusing ``cached`` if it came from the same input.
+
+    Keying the cached result on the field value keeps it correct after the
+    field is reassigned or the model is copied with ``model_copy(update=...)``.
+    Relative paths are also keyed on the working directory they resolve
+    against, so a later ``os.chdir`` is honoured.
+    """
+    expanded = Path(path).expanduser()
+    cwd = "" if expanded.is_absolute() else str(Path.cwd())
+    if cached is not None and cached[0] == path and cached[1] == cwd:
+        return cached
+    return path, cwd, expanded.resolve()
 
 
 class OutputConfig(BaseModel):
@@ -50,9 +152,17 @@ class OutputConfig(BaseModel):
         description="Whether to include issues from subprojects",
     )
 
+    _resolved_path: tuple[str, str, Path] | None = PrivateAttr(default=None)
+
+    @property
+    def output_path(self) -> Path:
+        """Resolved output directory (cached until ``path`` changes)."""
+        self._resolved_path = _resolve_path(self.path, self._resolved_path)
+        return self._resolved_path[2]
+
     def get_output_path(self) -> Path:
         """Get the output path as a Path object."""
-        return Path(self.path).expanduser().resolve()
+        return self.output_path
 
 
 class MultimodalLLMConfig(BaseModel):
@@ -67,10 +177,8 @@ class MultimodalLLMConfig(BaseModel):
     @classmethod
     def resolve_env_var(cls, v: str | None) -> str | None:
         """Resolve environment variable references."""
-        if isinstance(v, str) and v.startswith("${") and v.endswith("}"):
-            env_var = v[2:-1]
-            return os.environ.get(env_var)
-        return v
+        env_var = _env_ref(v)
+        return v if env_var is None else os.environ.get(env_var)
 
 
 class ProcessingConfig(BaseModel):
@@ -79,6 +187,16 @@ class ProcessingConfig(BaseModel):
     textile_to_markdown: bool = Field(default=True)
     ocr_enabled: bool = Field(default=True)
     ocr_engine: Literal["pytesseract", "easyocr", "multimodal_llm"] = Field(default="pytesseract")
+    ocr_preprocess: bool = Field(
+        default=False,
+        description="Binarize images with an adaptive threshold before OCR",
+    )
+    max_ocr_dim: int = Field(
+        default=OCR_MAX_DIMENSION,
+        ge=0,
+        description="Downscale images whose longest side exceeds this before OCR (0 disables)",
+    )
+    max_workers: int = Field(default=8, ge=1, description="Worker threads for attachments")
     multimodal_llm: MultimodalLLMConfig = Field(default_factory=MultimodalLLMConfig)
 
 
@@ -94,10 +212,22 @@ class StateConfig(BaseModel):
 
     backend: Literal["sqlite", "json"] = Field(default="sqlite")
     path: str = Field(default="./.state.db")
+    cache_responses: bool = Field(
+        default=True,
+        description="Cache API responses in the sqlite state file for ETag revalidation",
+    )
+
+    _resolved_path: tuple[str, str, Path] | None = PrivateAttr(default=None)
+
+    @property
+    def state_path(self) -> Path:
+        """Resolved state file path (cached until ``path`` changes)."""
+        self._resolved_path = _resolve_path(self.path, self._resolved_path)
+        return self._resolved_path[2]
 
     def get_state_path(self) -> Path:
         """Get the state file path as a Path object."""
-        return Path(self.path).expanduser().resolve()
+        return self.state_path
 
 
 class AppConfig(BaseModel):
@@ -126,12 +256,11 @@ class AppConfig(BaseModel):
 
         """
         config_path = Path(path).expanduser().resolve()
-        if not config_path.exists():
+        try:
+            data = _load_yaml_cached(config_path)
+        except FileNotFoundError:
             msg = f"Configuration file not found: {config_path}"
-            raise FileNotFoundError(msg)
-
-        with config_path.open(encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            raise FileNotFoundError(msg) from None
 
         return cls.model_validate(data)
 
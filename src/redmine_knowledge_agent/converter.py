@@ -5,10 +5,297 @@ Converts Redmine Textile markup to Markdown format.
 
 from __future__ import annotations
 
+import functools
+import heapq
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from re import Match
 
+# Precompiled patterns
+# Any character or line prefix that can start a Textile construct
+_SIGIL_RE = re.compile(r'[*_+\-@!\[<|#"]|^h[1-6]\.|^bq\.', re.MULTILINE)
+_CODE_BLOCK_LANG_RE = re.compile(
+    r"<pre><code(?:\s+class=[\"']?(\w+)[\"']?)?>(.*?)</code></pre>",
+    re.DOTALL | re.IGNORECASE,
+)
+_PRE_BLOCK_RE = re.compile(r"<pre>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+_CODE_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+_SPAN_PLACEHOLDER_RE = re.compile(r"\x01(\d+)\x01")
+_ORDERED_LIST_RE = re.compile(r"^(#+)\s+(.+)$")
+_UNORDERED_LIST_RE = re.compile(r"^(\*+)\s+(.+)$")
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Markdown table separator rows for small column counts, indexed by count
+_TABLE_SEPARATORS = tuple("| " + " | ".join(["---"] * n) + " |" for n in range(11))
+
+
+def _table_separator(columns: int) -> str:
+    """Build a Markdown table separator row with the given number of columns."""
+    if columns < len(_TABLE_SEPARATORS):
+        return _TABLE_SEPARATORS[columns]
+    return "| " + " | ".join(["---"] * columns) + " |"
+
+
+# Markdown header prefix indexed by Textile header level
+_HEADER_PREFIXES = tuple("#" * level + " " for level in range(7))
+
+# Rules anchored to a whole line
+_BLOCK_RULES: tuple[tuple[str, str], ...] = (
+    ("header", r"^h(?P<header_level>[1-6])\.\s+(?P<header_text>.+)$"),
+    ("blockquote", r"^bq\.\s+(?P<blockquote_text>.+)$"),
+    ("horizontal_rule", r"^---+$"),
+)
+
+# Rules for inline spans. Where two rules can start at the same position,
+# the one listed first wins.
+_SPAN_RULES: tuple[tuple[str, str], ...] = (
+    ("image_alt", r"!(?P<image_alt_src>[^!\(\)]+)\((?P<image_alt_text>[^)]+)\)!"),
+    ("image", r"!(?P<image_src>[^!\s]+)!"),
+    ("external_link", r'"(?P<external_link_text>[^"]+)":(?P<external_link_url>\S+)'),
+    (
+        "wiki_link_text",
+        r"\[\[(?P<wiki_link_page>[^\]|]+)\|(?P<wiki_link_text_text>[^\]]+)\]\]",
+    ),
+    ("wiki_link", r"\[\[(?P<wiki_link_target>[^\]]+)\]\]"),
+    ("inline_code", r"@(?P<inline_code_text>[^@\n]+)@"),
+    ("underline", r"\+(?P<underline_text>[^+]+)\+"),
+)
+
+
+def _compile_rules(rules: tuple[tuple[str, str], ...]) -> re.Pattern[str]:
+    """Combine rules into one alternation with a named group per rule."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in rules),
+        re.MULTILINE,
+    )
+
+
+_MARKUP_RE = _compile_rules(_BLOCK_RULES + _SPAN_RULES)
+_SPAN_RE = _compile_rules(_SPAN_RULES)
+
+# Emphasis delimiters and their Markdown replacements.
+# These are scanned for without regexes, see _emphasis_spans().
+_EMPHASIS: dict[str, str] = {
+    "*": "**",  # *bold* -> **bold**
+    "_": "*",  # _italic_ -> *italic*
+    "-": "~~",  # -deleted- -> ~~deleted~~
+}
+
+
+def _emphasis_spans(text: str, delim: str) -> Iterator[tuple[int, int, str]]:
+    r"""Yield the span each ``delim`` opener would form, in linear time.
+
+    A span opens at a single (not doubled) delimiter followed by a
+    non-space character, and closes at the first later single delimiter on
+    the same line that follows a non-space character, preferring spans of at
+    least two characters. These are the rules of
+    ``(?<!X)X(?!X)(\S.*?\S|\S)X(?!X)``. A regex, though, rescans the rest
+    of the line for every opener without a closer. Here every closer is found
+    up front and a single cursor walks over them.
+
+    The closer chosen for an opener does not depend on earlier spans, so
+    spans may overlap; the caller decides which ones to keep.
+
+    Args:
+        text: Text to scan.
+        delim: Single-character Textile delimiter.
+
+    Yields:
+        ``(start, end, delim)`` with the delimiter positions, by start.
+
+    """
+    size = len(text)
+    positions: list[int] = []
+    index = text.find(delim)
+    while index != -1:
+        positions.append(index)
+        index = text.find(delim, index + 1)
+
+    def is_delim(index: int) -> bool:
+        return 0 <= index < size and text[index] == delim
+
+    closers = [k for k in positions if k > 0 and not text[k - 1].isspace() and not is_delim(k + 1)]
+
+    cursor = 0
+    line_end = -1
+    for start in positions:
+        if is_delim(start - 1) or is_delim(start + 1):
+            continue
+        if start + 1 >= size or text[start + 1].isspace():
+            continue
+        if start > line_end:
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = size
+        # Like the regex, prefer the nearest closer after at least two
+        # characters, then fall back to a single-character span
+        while cursor < len(closers) and closers[cursor] < start + 3:
+            cursor += 1
+        if cursor < len(closers) and closers[cursor] < line_end:
+            yield start, closers[cursor], delim
+        elif is_delim(start + 2) and not is_delim(start + 3):
+            yield start, start + 2, delim
+
+
+def _convert_code_blocks(text: str, code_blocks: list[str]) -> str:
+    """Convert Textile code blocks to Markdown and set them aside.
+
+    <pre><code class="python">
+    code
+    </code></pre>
+
+    ->
+
+    ```python
+    code
+    ```
+
+    Also handles:
+    <pre>
+    code
+    </pre>
+
+    Each converted block is appended to ``code_blocks`` and replaced in
+    the text by a NUL-delimited placeholder holding its index.
+    """
+    if "<" not in text:
+        return text
+
+    def stash(block: str) -> str:
+        code_blocks.append(block)
+        return f"\x00{len(code_blocks) - 1}\x00"
+
+    # Code blocks with language
+    def replace_with_lang(match: Match[str]) -> str:
+        lang = match.group(1) or ""
+        code = match.group(2)
+        return stash(f"```{lang}\n{code.strip()}\n```")
+
+    text = _CODE_BLOCK_LANG_RE.sub(replace_with_lang, text)
+
+    # Plain pre blocks
+    return _PRE_BLOCK_RE.sub(lambda m: stash(f"```\n{m.group(1)}\n```"), text)
+
+
+def _convert_line_oriented(text: str) -> str:
+    """Convert Textile tables and lists to Markdown in one pass over the lines.
+
+    Tables:
+
+    |_.header|_.header|
+    |cell|cell|
+
+    ->
+
+    | header | header |
+    | --- | --- |
+    | cell | cell |
+
+    Ordered lists:
+
+    # item -> 1. item
+    ## nested -> (indented) 1. nested
+
+    Unordered lists:
+
+    * item -> - item
+    ** nested -> - nested (with indentation)
+
+    Note: This runs BEFORE headers are converted, so Textile ordered lists
+    (# item) are processed here. Textile headers use h1., h2., etc.
+    """
+    # Tables and lists all start with one of these characters
+    if "|" not in text and "#" not in text and "*" not in text:
+        return text
+
+    result: list[str] = []
+    in_table = False
+    header_added = False
+
+    for line in text.split("\n"):
+        if line.startswith("|"):
+            # Process table row
+            cells = [c.strip() for c in line.strip("|").split("|")]
+
+            # Check if header row (starts with _.)
+            is_header = any(c.startswith("_.") for c in cells)
+
+            if is_header:
+                # Remove _. prefix
+                cells = [c[2:].strip() if c.startswith("_.") else c for c in cells]
+                result.append("| " + " | ".join(cells) + " |")
+                result.append(_table_separator(len(cells)))
+                header_added = True
+            else:
+                if not in_table and not header_added:
+                    # Add a dummy header if table starts without headers
+                    result.append(_table_separator(len(cells)))
+                    result.append(_table_separator(len(cells)))
+                result.append("| " + " | ".join(cells) + " |")
+
+            in_table = True
+            continue
+
+        in_table = False
+        header_added = False
+
+        # Match Textile ordered list: # item, ## nested item, etc.
+        match = _ORDERED_LIST_RE.match(line)
+        if match:
+            indent = "  " * (len(match.group(1)) - 1)
+            result.append(f"{indent}1. {match.group(2)}")
+            continue
+
+        match = _UNORDERED_LIST_RE.match(line)
+        if match:
+            indent = "  " * (len(match.group(1)) - 1)
+            result.append(f"{indent}- {match.group(2)}")
+            continue
+
+        result.append(line)
+
+    return "\n".join(result)
+
+
+def _convert_emphasis(text: str) -> str:
+    """Convert Textile bold, italic and strikethrough to Markdown.
+
+    *bold* -> **bold**
+    _italic_ -> *italic*
+    -deleted- -> ~~deleted~~
+
+    As with one alternation of the three patterns, the leftmost span wins
+    and emphasis inside it is converted recursively, so mixed delimiters
+    nest (``*a _b_*``) rather than interleave.
+    """
+    delims = [delim for delim in _EMPHASIS if delim in text]
+    if not delims:
+        return text
+
+    parts: list[str] = []
+    last = 0
+    for start, end, delim in heapq.merge(*(_emphasis_spans(text, delim) for delim in delims)):
+        if start < last:
+            continue
+        markdown = _EMPHASIS[delim]
+        parts.extend(
+            (text[last:start], markdown, _convert_emphasis(text[start + 1 : end]), markdown),
+        )
+        last = end + 1
+
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _cleanup(text: str) -> str:
+    """Clean up extra whitespace and formatting issues."""
+    if "\n\n\n" not in text:
+        return text
+    # Remove excessive blank lines
+    return _EXCESS_BLANK_LINES_RE.sub("\n\n", text)
+
 
 class TextileConverter:
     """Converts Textile markup to Markdown.
@@ -31,10 +318,27 @@ class TextileConverter:
 
         """
         self.attachment_path_prefix = attachment_path_prefix
+        self._replacements: dict[str, Callable[[Match[str]], str]] = {
+            "header": self._replace_header,
+            "blockquote": self._replace_blockquote,
+            "horizontal_rule": self._replace_horizontal_rule,
+            "image_alt": self._replace_image_alt,
+            "image": self._replace_image,
+            "external_link": self._replace_external_link,
+            "wiki_link_text": self._replace_wiki_link_text,
+            "wiki_link": self._replace_wiki_link,
+            "inline_code": self._replace_inline_code,
+            "underline": self._replace_underline,
+        }
 
     def convert(self, textile: str | None) -> str:
         """Convert Textile markup to Markdown.
 
+        Code blocks are converted first and set aside behind placeholders so
+        their content is left untouched. Line-oriented constructs (tables and
+        lists) are converted next, then all remaining markup is rewritten in a
+        single pass over the text.
+
         Args:
             textile: Textile formatted text.
 
@@ -45,313 +349,148 @@ class TextileConverter:
         if not textile:
             return ""
 
-        text = textile
+        # Fast path for plain prose without any markup
+        if not _SIGIL_RE.search(textile):
+            return _cleanup(textile).strip()
+
+        # NUL and SOH delimit code block and span placeholders; drop any
+        # already in the input so that it cannot be mistaken for (or break)
+        # a placeholder
+        if "\x00" in textile or "\x01" in textile:
+            textile = textile.replace("\x00", "").replace("\x01", "")
+
+        code_blocks: list[str] = []
+        text = _convert_code_blocks(textile, code_blocks)
 
-        # Apply conversions in order
         # NOTE: Order matters!
         # - Tables must be BEFORE italic (_.header uses underscore)
         # - Ordered lists must be BEFORE headers (both use #, but Textile headers use h1.)
-        # - Code blocks should be first to protect code content
-        conversions: list[Callable[[str], str]] = [
-            self._convert_code_blocks,
-            self._convert_tables,  # BEFORE italic - _.header uses underscore
-            self._convert_ordered_lists,  # BEFORE headers - converts # list items
-            self._convert_headers,  # Converts h1., h2., etc.
-            self._convert_bold,
-            self._convert_italic,
-            self._convert_underline,
-            self._convert_strikethrough,
-            self._convert_inline_code,
-            self._convert_links,
-            self._convert_images,
-            self._convert_unordered_lists,
-            self._convert_blockquotes,
-            self._convert_horizontal_rules,
-            self._cleanup,
-        ]
-
-        for conversion in conversions:
-            text = conversion(text)
+        text = _convert_line_oriented(text)
+        text = self._convert_markup(text, _MARKUP_RE)
+        text = _cleanup(text)
+        if code_blocks:
+            text = _CODE_PLACEHOLDER_RE.sub(lambda m: code_blocks[int(m.group(1))], text)
 
         return text.strip()
 
-    def _convert_headers(self, text: str) -> str:
+    def _replace(self, match: Match[str]) -> str:
+        """Dispatch a markup match to the replacement for its rule."""
+        return self._replacements[str(match.lastgroup)](match)
+
+    def _convert_markup(self, text: str, pattern: re.Pattern[str]) -> str:
+        """Rewrite markup matched by ``pattern``, then emphasis over the whole text.
+
+        Converted constructs are set aside behind SOH-delimited placeholders
+        while emphasis is converted, so their output (URLs, code) is left
+        untouched but emphasis can still span them. Those constructs convert
+        emphasis inside their own text.
+        """
+        converted: list[str] = []
+
+        def stash(match: Match[str]) -> str:
+            converted.append(self._replace(match))
+            return f"\x01{len(converted) - 1}\x01"
+
+        text = _convert_emphasis(pattern.sub(stash, text))
+        if not converted:
+            return text
+        return _SPAN_PLACEHOLDER_RE.sub(lambda m: converted[int(m.group(1))], text)
+
+    def _convert_spans(self, text: str) -> str:
+        """Convert inline markup nested inside another construct."""
+        return self._convert_markup(text, _SPAN_RE)
+
+    def _replace_header(self, match: Match[str]) -> str:
         """Convert Textile headers to Markdown.
 
         h1. Title -> # Title
         h2. Title -> ## Title
-
-        Note: This must run before _convert_ordered_lists to avoid conflicts.
         """
-        for level in range(1, 7):
-            pattern = rf"^h{level}\.\s+(.+)$"
-            replacement = "#" * level + r" \1"
-            text = re.sub(pattern, replacement, text, flags=re.MULTILINE)
-        return text
+        prefix = _HEADER_PREFIXES[int(match.group("header_level"))]
+        return prefix + self._convert_spans(match.group("header_text"))
 
-    def _convert_bold(self, text: str) -> str:
-        """Convert Textile bold to Markdown.
+    def _replace_blockquote(self, match: Match[str]) -> str:
+        """Convert Textile blockquotes to Markdown.
 
-        *bold* -> **bold**
+        bq. quote -> > quote
         """
-        # Textile uses single asterisks for bold, Markdown uses double
-        # Be careful not to match list items
-        return re.sub(r"(?<!\*)\*(?!\*)(\S.*?\S|\S)\*(?!\*)", r"**\1**", text)
+        return "> " + self._convert_spans(match.group("blockquote_text"))
 
-    def _convert_italic(self, text: str) -> str:
-        """Convert Textile italic to Markdown.
+    def _replace_horizontal_rule(self, match: Match[str]) -> str:  # noqa: ARG002
+        """Convert Textile horizontal rules to Markdown.
 
-        _italic_ -> *italic*
+        --- -> ---
         """
-        return re.sub(r"(?<!_)_(?!_)(\S.*?\S|\S)_(?!_)", r"*\1*", text)
+        # Textile uses ---, Markdown also uses ---
+        return "---"
 
-    def _convert_underline(self, text: str) -> str:
+    def _replace_underline(self, match: Match[str]) -> str:
         """Convert Textile underline to Markdown (using HTML).
 
         +underline+ -> <u>underline</u>
         """
-        return re.sub(r"\+([^+]+)\+", r"<u>\1</u>", text)
+        return f"<u>{self._convert_spans(match.group('underline_text'))}</u>"
 
-    def _convert_strikethrough(self, text: str) -> str:
-        """Convert Textile strikethrough to Markdown.
-
-        -deleted- -> ~~deleted~~
-        """
-        # Avoid matching horizontal rules and list items
-        return re.sub(r"(?<!-)-(?!-)(\S.*?\S|\S)-(?!-)", r"~~\1~~", text)
-
-    def _convert_inline_code(self, text: str) -> str:
+    def _replace_inline_code(self, match: Match[str]) -> str:
         """Convert Textile inline code to Markdown.
 
         @code@ -> `code`
         """
-        return re.sub(r"@([^@\n]+)@", r"`\1`", text)
-
-    def _convert_code_blocks(self, text: str) -> str:
-        """Convert Textile code blocks to Markdown.
-
-        <pre><code class="python">
-        code
-        </code></pre>
-
-        ->
+        return f"`{match.group('inline_code_text')}`"
 
-        ```python
-        code
-        ```
-
-        Also handles:
-        <pre>
-        code
-        </pre>
-        """
-
-        # Code blocks with language
-        def replace_with_lang(match: Match[str]) -> str:
-            lang = match.group(1) or ""
-            code = match.group(2)
-            return f"```{lang}\n{code.strip()}\n```"
-
-        text = re.sub(
-            r"<pre><code(?:\s+class=[\"']?(\w+)[\"']?)?>(.*?)</code></pre>",
-            replace_with_lang,
-            text,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-
-        # Plain pre blocks
-        return re.sub(
-            r"<pre>(.*?)</pre>",
-            r"```\n\1\n```",
-            text,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-
-    def _convert_links(self, text: str) -> str:
+    def _replace_external_link(self, match: Match[str]) -> str:
         """Convert Textile links to Markdown.
 
         "link text":http://example.com -> [link text](http://example.com)
-        [[wiki_page]] -> [wiki_page](wiki_page)
-        [[wiki_page|display text]] -> [display text](wiki_page)
-        """
-        # External links: "text":url
-        text = re.sub(
-            r'"([^"]+)":(\S+)',
-            r"[\1](\2)",
-            text,
-        )
-
-        # Wiki links with display text: [[page|text]]
-        text = re.sub(
-            r"\[\[([^\]|]+)\|([^\]]+)\]\]",
-            r"[\2](\1)",
-            text,
-        )
-
-        # Wiki links: [[page]]
-        return re.sub(
-            r"\[\[([^\]]+)\]\]",
-            r"[\1](\1)",
-            text,
-        )
-
-    def _convert_images(self, text: str) -> str:
-        """Convert Textile images to Markdown.
-
-        !image.png! -> ![image.png](./attachments/image.png)
-        !image.png(alt text)! -> ![alt text](./attachments/image.png)
-        !http://example.com/image.png! -> ![image](http://example.com/image.png)
         """
+        text = self._convert_spans(match.group("external_link_text"))
+        return f"[{text}]({match.group('external_link_url')})"
 
-        def replace_image_with_alt(match: Match[str]) -> str:
-            src = match.group(1)
-            alt = match.group(2)
-
-            # Check if it's a URL
-            if src.startswith(("http://", "https://")):
-                return f"![{alt}]({src})"
-
-            # Local attachment
-            return f"![{alt}]({self.attachment_path_prefix}/{src})"
-
-        def replace_image_simple(match: Match[str]) -> str:
-            src = match.group(1)
+    def _replace_wiki_link_text(self, match: Match[str]) -> str:
+        """Convert Textile wiki links with display text to Markdown.
 
-            # Check if it's a URL
-            if src.startswith(("http://", "https://")):
-                return f"![image]({src})"
-
-            # Local attachment
-            return f"![{src}]({self.attachment_path_prefix}/{src})"
-
-        # Image with alt text: !image.png(alt)!
-        text = re.sub(
-            r"!([^!\(\)]+)\(([^)]+)\)!",
-            replace_image_with_alt,
-            text,
-        )
-
-        # Image without alt text: !image.png!
-        return re.sub(
-            r"!([^!\s]+)!",
-            replace_image_simple,
-            text,
-        )
-
-    def _convert_unordered_lists(self, text: str) -> str:
-        """Convert Textile unordered lists to Markdown.
-
-        * item -> - item
-        ** nested -> - nested (with indentation)
+        [[wiki_page|display text]] -> [display text](wiki_page)
         """
-        lines = text.split("\n")
-        result: list[str] = []
-
-        for line in lines:
-            match = re.match(r"^(\*+)\s+(.+)$", line)
-            if match:
-                level = len(match.group(1))
-                content = match.group(2)
-                indent = "  " * (level - 1)
-                result.append(f"{indent}- {content}")
-            else:
-                result.append(line)
-
-        return "\n".join(result)
+        text = self._convert_spans(match.group("wiki_link_text_text"))
+        return f"[{text}]({match.group('wiki_link_page')})"
 
-    def _convert_ordered_lists(self, text: str) -> str:
-        """Convert Textile ordered lists to Markdown.
+    def _replace_wiki_link(self, match: Match[str]) -> str:
+        """Convert Textile wiki links to Markdown.
 
-        # item -> 1. item
-        ## nested -> (indented) 1. nested
-
-        Note: This runs BEFORE headers are converted, so Textile ordered lists
-        (# item) are processed here. Textile headers use h1., h2., etc.
+        [[wiki_page]] -> [wiki_page](wiki_page)
         """
-        lines = text.split("\n")
-        result: list[str] = []
-
-        for line in lines:
-            # Match Textile ordered list: # item, ## nested item, etc.
-            match = re.match(r"^(#+)\s+(.+)$", line)
-            if match:
-                hashes = match.group(1)
-                content = match.group(2)
-                level = len(hashes)
-                indent = "  " * (level - 1)
-                result.append(f"{indent}1. {content}")
-            else:
-                result.append(line)
-
-        return "\n".join(result)
+        target = match.group("wiki_link_target")
+        return f"[{target}]({target})"
 
-    def _convert_blockquotes(self, text: str) -> str:
-        """Convert Textile blockquotes to Markdown.
+    def _replace_image_alt(self, match: Match[str]) -> str:
+        """Convert Textile images with alt text to Markdown.
 
-        bq. quote -> > quote
+        !image.png(alt text)! -> ![alt text](./attachments/image.png)
         """
-        return re.sub(r"^bq\.\s+(.+)$", r"> \1", text, flags=re.MULTILINE)
+        src = match.group("image_alt_src")
+        alt = match.group("image_alt_text")
 
-    def _convert_tables(self, text: str) -> str:
-        """Convert Textile tables to Markdown.
+        # Check if it's a URL
+        if src.startswith(("http://", "https://")):
+            return f"![{alt}]({src})"
 
-        |_.header|_.header|
-        |cell|cell|
+        # Local attachment
+        return f"![{alt}]({self.attachment_path_prefix}/{src})"
 
-        ->
+    def _replace_image(self, match: Match[str]) -> str:
+        """Convert Textile images to Markdown.
 
-        | header | header |
-        | --- | --- |
-        | cell | cell |
+        !image.png! -> ![image.png](./attachments/image.png)
+        !http://example.com/image.png! -> ![image](http://example.com/image.png)
         """
-        lines = text.split("\n")
-        result: list[str] = []
-        in_table = False
-        header_added = False
-
-        for line in lines:
-            if re.match(r"^\|", line):
-                # Process table row
-                cells = re.split(r"\|", line.strip("|"))
-                cells = [c.strip() for c in cells]
-
-                # Check if header row (starts with _.)
-                is_header = any(c.startswith("_.") for c in cells)
-
-                if is_header:
-                    # Remove _. prefix
-                    cells = [c[2:].strip() if c.startswith("_.") else c for c in cells]
-                    result.append("| " + " | ".join(cells) + " |")
-                    result.append("| " + " | ".join(["---"] * len(cells)) + " |")
-                    header_added = True
-                else:
-                    if not in_table and not header_added:
-                        # Add a dummy header if table starts without headers
-                        result.append("| " + " | ".join(["---"] * len(cells)) + " |")
-                        result.append("| " + " | ".join(["---"] * len(cells)) + " |")
-                    result.append("| " + " | ".join(cells) + " |")
-
-                in_table = True
-            else:
-                in_table = False
-                header_added = False
-                result.append(line)
+        src = match.group("image_src")
 
-        return "\n".join(result)
+        # Check if it's a URL
+        if src.startswith(("http://", "https://")):
+            return f"![image]({src})"
 
-    def _convert_horizontal_rules(self, text: str) -> str:
-        """Convert Textile horizontal rules to Markdown.
-
-        --- -> ---
-        """
-        # Textile uses ---, Markdown also uses ---
-        # Just ensure it's on its own line
-        return re.sub(r"^---+$", "---", text, flags=re.MULTILINE)
-
-    def _cleanup(self, text: str) -> str:
-        """Clean up extra whitespace and formatting issues."""
-        # Remove excessive blank lines
-        return re.sub(r"\n{3,}", "\n\n", text)
+        # Local attachment
+        return f"![{src}]({self.attachment_path_prefix}/{src})"
 
 
 def textile_to_markdown(
@@ -370,5 +509,10 @@ def textile_to_markdown(
         Markdown formatted text.
 
     """
-    converter = TextileConverter(attachment_path_prefix)
-    return converter.convert(textile)
+    return _shared_converter(attachment_path_prefix).convert(textile)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_converter(attachment_path_prefix: str) -> TextileConverter:
+    """Return a reusable converter; converters hold no per-call state."""
+    return TextileConverter(attachment_path_prefix)
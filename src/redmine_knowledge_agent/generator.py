@@ -5,19 +5,57 @@ Generates structured Markdown files from Redmine data.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import io
+import json
+import math
+import re
+from typing import TYPE_CHECKING, Any, TextIO
 
 import yaml
 
 from .converter import TextileConverter
 
+# Prefer the libyaml-backed dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
 # Maximum length for extracted text content in output (for readability)
 EXTRACTED_TEXT_MAX_LENGTH = 2000
 
+BYTES_PER_KB = 1024
+
+# Buffer size for writing Markdown files
+OUTPUT_WRITE_BUFFER_SIZE = 1 << 16
+
+# Section labels for extracted attachment content, by processing method
+_METHOD_LABELS = {
+    "ocr": "OCR 提取",
+    "text_extract": "文字提取",
+    "llm": "AI 分析",
+    "fallback": "基本資訊",
+}
+
+# Converted journal notes kept for reuse (boilerplate notes repeat a lot)
+NOTES_CACHE_MAX_ENTRIES = 2048
+
+# Characters that are not allowed in filenames, all mapped to "_"
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('/\\:*?"<>|', "_"))
+
+# Strings YAML reads back unchanged without quoting, including the
+# ``_format_datetime`` output (no seconds, so it is not a YAML timestamp)
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][\w .\-/]*(?<! )|\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+_YAML_RESERVED_WORDS = frozenset({"true", "false", "yes", "no", "on", "off", "null"})
+# Characters JSON leaves unescaped that YAML rejects or folds in quoted scalars
+_YAML_UNSAFE_CHARS_RE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]")
+_DECIMAL_RE = re.compile(r"-?\d+\.\d+")
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from datetime import datetime
     from pathlib import Path
-    from typing import Any
 
     from .models import (
         AttachmentInfo,
@@ -28,6 +66,47 @@ if TYPE_CHECKING:
     )
 
 
+def _yaml_scalar(value: Any) -> str | None:
+    """Format a front matter value as a YAML scalar.
+
+    Args:
+        value: Value to format.
+
+    Returns:
+        YAML text for ints, plain decimals and strings, or None when the value
+        needs the full YAML dumper.
+
+    """
+    if isinstance(value, str):
+        if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+            return value
+        # A JSON string is a valid YAML double-quoted scalar
+        quoted = json.dumps(value, ensure_ascii=False)
+        return _YAML_UNSAFE_CHARS_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        text = repr(value)
+        if _DECIMAL_RE.fullmatch(text):
+            return text
+    return None
+
+
+def _format_kb(size: int) -> str:
+    """Format a byte count as kilobytes with one decimal, using integer math.
+
+    Rounds half to even like ``f"{size / 1024:.1f}"``, without going through
+    a float.
+    """
+    tenths, remainder = divmod(size * 10, BYTES_PER_KB)
+    half = BYTES_PER_KB // 2
+    if remainder > half or (remainder == half and tenths % 2):
+        tenths += 1
+    return f"{tenths // 10}.{tenths % 10}"
+
+
 class MarkdownGenerator:
     """Generates Markdown files from Redmine data."""
 
@@ -46,6 +125,9 @@ class MarkdownGenerator:
         self.output_dir = output_dir
         self.attachment_path_prefix = attachment_path_prefix
         self.converter = TextileConverter(attachment_path_prefix)
+        self._convert_notes = functools.lru_cache(maxsize=NOTES_CACHE_MAX_ENTRIES)(
+            self.converter.convert,
+        )
 
     def generate_issue_markdown(
         self,
@@ -62,42 +144,54 @@ class MarkdownGenerator:
             Markdown formatted string.
 
         """
-        extracted_contents = extracted_contents or {}
+        buffer = io.StringIO()
+        self._write_issue_markdown(buffer, issue, extracted_contents)
+        return buffer.getvalue()
 
-        # Build front matter
-        front_matter = self._build_issue_front_matter(issue)
-
-        # Build content sections
-        sections: list[str] = []
+    def _write_issue_markdown(
+        self,
+        fp: TextIO,
+        issue: IssueMetadata,
+        extracted_contents: dict[int, ExtractedContent] | None,
+    ) -> None:
+        """Write issue Markdown to a text stream."""
+        self._write_document(
+            fp,
+            self._build_issue_front_matter(issue),
+            self._iter_issue_sections(issue, extracted_contents or {}),
+        )
+
+    def _iter_issue_sections(
+        self,
+        issue: IssueMetadata,
+        extracted_contents: dict[int, ExtractedContent],
+    ) -> Iterator[str]:
+        """Yield the content sections of an issue document.
 
+        Attachment sections are yielded line by line. The document writer
+        joins everything with newlines, so the output is the same as for
+        whole sections.
+        """
         # Title
-        sections.append(f"# Issue #{issue.id}: {issue.subject}\n")
+        yield f"# Issue #{issue.id}: {issue.subject}\n"
 
         # Description
         if issue.description_textile:
-            sections.append("## 描述\n")
+            yield "## 描述\n"
             md_description = self.converter.convert(issue.description_textile)
-            sections.append(md_description + "\n")
+            yield md_description + "\n"
 
         # Attachments
         if issue.attachments:
-            sections.append("## 附件分析\n")
+            yield "## 附件分析\n"
             for att in issue.attachments:
-                att_section = self._build_attachment_section(
-                    att,
-                    extracted_contents.get(att.id),
-                )
-                sections.append(att_section)
+                yield from self._iter_attachment_lines(att, extracted_contents.get(att.id))
 
         # Build journals section (comments/changes)
         if issue.journals:
             journal_section = self._build_journals_section(issue.journals)
             if journal_section:  # pragma: no branch
-                sections.append(journal_section)
-
-        # Combine all parts
-        content = front_matter + "\n" + "\n".join(sections)
-        return content.strip() + "\n"
+                yield journal_section
 
     def generate_wiki_markdown(
         self,
@@ -114,35 +208,68 @@ class MarkdownGenerator:
             Markdown formatted string.
 
         """
-        extracted_contents = extracted_contents or {}
-
-        # Build front matter
-        front_matter = self._build_wiki_front_matter(wiki_page)
-
-        # Build content sections
-        sections: list[str] = []
+        buffer = io.StringIO()
+        self._write_wiki_markdown(buffer, wiki_page, extracted_contents)
+        return buffer.getvalue()
 
+    def _write_wiki_markdown(
+        self,
+        fp: TextIO,
+        wiki_page: WikiPageMetadata,
+        extracted_contents: dict[int, ExtractedContent] | None,
+    ) -> None:
+        """Write wiki page Markdown to a text stream."""
+        self._write_document(
+            fp,
+            self._build_wiki_front_matter(wiki_page),
+            self._iter_wiki_sections(wiki_page, extracted_contents or {}),
+        )
+
+    def _iter_wiki_sections(
+        self,
+        wiki_page: WikiPageMetadata,
+        extracted_contents: dict[int, ExtractedContent],
+    ) -> Iterator[str]:
+        """Yield the content sections of a wiki page document."""
         # Title
-        sections.append(f"# {wiki_page.title}\n")
+        yield f"# {wiki_page.title}\n"
 
         # Content
         if wiki_page.text_textile:
             md_content = self.converter.convert(wiki_page.text_textile)
-            sections.append(md_content + "\n")
+            yield md_content + "\n"
 
         # Attachments
         if wiki_page.attachments:
-            sections.append("## 附件\n")
+            yield "## 附件\n"
             for att in wiki_page.attachments:
-                att_section = self._build_attachment_section(
-                    att,
-                    extracted_contents.get(att.id),
-                )
-                sections.append(att_section)
+                yield from self._iter_attachment_lines(att, extracted_contents.get(att.id))
 
-        # Combine all parts
-        content = front_matter + "\n" + "\n".join(sections)
-        return content.strip() + "\n"
+    def _write_document(
+        self,
+        fp: TextIO,
+        front_matter: str,
+        sections: Iterable[str],
+    ) -> None:
+        """Write front matter and sections one at a time.
+
+        Sections are separated by a blank line and the document ends with a
+        single newline. Trailing whitespace of a section is held back until
+        more content follows, so nothing trails the last section.
+        """
+        fp.write(front_matter)
+        pending = "\n"
+        for index, section in enumerate(sections):
+            if index:
+                pending += "\n"
+            body = section.rstrip()
+            if body:
+                fp.write(pending)
+                fp.write(body)
+                pending = section[len(body) :]
+            else:
+                pending += section
+        fp.write("\n")
 
     def _build_issue_front_matter(self, issue: IssueMetadata) -> str:
         """Build YAML front matter for an issue."""
@@ -175,7 +302,7 @@ class MarkdownGenerator:
         if issue.custom_fields:
             data["custom_fields"] = issue.custom_fields
 
-        return "---\n" + str(yaml.dump(data, allow_unicode=True, sort_keys=False)) + "---\n"
+        return "---\n" + self._dump_yaml(data) + "---\n"
 
     def _build_wiki_front_matter(self, wiki_page: WikiPageMetadata) -> str:
         """Build YAML front matter for a wiki page."""
@@ -192,7 +319,32 @@ class MarkdownGenerator:
         if wiki_page.parent_title:
             data["parent"] = wiki_page.parent_title
 
-        return "---\n" + str(yaml.dump(data, allow_unicode=True, sort_keys=False)) + "---\n"
+        return "---\n" + self._dump_yaml(data) + "---\n"
+
+    def _dump_yaml(self, data: dict[str, Any]) -> str:
+        """Serialize front matter data as block-style YAML.
+
+        The front matter schemas are flat, so scalar values are written
+        directly. Only values without a direct form, such as the
+        ``custom_fields`` mapping, go through the YAML dumper.
+        """
+        lines: list[str] = []
+        for key, value in data.items():
+            scalar = _yaml_scalar(value)
+            if scalar is None:
+                lines.append(
+                    str(
+                        yaml.dump(
+                            {key: value},
+                            Dumper=SafeDumper,
+                            allow_unicode=True,
+                            sort_keys=False,
+                        )
+                    )
+                )
+            else:
+                lines.append(f"{key}: {scalar}\n")
+        return "".join(lines)
 
     def _build_attachment_section(
         self,
@@ -200,66 +352,62 @@ class MarkdownGenerator:
         extracted: ExtractedContent | None,
     ) -> str:
         """Build a section for an attachment."""
-        lines: list[str] = []
+        return "\n".join(self._iter_attachment_lines(attachment, extracted))
 
+    def _iter_attachment_lines(
+        self,
+        attachment: AttachmentInfo,
+        extracted: ExtractedContent | None,
+    ) -> Iterator[str]:
+        """Yield the lines of an attachment section, to be joined with newlines."""
         # Attachment header
-        lines.append(f"### {attachment.filename}\n")
+        yield f"### {attachment.filename}\n"
 
         # Image preview if applicable
         if attachment.is_image:
-            lines.append(
-                f"![{attachment.filename}]({self.attachment_path_prefix}/{attachment.filename})\n",
-            )
+            yield f"![{attachment.filename}]({self.attachment_path_prefix}/{attachment.filename})\n"
 
         # File info
-        size_kb = attachment.filesize / 1024
-        lines.append(f"*檔案大小: {size_kb:.1f} KB, 類型: {attachment.content_type}*\n")
+        size_kb = _format_kb(attachment.filesize)
+        yield f"*檔案大小: {size_kb} KB, 類型: {attachment.content_type}*\n"
 
         # Description
         if attachment.description:
-            lines.append(f"*描述: {attachment.description}*\n")
+            yield f"*描述: {attachment.description}*\n"
 
         # Extracted content
         if extracted:
             if extracted.error:
-                lines.append(f"> ⚠️ 處理失敗: {extracted.error}\n")
+                yield f"> ⚠️ 處理失敗: {extracted.error}\n"
             elif extracted.text:
-                method_label = {
-                    "ocr": "OCR 提取",
-                    "text_extract": "文字提取",
-                    "llm": "AI 分析",
-                    "fallback": "基本資訊",
-                }.get(extracted.processing_method.value, "提取")
-
-                lines.append(f"**{method_label}內容:**\n")
-                lines.append(f"```\n{extracted.text[:EXTRACTED_TEXT_MAX_LENGTH]}")
-                if len(extracted.text) > EXTRACTED_TEXT_MAX_LENGTH:
-                    lines.append("\n... (內容已截斷)")
-                lines.append("\n```\n")
+                method_label = _METHOD_LABELS.get(extracted.processing_method.value, "提取")
 
-        return "\n".join(lines)
+                yield f"**{method_label}內容:**\n"
+                yield f"```\n{extracted.text[:EXTRACTED_TEXT_MAX_LENGTH]}"
+                if len(extracted.text) > EXTRACTED_TEXT_MAX_LENGTH:
+                    yield "\n... (內容已截斷)"
+                yield "\n```\n"
 
     def _build_journals_section(self, journals: list[JournalEntry]) -> str:
         """Build a section for journal entries (comments/changes)."""
-        # Filter to only include journals with notes
-        journals_with_notes = [j for j in journals if j.notes and j.notes.strip()]
-
-        if not journals_with_notes:
-            return ""
-
-        lines: list[str] = ["## 討論記錄\n"]
-
-        for journal in journals_with_notes:
+        lines: list[str] | None = None
+
+        for journal in journals:
+            # Only include journals with notes
+            if not (journal.notes and journal.notes.strip()):
+                continue
+            if lines is None:
+                lines = ["## 討論記錄\n"]
             date_str = self._format_datetime(journal.created_on)
-            md_notes = self.converter.convert(journal.notes)
+            md_notes = self._convert_notes(journal.notes)
             lines.append(f"### {date_str} - {journal.user}\n")
             lines.append(f"{md_notes}\n")
 
-        return "\n".join(lines)
+        return "\n".join(lines) if lines else ""
 
     def _format_datetime(self, dt: datetime) -> str:
-        """Format a datetime for display."""
-        return dt.strftime("%Y-%m-%d %H:%M")
+        """Format a datetime for display as ``YYYY-MM-DD HH:MM``."""
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
     def save_issue(
         self,
@@ -276,14 +424,13 @@ class MarkdownGenerator:
             Path to the saved file.
 
         """
-        content = self.generate_issue_markdown(issue, extracted_contents)
-
         # Create output path
         issues_dir = self.output_dir / issue.project / "issues"
         issues_dir.mkdir(parents=True, exist_ok=True)
 
         file_path = issues_dir / f"{issue.id:05d}.md"
-        file_path.write_text(content, encoding="utf-8")
+        with file_path.open("w", encoding="utf-8", buffering=OUTPUT_WRITE_BUFFER_SIZE) as f:
+            self._write_issue_markdown(f, issue, extracted_contents)
 
         return file_path
 
@@ -302,8 +449,6 @@ class MarkdownGenerator:
             Path to the saved file.
 
         """
-        content = self.generate_wiki_markdown(wiki_page, extracted_contents)
-
         # Create output path
         wiki_dir = self.output_dir / wiki_page.project / "wiki"
         wiki_dir.mkdir(parents=True, exist_ok=True)
@@ -311,13 +456,11 @@ class MarkdownGenerator:
         # Sanitize filename
         safe_title = self._sanitize_filename(wiki_page.title)
         file_path = wiki_dir / f"{safe_title}.md"
-        file_path.write_text(content, encoding="utf-8")
+        with file_path.open("w", encoding="utf-8", buffering=OUTPUT_WRITE_BUFFER_SIZE) as f:
+            self._write_wiki_markdown(f, wiki_page, extracted_contents)
 
         return file_path
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a string for use as a filename."""
-        # Replace problematic characters
-        for char in ["/", "\\", ":", "*", "?", '"', "<", ">", "|"]:
-            name = name.replace(char, "_")
-        return name
+        return name.translate(_FILENAME_TRANSLATION)
@@ -23,9 +23,36 @@ class ProcessingMethod(str, Enum):
     FALLBACK = "fallback"
 
 
-@dataclass
+class AttachmentKind(Enum):
+    """Broad attachment category derived from the content type."""
+
+    IMAGE = "image"
+    PDF = "pdf"
+    DOCX = "docx"
+    SPREADSHEET = "spreadsheet"
+    OTHER = "other"
+
+
+_ATTACHMENT_KINDS: dict[str, AttachmentKind] = {
+    "application/pdf": AttachmentKind.PDF,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": (
+        AttachmentKind.DOCX
+    ),
+    "application/msword": AttachmentKind.DOCX,
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": (
+        AttachmentKind.SPREADSHEET
+    ),
+    "application/vnd.ms-excel": AttachmentKind.SPREADSHEET,
+    "text/csv": AttachmentKind.SPREADSHEET,
+}
+
+
+@dataclass(slots=True)
 class AttachmentInfo:
-    """Information about an attachment."""
+    """Information about an attachment.
+
+    ``kind`` is derived from ``content_type`` once, at construction.
+    """
 
     id: int
     filename: str
@@ -33,36 +60,64 @@ class AttachmentInfo:
     filesize: int
     content_url: str
     description: str = ""
+    kind: AttachmentKind = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Classify the attachment by its content type."""
+        kind = _ATTACHMENT_KINDS.get(self.content_type)
+        if kind is None:
+            kind = (
+                AttachmentKind.IMAGE
+                if self.content_type.startswith("image/")
+                else AttachmentKind.OTHER
+            )
+        self.kind = kind
 
     @property
     def is_image(self) -> bool:
         """Check if the attachment is an image."""
-        return self.content_type.startswith("image/")
+        return self.kind is AttachmentKind.IMAGE
 
     @property
     def is_pdf(self) -> bool:
         """Check if the attachment is a PDF."""
-        return self.content_type == "application/pdf"
+        return self.kind is AttachmentKind.PDF
 
     @property
     def is_docx(self) -> bool:
         """Check if the attachment is a Word document."""
-        return self.content_type in (
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "application/msword",
-        )
+        return self.kind is AttachmentKind.DOCX
 
     @property
     def is_spreadsheet(self) -> bool:
         """Check if the attachment is a spreadsheet."""
-        return self.content_type in (
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "application/vnd.ms-excel",
-            "text/csv",
+        return self.kind is AttachmentKind.SPREADSHEET
+
+
+def _attachments_from(resource: Any) -> list[AttachmentInfo]:
+    """Build attachment records for an issue or wiki page resource.
+
+    Args:
+        resource: A python-redmine resource with an optional ``attachments`` list.
+
+    Returns:
+        One AttachmentInfo per attachment, in resource order.
+
+    """
+    return [
+        AttachmentInfo(
+            id=att.id,
+            filename=att.filename,
+            content_type=getattr(att, "content_type", "application/octet-stream"),
+            filesize=getattr(att, "filesize", 0),
+            content_url=att.content_url,
+            description=getattr(att, "description", "") or "",
         )
+        for att in getattr(resource, "attachments", ())
+    ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedContent:
     """Content extracted from an attachment."""
 
@@ -77,7 +132,7 @@ class ExtractedContent:
         return self.error is None and bool(self.text.strip())
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     """A journal entry (comment/change) on an issue."""
 
@@ -88,7 +143,7 @@ class JournalEntry:
     details: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueMetadata:
     """Metadata for a Redmine issue."""
 
@@ -123,75 +178,49 @@ class IssueMetadata:
             IssueMetadata instance.
 
         """
-        # Extract attachments
-        attachments: list[AttachmentInfo] = []
-        if hasattr(issue, "attachments"):
-            attachments.extend(
-                AttachmentInfo(
-                    id=att.id,
-                    filename=att.filename,
-                    content_type=getattr(att, "content_type", "application/octet-stream"),
-                    filesize=getattr(att, "filesize", 0),
-                    content_url=att.content_url,
-                    description=getattr(att, "description", "") or "",
-                )
-                for att in issue.attachments
-            )
-
         # Extract journals
-        journals: list[JournalEntry] = []
-        if hasattr(issue, "journals"):
-            journals.extend(
-                JournalEntry(
-                    id=journal.id,
-                    user=getattr(journal.user, "name", "Unknown")
-                    if hasattr(journal, "user")
-                    else "Unknown",
-                    notes=getattr(journal, "notes", "") or "",
-                    created_on=journal.created_on
-                    if hasattr(journal, "created_on")
-                    else datetime.now(tz=UTC),
-                    details=list(getattr(journal, "details", [])),
-                )
-                for journal in issue.journals
+        journals = [
+            JournalEntry(
+                id=journal.id,
+                user=getattr(getattr(journal, "user", None), "name", "Unknown"),
+                notes=getattr(journal, "notes", "") or "",
+                created_on=getattr(journal, "created_on", None) or datetime.now(tz=UTC),
+                details=list(getattr(journal, "details", [])),
             )
+            for journal in getattr(issue, "journals", ())
+        ]
 
         # Extract custom fields
-        custom_fields = {}
-        if hasattr(issue, "custom_fields"):
-            for cf in issue.custom_fields:
-                custom_fields[cf.name] = getattr(cf, "value", "")
+        custom_fields = {
+            cf.name: getattr(cf, "value", "") for cf in getattr(issue, "custom_fields", ())
+        }
 
+        project = issue.project
+        identifier = getattr(project, "identifier", None)
         return cls(
             id=issue.id,
-            project=issue.project.identifier
-            if hasattr(issue.project, "identifier")
-            else str(issue.project),
-            tracker=issue.tracker.name if hasattr(issue, "tracker") else "Unknown",
-            status=issue.status.name if hasattr(issue, "status") else "Unknown",
-            priority=issue.priority.name if hasattr(issue, "priority") else "Normal",
+            project=identifier if identifier is not None else str(project),
+            tracker=getattr(getattr(issue, "tracker", None), "name", "Unknown"),
+            status=getattr(getattr(issue, "status", None), "name", "Unknown"),
+            priority=getattr(getattr(issue, "priority", None), "name", "Normal"),
             subject=issue.subject,
             description_textile=getattr(issue, "description", "") or "",
             created_on=issue.created_on,
             updated_on=issue.updated_on,
-            target_version=getattr(issue.fixed_version, "name", None)
-            if hasattr(issue, "fixed_version")
-            else None,
-            assigned_to=getattr(issue.assigned_to, "name", None)
-            if hasattr(issue, "assigned_to")
-            else None,
-            author=getattr(issue.author, "name", None) if hasattr(issue, "author") else None,
+            target_version=getattr(getattr(issue, "fixed_version", None), "name", None),
+            assigned_to=getattr(getattr(issue, "assigned_to", None), "name", None),
+            author=getattr(getattr(issue, "author", None), "name", None),
             done_ratio=getattr(issue, "done_ratio", 0),
             estimated_hours=getattr(issue, "estimated_hours", None),
             spent_hours=getattr(issue, "spent_hours", 0.0) or 0.0,
-            attachments=attachments,
+            attachments=_attachments_from(issue),
             journals=journals,
             custom_fields=custom_fields,
-            parent_id=getattr(issue.parent, "id", None) if hasattr(issue, "parent") else None,
+            parent_id=getattr(getattr(issue, "parent", None), "id", None),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WikiPageMetadata:
     """Metadata for a Redmine wiki page."""
 
@@ -218,20 +247,6 @@ class WikiPageMetadata:
             WikiPageMetadata instance.
 
         """
-        attachments: list[AttachmentInfo] = []
-        if hasattr(wiki_page, "attachments"):
-            attachments.extend(
-                AttachmentInfo(
-                    id=att.id,
-                    filename=att.filename,
-                    content_type=getattr(att, "content_type", "application/octet-stream"),
-                    filesize=getattr(att, "filesize", 0),
-                    content_url=att.content_url,
-                    description=getattr(att, "description", "") or "",
-                )
-                for att in wiki_page.attachments
-            )
-
         return cls(
             title=wiki_page.title,
             project=project_id,
@@ -239,18 +254,14 @@ class WikiPageMetadata:
             created_on=getattr(wiki_page, "created_on", datetime.now(tz=UTC)),
             updated_on=getattr(wiki_page, "updated_on", datetime.now(tz=UTC)),
             text_textile=getattr(wiki_page, "text", "") or "",
-            author=getattr(wiki_page.author, "name", None)
-            if hasattr(wiki_page, "author")
-            else None,
+            author=getattr(getattr(wiki_page, "author", None), "name", None),
             comments=getattr(wiki_page, "comments", "") or "",
-            parent_title=getattr(wiki_page.parent, "title", None)
-            if hasattr(wiki_page, "parent")
-            else None,
-            attachments=attachments,
+            parent_title=getattr(getattr(wiki_page, "parent", None), "title", None),
+            attachments=_attachments_from(wiki_page),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingState:
     """State for tracking processing progress."""
 
@@ -5,29 +5,44 @@ Each processor handles a specific type of attachment and extracts content.
 
 from __future__ import annotations
 
+import functools
+import io
 import mimetypes
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from datetime import date, datetime, time
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any, Protocol, TextIO, runtime_checkable
 
 from .models import ExtractedContent, ProcessingMethod
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
 
     from .config import ProcessingConfig
 
 # Optional dependencies - declare placeholders then attempt imports (avoid redefinition warnings)
 Image: Any = None
+ImageChops: Any = None
+ImageFilter: Any = None
 pytesseract: Any = None
 Document: Any = None
 openpyxl: Any = None
 
 try:
     from PIL import Image as _PIL_Image
+    from PIL import ImageChops as _PIL_ImageChops
+    from PIL import ImageFilter as _PIL_ImageFilter
 
     Image = _PIL_Image
+    ImageChops = _PIL_ImageChops
+    ImageFilter = _PIL_ImageFilter
 except ImportError:  # pragma: no cover
     Image = None
+    ImageChops = None
+    ImageFilter = None
 
 try:
     import pytesseract as _pytesseract  # type: ignore[import-untyped]
@@ -36,6 +51,15 @@ try:
 except ImportError:  # pragma: no cover
     pytesseract = None
 
+tesserocr: Any = None
+
+try:
+    import tesserocr as _tesserocr  # type: ignore[import-untyped]
+
+    tesserocr = _tesserocr
+except ImportError:  # pragma: no cover
+    tesserocr = None
+
 fitz: Any = None
 
 try:
@@ -68,6 +92,15 @@ try:
 except ImportError:  # pragma: no cover
     xlrd = None
 
+CalamineWorkbook: Any = None
+
+try:
+    from python_calamine import CalamineWorkbook as _CalamineWorkbook
+
+    CalamineWorkbook = _CalamineWorkbook
+except ImportError:  # pragma: no cover
+    CalamineWorkbook = None
+
 olefile: Any = None
 
 try:
@@ -77,6 +110,129 @@ try:
 except ImportError:  # pragma: no cover
     olefile = None
 
+# Suffixes the processors depend on that Python's built-in MIME table lacks;
+# without an OS mime.types file (e.g. slim containers) they would not resolve
+_REQUIRED_MIME_TYPES = (
+    ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx"),
+    ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+    ("image/webp", ".webp"),
+)
+
+
+def _register_mime_types() -> None:
+    """Initialise mimetypes and add the suffixes the processors rely on.
+
+    Runs at import so that the system MIME tables are read once up front,
+    not on the first attachment, and suffix lookups work on any host.
+    """
+    for mime_type, suffix in _REQUIRED_MIME_TYPES:
+        mimetypes.add_type(mime_type, suffix)
+
+
+_register_mime_types()
+
+
+def _stat_or_none(file_path: Path) -> os.stat_result | None:
+    """Stat a file, returning None if it does not exist or cannot be accessed.
+
+    Processors check for the file and read its size from this one result,
+    rather than issuing a separate ``exists()`` and ``stat()`` call.
+    """
+    try:
+        return file_path.stat()
+    except OSError:
+        return None
+
+
+MIME_GUESS_CACHE_MAX_ENTRIES = 256
+
+
+@functools.lru_cache(maxsize=MIME_GUESS_CACHE_MAX_ENTRIES)
+def _guess_mime_type(suffixes: str) -> str | None:
+    """Guess a MIME type from a filename's trailing suffixes (e.g. ``.tar.gz``).
+
+    mimetypes only looks at the last two suffixes (encoding plus type), so
+    results are cached per suffix combination rather than per filename.
+    """
+    return mimetypes.guess_type(f"file{suffixes}")[0]
+
+
+OCR_LANGUAGES = "eng+chi_tra"
+
+# One tesserocr engine per worker thread: PyTessBaseAPI is not reentrant
+_tesserocr_local = threading.local()
+
+
+def _ocr_image(img: Any) -> str:
+    """Run Tesseract OCR on a PIL image.
+
+    With tesserocr installed, the calling thread's engine is created on
+    first use and reused, so the language models are loaded once per thread
+    instead of starting a ``tesseract`` process for every image.
+    Otherwise pytesseract is used.
+    """
+    if tesserocr is None:
+        return str(pytesseract.image_to_string(img, lang=OCR_LANGUAGES))
+
+    api = getattr(_tesserocr_local, "api", None)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang=OCR_LANGUAGES)
+        _tesserocr_local.api = api
+    api.SetImage(img)
+    return str(api.GetUTF8Text())
+
+
+# Adaptive threshold applied before OCR when processing.ocr_preprocess is set:
+# the Gaussian sigma OpenCV derives for a 31px block, and the offset C
+OCR_THRESHOLD_SIGMA = 5.0
+OCR_THRESHOLD_OFFSET = 10
+
+
+def _binarize_for_ocr(img: Any) -> Any:
+    """Convert an image to black and white with an adaptive Gaussian threshold.
+
+    A pixel turns white when it is brighter than its Gaussian-weighted
+    neighbourhood mean minus ``OCR_THRESHOLD_OFFSET``, and black otherwise.
+    This evens out shading and uneven lighting in scans and photos. Every
+    step (blur, subtract, lookup) runs inside Pillow.
+
+    Args:
+        img: PIL image in any mode.
+
+    Returns:
+        Grayscale ("L") PIL image containing only 0 and 255.
+
+    """
+    gray = img.convert("L")
+    local_mean = gray.filter(ImageFilter.GaussianBlur(OCR_THRESHOLD_SIGMA))
+    # Clamped to 0 where the pixel is brighter than its neighbourhood
+    darkness = ImageChops.subtract(local_mean, gray)
+    return darkness.point([255 if v < OCR_THRESHOLD_OFFSET else 0 for v in range(256)])
+
+
+def _limit_ocr_size(img: Any, max_dim: int) -> Any:
+    """Downscale an image so that its longest side is at most ``max_dim`` pixels.
+
+    Text in large photos and screenshots is oversampled for OCR, and
+    tesseract's layout analysis cost grows with the pixel count.
+
+    Args:
+        img: PIL image.
+        max_dim: Maximum width or height in pixels.
+
+    Returns:
+        The image itself if it already fits, otherwise a LANCZOS-resampled copy.
+
+    """
+    width, height = img.size
+    longest = max(width, height)
+    if longest <= max_dim:
+        return img
+
+    scale = max_dim / longest
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return img.resize(size, Image.Resampling.LANCZOS)
+
 
 @runtime_checkable
 class AttachmentProcessor(Protocol):
@@ -167,10 +323,11 @@ class ImageProcessor(BaseProcessor):
             ExtractedContent with OCR-extracted text.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
-        if pytesseract is None or Image is None:
+        if (pytesseract is None and tesserocr is None) or Image is None:
             return self._create_error_result(
                 "OCR dependencies not available: pytesseract or PIL not installed",
             )
@@ -183,13 +340,19 @@ class ImageProcessor(BaseProcessor):
                 else:
                     img_to_process = img
 
-                text = pytesseract.image_to_string(img_to_process, lang="eng+chi_tra")
+                if self.config is not None and self.config.max_ocr_dim:
+                    img_to_process = _limit_ocr_size(img_to_process, self.config.max_ocr_dim)
+
+                if self.config is not None and self.config.ocr_preprocess:
+                    img_to_process = _binarize_for_ocr(img_to_process)
+
+                text = _ocr_image(img_to_process)
 
             return ExtractedContent(
                 text=text.strip(),
                 metadata={
                     "filename": file_path.name,
-                    "size": file_path.stat().st_size,
+                    "size": file_stat.st_size,
                 },
                 processing_method=ProcessingMethod.OCR,
             )
@@ -215,7 +378,8 @@ class PdfProcessor(BaseProcessor):
             ExtractedContent with extracted text.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
         try:
@@ -226,22 +390,21 @@ class PdfProcessor(BaseProcessor):
                     "PDF dependencies not available: PyMuPDF not installed",
                 )
 
-            text_parts: list[str] = []
-            page_count = 0
-
             with fitz_mod.open(str(file_path)) as doc:
                 page_count = len(doc)
-                for page in doc:  # pragma: no branch
-                    page_text = page.get_text()
-                    if page_text.strip():  # pragma: no branch
-                        text_parts.append(page_text)
+                # isspace() detects blank pages without copying their text
+                text_parts = [
+                    page_text
+                    for page_text in (page.get_text() for page in doc)
+                    if page_text and not page_text.isspace()
+                ]
 
             return ExtractedContent(
                 text="\n\n".join(text_parts),
                 metadata={
                     "filename": file_path.name,
                     "page_count": page_count,
-                    "size": file_path.stat().st_size,
+                    "size": file_stat.st_size,
                 },
                 processing_method=ProcessingMethod.TEXT_EXTRACT,
             )
@@ -249,6 +412,12 @@ class PdfProcessor(BaseProcessor):
             return self._create_error_result(f"PDF extraction failed: {e}")
 
 
+# Tags of the block-level body elements the DOCX processor extracts
+_WORDPROCESSINGML_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PARAGRAPH_TAG = f"{_WORDPROCESSINGML_NS}p"
+_DOCX_TABLE_TAG = f"{_WORDPROCESSINGML_NS}tbl"
+
+
 class DocxProcessor(BaseProcessor):
     """Processor for Word documents (.docx only)."""
 
@@ -269,7 +438,8 @@ class DocxProcessor(BaseProcessor):
             ExtractedContent with extracted text.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
         if Document is None:
@@ -279,35 +449,77 @@ class DocxProcessor(BaseProcessor):
 
         try:
             doc = Document(str(file_path))
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-
-            # Also extract text from tables
-            table_texts: list[str] = []
-            for table in doc.tables:  # pragma: no branch
-                for row in table.rows:
-                    row_text = " | ".join(
-                        cell.text.strip() for cell in row.cells if cell.text.strip()
-                    )
-                    if row_text:  # pragma: no branch
-                        table_texts.append(row_text)
-
-            all_text = "\n\n".join(paragraphs)
-            if table_texts:
-                all_text += "\n\n### Tables\n\n" + "\n".join(table_texts)
+            # Walk the body XML once, in document order, rather than through
+            # python-docx's Paragraph/Table/_Cell proxies, which are rebuilt
+            # on every access
+            blocks: list[str] = []
+            paragraph_count = 0
+            table_count = 0
+            for child in doc.element.body.iterchildren():
+                if child.tag == _DOCX_PARAGRAPH_TAG:
+                    if (text := child.text).strip():
+                        blocks.append(text)
+                        paragraph_count += 1
+                elif child.tag == _DOCX_TABLE_TAG:
+                    table_count += 1
+                    rows = [
+                        row_text
+                        for cells in self._iter_table_rows(child)
+                        if (
+                            row_text := " | ".join(
+                                stripped for text in cells if (stripped := text.strip())
+                            )
+                        )
+                    ]
+                    if rows:
+                        blocks.append("\n".join(rows))
+
+            all_text = "\n\n".join(blocks)
 
             return ExtractedContent(
                 text=all_text,
                 metadata={
                     "filename": file_path.name,
-                    "paragraph_count": len(paragraphs),
-                    "table_count": len(doc.tables),
-                    "size": file_path.stat().st_size,
+                    "paragraph_count": paragraph_count,
+                    "table_count": table_count,
+                    "size": file_stat.st_size,
                 },
                 processing_method=ProcessingMethod.TEXT_EXTRACT,
             )
         except (OSError, ValueError, RuntimeError) as e:
             return self._create_error_result(f"DOCX extraction failed: {e}")
 
+    def _iter_table_rows(self, tbl: Any) -> Iterator[list[str]]:
+        """Yield the cell texts of each row of a ``w:tbl`` element.
+
+        Matches python-docx's ``_Row.cells``: a horizontally merged cell is
+        repeated for every grid column it spans, and a vertically merged
+        continuation cell repeats the text of the cell above it.
+
+        Args:
+            tbl: A python-docx ``CT_Tbl`` element.
+
+        Yields:
+            One list of cell texts per table row.
+
+        """
+        # Text of the cell covering each grid column in the previous row
+        above: dict[int, str] = {}
+        for tr in tbl.tr_lst:
+            grid_col = int(next(iter(tr.xpath("./w:trPr/w:gridBefore/@w:val")), 0))
+            cells: list[str] = []
+            for tc in tr.tc_lst:
+                span = tc.grid_span
+                if tc.vMerge == "continue":
+                    text = above.get(grid_col, "")
+                else:
+                    text = "\n".join(p.text for p in tc.p_lst)
+                for col in range(grid_col, grid_col + span):
+                    above[col] = text
+                cells.extend([text] * span)
+                grid_col += span
+            yield cells
+
 
 class LegacyDocProcessor(BaseProcessor):
     """Processor for legacy Word documents (.doc format using OLE)."""
@@ -329,7 +541,8 @@ class LegacyDocProcessor(BaseProcessor):
             ExtractedContent with extracted text.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
         if olefile is None:
@@ -363,7 +576,7 @@ class LegacyDocProcessor(BaseProcessor):
                             text=extracted_text,
                             metadata={
                                 "filename": file_path.name,
-                                "size": file_path.stat().st_size,
+                                "size": file_stat.st_size,
                                 "format": "legacy_doc",
                             },
                             processing_method=ProcessingMethod.TEXT_EXTRACT,
@@ -375,7 +588,7 @@ class LegacyDocProcessor(BaseProcessor):
                     text=f"(Legacy .doc file: {file_path.name} - limited text extraction)",
                     metadata={
                         "filename": file_path.name,
-                        "size": file_path.stat().st_size,
+                        "size": file_stat.st_size,
                         "streams": ["/".join(s) for s in streams],
                         "format": "legacy_doc",
                     },
@@ -441,54 +654,60 @@ class SpreadsheetProcessor(BaseProcessor):
             ExtractedContent with Markdown table representation.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
         suffix = file_path.suffix.lower()
 
         try:
             if suffix == ".csv":
-                return self._process_csv(file_path)
+                return self._process_csv(file_path, file_stat.st_size)
             if suffix == ".xls":
-                return self._process_legacy_excel(file_path)
-            # Default to xlsx processing
-            if openpyxl is None:
-                return self._create_error_result(
-                    "Spreadsheet dependencies not available: openpyxl not installed",
-                )
-            return self._process_excel(file_path)
+                return self._process_legacy_excel(file_path, file_stat.st_size)
+            # Default to xlsx processing, preferring the Rust-backed parser
+            if CalamineWorkbook is not None:
+                return self._process_excel_calamine(file_path, file_stat.st_size)
+            return self._process_excel(file_path, file_stat.st_size)
         except (OSError, ValueError, RuntimeError) as e:
             return self._create_error_result(f"Spreadsheet extraction failed: {e}")
 
-    def _process_csv(self, file_path: Path) -> ExtractedContent:
-        """Process a CSV file."""
+    def _process_csv(self, file_path: Path, size: int) -> ExtractedContent:
+        """Process a CSV file.
+
+        Rows are streamed from the reader straight into the Markdown table,
+        skipping completely empty rows as the Excel paths do.
+        """
         import csv  # noqa: PLC0415 - deferred import for optional dependency
 
-        rows: list[list[str]] = []
+        out = io.StringIO()
         with file_path.open(encoding="utf-8", errors="replace") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
+            row_count = self._write_markdown_table(out, (row for row in csv.reader(f) if any(row)))
 
-        if not rows:
+        if not row_count:
             return ExtractedContent(
                 text="(Empty spreadsheet)",
                 metadata={"filename": file_path.name, "row_count": 0},
                 processing_method=ProcessingMethod.TEXT_EXTRACT,
             )
 
-        md_table = self._rows_to_markdown(rows)
         return ExtractedContent(
-            text=md_table,
+            text=out.getvalue(),
             metadata={
                 "filename": file_path.name,
-                "row_count": len(rows),
-                "size": file_path.stat().st_size,
+                "row_count": row_count,
+                "size": size,
             },
             processing_method=ProcessingMethod.TEXT_EXTRACT,
         )
 
-    def _process_excel(self, file_path: Path) -> ExtractedContent:
+    def _process_excel(self, file_path: Path, size: int) -> ExtractedContent:
         """Process an Excel .xlsx file using openpyxl."""
+        if openpyxl is None:
+            return self._create_error_result(
+                "Spreadsheet dependencies not available: openpyxl not installed",
+            )
+
         wb = openpyxl.load_workbook(str(file_path), read_only=True, data_only=True)
         all_sheets: list[str] = []
         total_rows = 0
@@ -497,9 +716,9 @@ class SpreadsheetProcessor(BaseProcessor):
             sheet = wb[sheet_name]
             rows: list[list[str]] = []
             for row in sheet.iter_rows(values_only=True):  # pragma: no branch
-                str_row = [str(cell) if cell is not None else "" for cell in row]
-                if any(str_row):  # Skip completely empty rows  # pragma: no branch
-                    rows.append(str_row)
+                if _is_blank_row(row):  # Skip completely empty rows  # pragma: no branch
+                    continue
+                rows.append([str(cell) if cell is not None else "" for cell in row])
 
             if rows:  # pragma: no branch
                 total_rows += len(rows)
@@ -514,12 +733,55 @@ class SpreadsheetProcessor(BaseProcessor):
                 "filename": file_path.name,
                 "sheet_count": len(wb.sheetnames),
                 "total_rows": total_rows,
-                "size": file_path.stat().st_size,
+                "size": size,
+            },
+            processing_method=ProcessingMethod.TEXT_EXTRACT,
+        )
+
+    def _process_excel_calamine(self, file_path: Path, size: int) -> ExtractedContent:
+        """Process an Excel .xlsx file using python-calamine.
+
+        Each sheet is decoded in a single pass into Python rows. Cell values
+        are rendered as the openpyxl path renders them, so the output does
+        not depend on which parser is installed.
+        """
+        try:
+            with CalamineWorkbook.from_path(str(file_path)) as wb:
+                sheet_names = wb.sheet_names
+                sheets = [
+                    (name, wb.get_sheet_by_name(name).to_python(skip_empty_area=False))
+                    for name in sheet_names
+                ]
+        except Exception as e:  # noqa: BLE001 - calamine raises its own CalamineError hierarchy
+            return self._create_error_result(f"Spreadsheet extraction failed: {e}")
+
+        all_sheets: list[str] = []
+        total_rows = 0
+
+        for sheet_name, sheet_rows in sheets:
+            rows: list[list[str]] = []
+            for row in sheet_rows:
+                if _is_blank_row(row):  # Skip completely empty rows
+                    continue
+                rows.append([_calamine_cell_text(cell) for cell in row])
+
+            if rows:
+                total_rows += len(rows)
+                md_table = self._rows_to_markdown(rows)
+                all_sheets.append(f"### {sheet_name}\n\n{md_table}")
+
+        return ExtractedContent(
+            text="\n\n".join(all_sheets) if all_sheets else "(Empty spreadsheet)",
+            metadata={
+                "filename": file_path.name,
+                "sheet_count": len(sheet_names),
+                "total_rows": total_rows,
+                "size": size,
             },
             processing_method=ProcessingMethod.TEXT_EXTRACT,
         )
 
-    def _process_legacy_excel(self, file_path: Path) -> ExtractedContent:
+    def _process_legacy_excel(self, file_path: Path, size: int) -> ExtractedContent:
         """Process a legacy Excel .xls file using xlrd."""
         if xlrd is None:
             return self._create_error_result(
@@ -540,9 +802,9 @@ class SpreadsheetProcessor(BaseProcessor):
 
             for row_idx in range(sheet.nrows):
                 row_values = sheet.row_values(row_idx)
-                str_row = [str(cell) if cell is not None else "" for cell in row_values]
-                if any(str_row):  # Skip completely empty rows
-                    rows.append(str_row)
+                if _is_blank_row(row_values):  # Skip completely empty rows
+                    continue
+                rows.append([str(cell) if cell is not None else "" for cell in row_values])
 
             if rows:
                 total_rows += len(rows)
@@ -555,7 +817,7 @@ class SpreadsheetProcessor(BaseProcessor):
                 "filename": file_path.name,
                 "sheet_count": wb.nsheets,
                 "total_rows": total_rows,
-                "size": file_path.stat().st_size,
+                "size": size,
                 "format": "legacy_xls",
             },
             processing_method=ProcessingMethod.TEXT_EXTRACT,
@@ -563,24 +825,70 @@ class SpreadsheetProcessor(BaseProcessor):
 
     def _rows_to_markdown(self, rows: list[list[str]]) -> str:
         """Convert rows to Markdown table format."""
-        if not rows:
-            return ""
+        out = io.StringIO()
+        self._write_markdown_table(out, rows)
+        return out.getvalue()
+
+    def _write_markdown_table(self, out: TextIO, rows: Iterable[list[str]]) -> int:
+        """Write rows to ``out`` as a Markdown table, using the first row as header.
+
+        Args:
+            out: Text stream to write to.
+            rows: Table rows; consumed once, so a streaming reader works.
+
+        Returns:
+            Number of rows written, including the header (0 if there were none).
+
+        """
+        row_iter = iter(rows)
+        header = next(row_iter, None)
+        if header is None:
+            return 0
 
-        # Use first row as header
-        header = rows[0]
         col_count = len(header)
+        out.write("| " + " | ".join(header) + " |\n")
+        out.write("| " + " | ".join(["---"] * col_count) + " |")
+
+        # Specialise on the column count: one C-level % format per row
+        row_format = "\n| " + " | ".join(["%s"] * col_count) + " |"
+        padding = [""] * col_count
+
+        row_count = 1
+        for row in row_iter:
+            # Pad or truncate rows that do not match the header width
+            cells = row if len(row) == col_count else (row + padding)[:col_count]
+            out.write(row_format % tuple(cells))
+            row_count += 1
+
+        return row_count
 
-        lines = [
-            "| " + " | ".join(header) + " |",
-            "| " + " | ".join(["---"] * col_count) + " |",
-        ]
 
-        for row in rows[1:]:
-            # Pad row if necessary
-            padded = row + [""] * (col_count - len(row))
-            lines.append("| " + " | ".join(padded[:col_count]) + " |")
+def _is_blank_row(row: Sequence[Any]) -> bool:
+    """Check whether every cell of a spreadsheet row is empty (``None`` or ``""``).
 
-        return "\n".join(lines)
+    Short-circuits on the first non-empty cell, so blank rows are skipped
+    before any cell is converted to a string.
+    """
+    return all(cell is None or cell == "" for cell in row)
+
+
+# Magnitude from which float reprs (and so stored xlsx values) use exponents
+_FLOAT_EXPONENT_THRESHOLD = 1e16
+
+
+def _calamine_cell_text(cell: Any) -> str:
+    """Render a python-calamine cell value like the matching openpyxl value.
+
+    calamine returns whole numbers as floats and date-only cells as dates,
+    where openpyxl returns ints and midnight datetimes. openpyxl only reads
+    a number as an int when it is stored without a point or exponent, which
+    rules out whole numbers of 1e16 and above.
+    """
+    if isinstance(cell, float) and cell.is_integer() and abs(cell) < _FLOAT_EXPONENT_THRESHOLD:
+        return str(int(cell))
+    if type(cell) is date:
+        return str(datetime.combine(cell, time()))
+    return str(cell)
 
 
 class FallbackProcessor(BaseProcessor):
@@ -601,17 +909,18 @@ class FallbackProcessor(BaseProcessor):
             ExtractedContent with only metadata.
 
         """
-        if not file_path.exists():
+        file_stat = _stat_or_none(file_path)
+        if file_stat is None:
             return self._create_error_result(f"File not found: {file_path}")
 
-        mime_type, _ = mimetypes.guess_type(str(file_path))
+        mime_type = _guess_mime_type("".join(file_path.suffixes[-2:]))
 
         return ExtractedContent(
             text=f"(Binary file: {file_path.name}, type: {mime_type or 'unknown'})",
             metadata={
                 "filename": file_path.name,
                 "mime_type": mime_type,
-                "size": file_path.stat().st_size,
+                "size": file_stat.st_size,
             },
             processing_method=ProcessingMethod.FALLBACK,
         )
@@ -629,6 +938,10 @@ class ProcessorFactory:
         """
         self.config = config
         self._processors: dict[str, BaseProcessor] = {}
+        # File suffix -> processor, derived from the registered MIME types
+        self._processors_by_suffix: dict[str, BaseProcessor] = {}
+        # Stateless, so one instance serves every unmatched attachment
+        self._fallback = FallbackProcessor(config)
         self._register_default_processors()
 
     def _register_default_processors(self) -> None:
@@ -643,7 +956,7 @@ class ProcessorFactory:
 
         for processor in processors:
             for mime_type in processor.supported_types:
-                self._processors[mime_type] = processor
+                self.register_processor(mime_type, processor)
 
     def register_processor(self, mime_type: str, processor: BaseProcessor) -> None:
         """Register a custom processor for a MIME type.
@@ -655,6 +968,11 @@ class ProcessorFactory:
         """
         self._processors[mime_type] = processor
 
+        # Index the suffixes that mimetypes would resolve to this MIME type
+        for suffix in mimetypes.guess_all_extensions(mime_type):
+            if mimetypes.guess_type(f"file{suffix}")[0] == mime_type:
+                self._processors_by_suffix[suffix] = processor
+
     def get_processor(self, mime_type: str, filename: str | None = None) -> BaseProcessor:
         """Get a processor for the given MIME type.
 
@@ -667,32 +985,33 @@ class ProcessorFactory:
 
         """
         # Direct match
-        if mime_type in self._processors:
-            return self._processors[mime_type]
+        processor = self._processors.get(mime_type)
+        if processor is not None:
+            return processor
 
-        # Try to guess from filename
+        # Try the filename suffix
         if filename:
-            guessed_type, _ = mimetypes.guess_type(filename)
-            if guessed_type and guessed_type in self._processors:
-                return self._processors[guessed_type]
+            processor = self._processors_by_suffix.get(PurePath(filename).suffix.lower())
+            if processor is not None:
+                return processor
 
         # Fallback
-        return FallbackProcessor(self.config)
+        return self._fallback
 
     def process_file(self, file_path: Path, mime_type: str | None = None) -> ExtractedContent:
         """Process a file using the appropriate processor.
 
         Args:
             file_path: Path to the file.
-            mime_type: Optional MIME type (will be guessed if not provided).
+            mime_type: Optional MIME type (resolved from the file suffix if not provided).
 
         Returns:
             ExtractedContent with processed content.
 
         """
+        # Without a MIME type the suffix table resolves the processor
         if mime_type is None:
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            mime_type = mime_type or "application/octet-stream"
+            mime_type = "application/octet-stream"
 
         processor = self.get_processor(mime_type, file_path.name)
         return processor.process(file_path)
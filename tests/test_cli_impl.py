@@ -0,0 +1,200 @@
+"""Tests for CLI implementation module."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_knowledge_agent._cli_impl import (
+    PREFETCH_THREAD_NAME,
+    _list_filenames,
+    _pad5,
+    _prefetch,
+    _process_attachments,
+    setup_logging,
+)
+from redmine_knowledge_agent.models import AttachmentInfo, ExtractedContent
+
+
+class TestSetupLogging:
+    """Tests for setup_logging function."""
+
+    def test_setup_logging_console(self) -> None:
+        """Test logging setup with console format."""
+        setup_logging(level="DEBUG", log_format="console")
+        # Should not raise
+
+    def test_setup_logging_json(self) -> None:
+        """Test logging setup with JSON format."""
+        setup_logging(level="INFO", log_format="json")
+        # Should not raise
+
+    def test_setup_logging_skips_reconfiguration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test repeated calls with the same settings do not reconfigure structlog."""
+        monkeypatch.setattr("redmine_knowledge_agent._cli_impl._configured_logging", None)
+
+        with patch("structlog.configure") as mock_configure:
+            setup_logging(level="INFO", log_format="console")
+            setup_logging(level="INFO", log_format="console")
+            assert mock_configure.call_count == 1
+
+            setup_logging(level="DEBUG", log_format="console")
+            assert mock_configure.call_count == 2
+
+
+class TestListFilenames:
+    """Tests for the attachment directory listing helper."""
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test a missing directory yields an empty set."""
+        assert _list_filenames(tmp_path / "missing") == set()
+
+    def test_existing_directory(self, tmp_path: Path) -> None:
+        """Test entry names are returned for an existing directory."""
+        (tmp_path / "a.png").write_bytes(b"")
+        (tmp_path / "b.pdf").write_bytes(b"")
+        assert _list_filenames(tmp_path) == {"a.png", "b.pdf"}
+
+
+class TestPad5:
+    """Tests for the memoized issue ID formatter."""
+
+    def test_pads_to_five_digits(self) -> None:
+        """Test short IDs are zero-padded and long IDs are kept intact."""
+        assert _pad5(1) == "00001"
+        assert _pad5(123456) == "123456"
+
+
+def _join_prefetch_threads() -> None:
+    for thread in threading.enumerate():
+        if thread.name == PREFETCH_THREAD_NAME:
+            thread.join(timeout=5)
+
+
+class TestPrefetch:
+    """Tests for the background prefetch iterator."""
+
+    def test_yields_items_in_order(self) -> None:
+        """Test all produced items are yielded in order."""
+        assert list(_prefetch(iter(range(200)), maxsize=4)) == list(range(200))
+
+    def test_producer_error_is_reraised(self) -> None:
+        """Test exceptions raised by the producer surface in the consumer."""
+
+        def failing() -> Iterator[int]:
+            yield 1
+            raise RuntimeError("API error")
+
+        result: list[int] = []
+        with pytest.raises(RuntimeError, match="API error"):
+            result.extend(_prefetch(failing()))
+        assert result == [1]
+
+    def test_consumer_stopping_early_stops_producer(self) -> None:
+        """Test the producer exits when the consumer closes the iterator."""
+        produced: list[int] = []
+
+        def counting() -> Iterator[int]:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+
+        prefetched = _prefetch(counting(), maxsize=1)
+        assert next(prefetched) == 0
+        # Let the producer fill the queue and block on the next put
+        deadline = time.monotonic() + 5
+        while len(produced) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        prefetched.close()
+        _join_prefetch_threads()
+
+        assert len(produced) < 1000
+
+
+class TestProcessAttachments:
+    """Tests for concurrent attachment download and processing."""
+
+    @staticmethod
+    def _attachment(att_id: int, filename: str = "shot.png") -> AttachmentInfo:
+        return AttachmentInfo(
+            id=att_id,
+            filename=filename,
+            content_type="image/png",
+            filesize=4,
+            content_url=f"https://redmine.test.com/attachments/download/{att_id}/{filename}",
+        )
+
+    def _run(
+        self,
+        client: MagicMock,
+        tmp_path: Path,
+    ) -> tuple[dict[int, ExtractedContent], MagicMock]:
+        factory = MagicMock()
+        factory.process_file.side_effect = lambda path, _mime: ExtractedContent(
+            text=path.read_text(),
+        )
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = _process_attachments(
+                client,
+                factory,
+                [self._attachment(1), self._attachment(2), self._attachment(3, "other.png")],
+                tmp_path / "attachments",
+                dir_listings={},
+                executor=executor,
+                failure_message="Failed to process attachment",
+            )
+        return results, factory
+
+    def test_same_filename_downloaded_once(self, tmp_path: Path) -> None:
+        """Test same-named attachments never write the shared file concurrently."""
+        guard = threading.Lock()
+        writing: set[Path] = set()
+
+        def download(url: str, path: Path) -> Path:
+            with guard:
+                assert path not in writing, "concurrent write"
+                writing.add(path)
+            time.sleep(0.05)
+            path.write_text(url.rsplit("/", 2)[1])
+            with guard:
+                writing.discard(path)
+            return path
+
+        client = MagicMock()
+        client.download_attachment.side_effect = download
+
+        results, factory = self._run(client, tmp_path)
+
+        assert client.download_attachment.call_count == 2
+        assert {att_id: content.text for att_id, content in results.items()} == {
+            1: "1",
+            2: "1",
+            3: "3",
+        }
+        assert factory.process_file.call_count == 3
+
+    def test_failed_download_retried_by_duplicate(self, tmp_path: Path) -> None:
+        """Test a duplicate downloads the file itself when the first attempt failed."""
+
+        def download(url: str, path: Path) -> Path:
+            att_id = url.rsplit("/", 2)[1]
+            if att_id == "1":
+                raise OSError("Download failed")
+            path.write_text(att_id)
+            return path
+
+        client = MagicMock()
+        client.download_attachment.side_effect = download
+
+        results, _ = self._run(client, tmp_path)
+
+        assert {att_id: content.text for att_id, content in results.items()} == {
+            2: "2",
+            3: "3",
+        }
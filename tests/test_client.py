@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import io
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from redminelib import Redmine
+from redminelib.resources import Issue
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
-from redmine_knowledge_agent.client import RedmineClient
+from redmine_knowledge_agent._http import ConditionalCacheAdapter, ResponseCache, TokenBucket
+from redmine_knowledge_agent.client import BASE_HEADERS, RedmineClient, _redmine_timestamp
 from redmine_knowledge_agent.config import RedmineConfig
 
 
+def _listed_issue(issue_id: int = 12345, journals: list[dict[str, Any]] | None = None) -> Issue:
+    """Build an issue resource as decoded from a list response.
+
+    With journals the payload also carries attachments, as Redmine returns
+    both for the listing's includes. Without them python-redmine pre-seeds
+    each include key with None.
+    """
+    payload: dict[str, Any] = {
+        "id": issue_id,
+        "project": {"id": 1, "name": "Mock Project", "identifier": "mock_project"},
+        "subject": "Listed Issue",
+        "created_on": "2024-01-10T09:00:00Z",
+        "updated_on": "2024-01-20T14:30:00Z",
+    }
+    if journals is not None:
+        payload["attachments"] = []
+        payload["journals"] = journals
+    return Issue(Redmine("https://redmine.test.com").issue, payload)
+
+
 class TestRedmineClient:
     """Tests for RedmineClient."""
 
@@ -47,8 +73,89 @@ class TestRedmineClient:
             mock_redmine_class.assert_called_once_with(
                 "https://redmine.test.com",
                 key="test_api_key",
+                requests={"headers": dict(BASE_HEADERS)},
             )
             assert result is mock_instance
+            mount_prefix, adapter = mock_instance.engine.session.mount.call_args.args
+            assert mount_prefix == "https://redmine.test.com/"
+            assert isinstance(adapter, ConditionalCacheAdapter)
+            assert adapter.poolmanager.connection_pool_kw["maxsize"] == 17
+            assert adapter.max_retries.total == 3
+            assert adapter.rate_limiter is None
+
+    def test_base_headers_not_mutated(self, config: RedmineConfig) -> None:
+        """Test creating a client leaves the shared header constant untouched."""
+        client = RedmineClient(config)
+
+        assert client.redmine.engine.session.headers["X-Redmine-API-Key"] == "test_api_key"
+        assert "X-Redmine-API-Key" not in BASE_HEADERS
+
+    def test_redmine_pool_sized_for_concurrency(self, config: RedmineConfig) -> None:
+        """Test connection pool covers paging, detail fetches and downloads at once."""
+        config.max_concurrent_requests = 32
+        client = RedmineClient(config, download_workers=8)
+
+        adapter = client.redmine.engine.session.get_adapter(
+            "https://redmine.test.com/issues.json",
+        )
+
+        assert isinstance(adapter, ConditionalCacheAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 2 * 32 + 8 + 1
+
+    def test_redmine_pool_keeps_requests_default_minimum(self, config: RedmineConfig) -> None:
+        """Test a small concurrency setting never shrinks the pool below the default."""
+        config.max_concurrent_requests = 1
+        client = RedmineClient(config)
+
+        adapter = client.redmine.engine.session.get_adapter(
+            "https://redmine.test.com/issues.json",
+        )
+
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == DEFAULT_POOLSIZE
+
+    def test_redmine_rate_limited_when_configured(self, config: RedmineConfig) -> None:
+        """Test requests_per_second installs a token bucket on the adapter."""
+        config.requests_per_second = 4.0
+        client = RedmineClient(config)
+
+        adapter = client.redmine.engine.session.get_adapter(
+            "https://redmine.test.com/issues.json",
+        )
+
+        assert isinstance(adapter.rate_limiter, TokenBucket)
+        assert adapter.rate_limiter.rate == 4.0
+
+    def test_redmine_caches_responses_in_state_file(
+        self,
+        config: RedmineConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test cache_path gives the adapter a persistent response cache."""
+        client = RedmineClient(config, cache_path=tmp_path / "state.db")
+
+        adapter = client.redmine.engine.session.get_adapter(
+            "https://redmine.test.com/issues.json",
+        )
+
+        assert isinstance(adapter.cache, ResponseCache)
+        assert (tmp_path / "state.db").exists()
+        adapter.close()
+
+    def test_redmine_unusable_state_file_disables_cache(
+        self,
+        config: RedmineConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test a state file that is not a database leaves caching off."""
+        state = tmp_path / "state.db"
+        state.write_bytes(b"not a database" * 100)
+        client = RedmineClient(config, cache_path=state)
+
+        adapter = client.redmine.engine.session.get_adapter(
+            "https://redmine.test.com/issues.json",
+        )
+
+        assert adapter.cache is None
 
     def test_list_projects(
         self,
@@ -97,7 +204,7 @@ class TestRedmineClient:
     ) -> None:
         """Test fetching project issues."""
         # Setup mock
-        mock_redmine.issue.filter.return_value = [mock_redmine_issue]
+        mock_redmine.issue.filter.return_value = [_listed_issue()]
         mock_redmine.issue.get.return_value = mock_redmine_issue
 
         issues = list(client.get_project_issues("test_project"))
@@ -126,23 +233,191 @@ class TestRedmineClient:
 
         assert len(issues) == 0
 
+    def test_get_project_issues_updated_after_filters_server_side(
+        self,
+        config: RedmineConfig,
+        mock_redmine: MagicMock,
+        mock_redmine_issue: MagicMock,
+    ) -> None:
+        """Test updated_after is sent to Redmine and listing stops at old issues."""
+        config.page_size = 2
+        client = RedmineClient(config, redmine_instance=mock_redmine)
+        listed_issue = _listed_issue(journals=[])
+        old_issue = MagicMock(spec=["id", "updated_on"])
+        old_issue.id = 1
+        old_issue.updated_on = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_redmine.issue.filter.side_effect = [
+            [listed_issue, old_issue],
+            [listed_issue, listed_issue],
+        ]
+
+        issues = list(
+            client.get_project_issues(
+                "test_project",
+                updated_after=datetime(2024, 1, 15, 9, 30, tzinfo=UTC),
+            ),
+        )
+
+        assert [issue.id for issue in issues] == [12345]
+        mock_redmine.issue.filter.assert_called_once()
+        call_kwargs = mock_redmine.issue.filter.call_args.kwargs
+        assert call_kwargs["updated_on"] == ">=2024-01-15T09:30:00Z"
+        assert call_kwargs["sort"] == "updated_on:desc"
+
     def test_get_project_issues_error_on_single_issue(
         self,
         client: RedmineClient,
         mock_redmine: MagicMock,
     ) -> None:
         """Test handling error when fetching individual issue."""
-        mock_issue = MagicMock()
-        mock_issue.id = 1
-        mock_issue.updated_on = datetime(2024, 1, 20, tzinfo=UTC)
-
-        mock_redmine.issue.filter.return_value = [mock_issue]
+        mock_redmine.issue.filter.return_value = [_listed_issue(1)]
         mock_redmine.issue.get.side_effect = ValueError("Access denied")
 
         # Should skip the problematic issue and continue
         issues = list(client.get_project_issues("test_project"))
         assert len(issues) == 0
 
+    def test_get_project_issues_skips_detail_fetch_with_journals(
+        self,
+        client: RedmineClient,
+        mock_redmine: MagicMock,
+        mock_redmine_issue: MagicMock,
+    ) -> None:
+        """Test no detail GET is made when the list response has journals."""
+        journal = {
+            "id": 7,
+            "user": {"id": 2, "name": "Reviewer"},
+            "notes": "Looks good",
+            "created_on": "2024-01-20T14:30:00Z",
+            "details": [],
+        }
+        mock_redmine.issue.filter.return_value = [
+            _listed_issue(1, journals=[journal]),
+            _listed_issue(2, journals=[]),
+        ]
+
+        issues = list(client.get_project_issues("test_project"))
+
+        assert [issue.id for issue in issues] == [1, 2]
+        assert [entry.notes for entry in issues[0].journals] == ["Looks good"]
+        mock_redmine.issue.get.assert_not_called()
+
+    def test_get_project_issues_fetches_details_without_journals(
+        self,
+        client: RedmineClient,
+        mock_redmine: MagicMock,
+        mock_redmine_issue: MagicMock,
+    ) -> None:
+        """Test a detail GET is made when the listed issue has no journals."""
+        listed_issue = _listed_issue()
+        assert listed_issue.raw()["journals"] is None
+        mock_redmine.issue.filter.return_value = [listed_issue]
+        mock_redmine.issue.get.return_value = mock_redmine_issue
+
+        issues = list(client.get_project_issues("test_project"))
+
+        assert [issue.project for issue in issues] == ["mock_project"]
+        mock_redmine.issue.get.assert_called_once_with(
+            12345,
+            include=["attachments", "journals"],
+        )
+
+    def test_get_project_issues_pages_listing(
+        self,
+        config: RedmineConfig,
+        mock_redmine: MagicMock,
+        mock_redmine_issue: MagicMock,
+    ) -> None:
+        """Test issues are listed page by page until a short page."""
+        config.page_size = 2
+        client = RedmineClient(config, redmine_instance=mock_redmine)
+        listed_issue = _listed_issue(journals=[])
+        mock_redmine.issue.filter.side_effect = [
+            [listed_issue, listed_issue],
+            [listed_issue, listed_issue],
+            [listed_issue],
+        ]
+
+        issues = list(client.get_project_issues("test_project"))
+
+        assert len(issues) == 5
+        offsets = [
+            (c.kwargs["limit"], c.kwargs["offset"])
+            for c in mock_redmine.issue.filter.call_args_list
+        ]
+        assert offsets == [(2, 0), (2, 2), (2, 4)]
+
+    def test_get_project_issues_fetches_remaining_pages_concurrently(
+        self,
+        config: RedmineConfig,
+        mock_redmine: MagicMock,
+    ) -> None:
+        """Test pages after the first are fetched by offset using total_count."""
+        config.page_size = 2
+
+        class _Page(list[MagicMock]):
+            total_count = 7
+
+        def listed_issue(issue_id: int) -> MagicMock:
+            issue = MagicMock(spec=["id"])
+            issue.id = issue_id
+            return issue
+
+        def filter_side_effect(**kwargs: int) -> list[MagicMock]:
+            offset = kwargs["offset"]
+            page = [listed_issue(i) for i in range(offset + 1, min(offset + 2, 7) + 1)]
+            return _Page(page) if offset == 0 else page
+
+        mock_redmine.issue.filter.side_effect = filter_side_effect
+        client = RedmineClient(config, redmine_instance=mock_redmine)
+
+        listed = list(client._iter_issue_pages({"project_id": "test_project"}))
+
+        assert [issue.id for issue in listed] == [1, 2, 3, 4, 5, 6, 7]
+        offsets = sorted(c.kwargs["offset"] for c in mock_redmine.issue.filter.call_args_list)
+        assert offsets == [0, 2, 4, 6]
+
+    def test_get_project_issues_preserves_order_with_concurrency(
+        self,
+        config: RedmineConfig,
+        mock_redmine: MagicMock,
+        mock_redmine_issue: MagicMock,
+    ) -> None:
+        """Test detail fetches run concurrently but yield in listing order."""
+        config.max_concurrent_requests = 2
+        client = RedmineClient(config, redmine_instance=mock_redmine)
+        listed = []
+        for issue_id in range(1, 8):
+            listed_issue = MagicMock(spec=["id"])
+            listed_issue.id = issue_id
+            listed.append(listed_issue)
+        mock_redmine.issue.filter.return_value = listed
+
+        def get_side_effect(issue_id: int, **_kwargs: object) -> MagicMock:
+            if issue_id == 4:
+                msg = "Access denied"
+                raise ValueError(msg)
+            full_issue = MagicMock()
+            full_issue.id = issue_id
+            full_issue.project = mock_redmine_issue.project
+            full_issue.tracker = mock_redmine_issue.tracker
+            full_issue.status = mock_redmine_issue.status
+            full_issue.priority = mock_redmine_issue.priority
+            full_issue.subject = "Test"
+            full_issue.description = ""
+            full_issue.created_on = mock_redmine_issue.created_on
+            full_issue.updated_on = mock_redmine_issue.updated_on
+            full_issue.attachments = []
+            full_issue.journals = []
+            return full_issue
+
+        mock_redmine.issue.get.side_effect = get_side_effect
+
+        issues = list(client.get_project_issues("test_project"))
+
+        assert [issue.id for issue in issues] == [1, 2, 3, 5, 6, 7]
+        assert mock_redmine.issue.get.call_count == 7
+
     def test_get_issue(
         self,
         client: RedmineClient,
@@ -225,18 +500,19 @@ class TestRedmineClient:
         with pytest.raises(RuntimeError, match="Not found"):
             client.get_wiki_page("test_project", "NonExistent")
 
-    @patch("redmine_knowledge_agent.client.requests")
     def test_download_attachment(
         self,
-        mock_requests: MagicMock,
         client: RedmineClient,
+        mock_redmine: MagicMock,
         tmp_path: Path,
     ) -> None:
         """Test downloading an attachment."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.iter_content.return_value = [b"file", b"data"]
-        mock_requests.get.return_value = mock_response
+        mock_response.raw = io.BytesIO(b"filedata")
+        mock_response.__enter__.return_value = mock_response
+        mock_get = mock_redmine.engine.session.get
+        mock_get.return_value = mock_response
 
         output_path = tmp_path / "subdir" / "file.txt"
 
@@ -249,20 +525,45 @@ class TestRedmineClient:
         assert output_path.exists()
         assert output_path.read_bytes() == b"filedata"
 
-        # Check headers
-        mock_requests.get.assert_called_once()
-        call_kwargs = mock_requests.get.call_args[1]
-        assert call_kwargs["headers"]["X-Redmine-API-Key"] == "test_api_key"
+        # Check the download went through the shared Redmine session
+        mock_get.assert_called_once()
+        call_kwargs = mock_get.call_args[1]
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["timeout"] == (5, 60)
+        assert mock_response.raw.decode_content is True
+        mock_response.__exit__.assert_called_once()
+
+    def test_download_attachment_uses_pooled_adapter(
+        self,
+        config: RedmineConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test downloads are sent through the session's mounted adapter."""
+        client = RedmineClient(config)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b"payload")
+
+        with patch.object(HTTPAdapter, "send", return_value=response) as mock_send:
+            client.download_attachment(
+                "https://redmine.test.com/attachments/download/1/file.txt",
+                tmp_path / "file.txt",
+            )
+
+        assert mock_send.call_args.kwargs["stream"] is True
+        sent = mock_send.call_args.args[0]
+        assert sent.headers["X-Redmine-API-Key"] == "test_api_key"
+        assert sent.headers["User-Agent"] == BASE_HEADERS["User-Agent"]
+        assert (tmp_path / "file.txt").read_bytes() == b"payload"
 
-    @patch("redmine_knowledge_agent.client.requests.get")
     def test_download_attachment_error(
         self,
-        mock_get: MagicMock,
         client: RedmineClient,
+        mock_redmine: MagicMock,
         tmp_path: Path,
     ) -> None:
         """Test download_attachment error handling."""
-        mock_get.side_effect = requests.RequestException("Network error")
+        mock_redmine.engine.session.get.side_effect = requests.RequestException("Network error")
 
         with pytest.raises(requests.RequestException, match="Network error"):
             client.download_attachment(
@@ -378,3 +679,16 @@ class TestRedmineClient:
 
         # Should be fetched because hasattr(mock_issue, 'updated_on') is False
         assert len(issues) == 1
+
+
+class TestRedmineTimestamp:
+    """Tests for _redmine_timestamp."""
+
+    def test_aware_datetime_converted_to_utc(self) -> None:
+        """Aware datetimes should be converted to UTC."""
+        value = datetime(2024, 1, 15, 17, 30, tzinfo=timezone(timedelta(hours=8)))
+        assert _redmine_timestamp(value) == "2024-01-15T09:30:00Z"
+
+    def test_naive_datetime_taken_as_utc(self) -> None:
+        """Naive datetimes should be formatted unchanged."""
+        assert _redmine_timestamp(datetime(2024, 1, 15, 9, 30)) == "2024-01-15T09:30:00Z"  # noqa: DTZ001
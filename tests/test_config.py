@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 from pydantic import ValidationError
 
+from redmine_knowledge_agent import config as config_module
 from redmine_knowledge_agent.config import (
     AppConfig,
     EnvSettings,
@@ -33,6 +36,49 @@ class TestRedmineConfig:
         assert config.url == "https://redmine.example.com"
         assert config.api_key == "test_key"
 
+    def test_max_concurrent_requests(self) -> None:
+        """Test max_concurrent_requests default and lower bound."""
+        config = RedmineConfig(url="https://redmine.example.com", api_key="k")
+        assert config.max_concurrent_requests == 8
+        with pytest.raises(ValidationError):
+            RedmineConfig(
+                url="https://redmine.example.com",
+                api_key="k",
+                max_concurrent_requests=0,
+            )
+
+    def test_max_retries(self) -> None:
+        """Test max_retries default and lower bound."""
+        config = RedmineConfig(url="https://redmine.example.com", api_key="k")
+        assert config.max_retries == 3
+        with pytest.raises(ValidationError):
+            RedmineConfig(
+                url="https://redmine.example.com",
+                api_key="k",
+                max_retries=-1,
+            )
+
+    def test_requests_per_second(self) -> None:
+        """Test requests_per_second defaults to unlimited and must be positive."""
+        config = RedmineConfig(url="https://redmine.example.com", api_key="k")
+        assert config.requests_per_second is None
+        with pytest.raises(ValidationError):
+            RedmineConfig(
+                url="https://redmine.example.com",
+                api_key="k",
+                requests_per_second=0,
+            )
+
+    @pytest.mark.parametrize("page_size", [0, 101])
+    def test_page_size_bounds(self, page_size: int) -> None:
+        """Test page_size must be within Redmine's 1-100 limit."""
+        with pytest.raises(ValidationError):
+            RedmineConfig(
+                url="https://redmine.example.com",
+                api_key="k",
+                page_size=page_size,
+            )
+
     def test_env_var_resolution(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test environment variable resolution for api_key."""
         monkeypatch.setenv("TEST_REDMINE_KEY", "secret_from_env")
@@ -83,6 +129,42 @@ class TestOutputConfig:
         assert isinstance(path, Path)
         assert path.is_absolute()
 
+    def test_output_path_resolved_once(self) -> None:
+        """Test the resolved output path is computed once and reused."""
+        config = OutputConfig(path="~/output", projects=["proj"])
+        with patch.object(Path, "resolve", autospec=True, side_effect=Path.absolute) as resolve:
+            first = config.get_output_path()
+            second = config.get_output_path()
+        assert first is second
+        resolve.assert_called_once()
+        assert "~" not in str(first)
+
+    def test_output_path_follows_path_changes(self, tmp_path: Path) -> None:
+        """Test the cached path is recomputed after assignment or model_copy."""
+        config = OutputConfig(path=str(tmp_path / "a"), projects=["proj"])
+        assert config.get_output_path() == tmp_path / "a"
+
+        copied = config.model_copy(update={"path": str(tmp_path / "b")})
+        config.path = str(tmp_path / "c")
+
+        assert copied.get_output_path() == tmp_path / "b"
+        assert config.get_output_path() == tmp_path / "c"
+
+    def test_relative_output_path_follows_cwd(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a relative path is resolved again after the working directory changes."""
+        (tmp_path / "one").mkdir()
+        (tmp_path / "two").mkdir()
+        config = OutputConfig(path="./out", projects=["proj"])
+
+        monkeypatch.chdir(tmp_path / "one")
+        assert config.get_output_path() == (tmp_path / "one" / "out").resolve()
+        monkeypatch.chdir(tmp_path / "two")
+        assert config.get_output_path() == (tmp_path / "two" / "out").resolve()
+
 
 class TestProcessingConfig:
     """Tests for ProcessingConfig."""
@@ -93,8 +175,16 @@ class TestProcessingConfig:
         assert config.textile_to_markdown is True
         assert config.ocr_enabled is True
         assert config.ocr_engine == "pytesseract"
+        assert config.ocr_preprocess is False
+        assert config.max_ocr_dim == 2400
+        assert config.max_workers == 8
         assert config.multimodal_llm.enabled is False
 
+    def test_max_workers_must_be_positive(self) -> None:
+        """Test max_workers rejects values below 1."""
+        with pytest.raises(ValidationError):
+            ProcessingConfig(max_workers=0)
+
     def test_custom_values(self) -> None:
         """Test custom processing config values."""
         config = ProcessingConfig(
@@ -160,6 +250,7 @@ class TestStateConfig:
         config = StateConfig()
         assert config.backend == "sqlite"
         assert config.path == "./.state.db"
+        assert config.cache_responses is True
 
     def test_get_state_path(self) -> None:
         """Test get_state_path returns Path object."""
@@ -167,6 +258,10 @@ class TestStateConfig:
         path = config.get_state_path()
         assert isinstance(path, Path)
         assert path.is_absolute()
+        assert config.get_state_path() is path
+
+        copied = config.model_copy(update={"path": "./other.db"})
+        assert copied.get_state_path() == path.with_name("other.db")
 
 
 class TestAppConfig:
@@ -189,6 +284,16 @@ class TestAppConfig:
         projects = config.get_all_projects()
         assert projects == ["proj_a", "proj_b", "proj_c"]
 
+        # Callers get an independent list each time
+        projects.append("mutated")
+        assert config.get_all_projects() == ["proj_a", "proj_b", "proj_c"]
+
+        config.outputs.append(OutputConfig(path="./c", projects=["proj_d"]))
+        assert config.get_all_projects() == ["proj_a", "proj_b", "proj_c", "proj_d"]
+
+        config.outputs = [OutputConfig(path="./e", projects=["proj_e"])]
+        assert config.get_all_projects() == ["proj_e"]
+
     def test_from_yaml(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test loading config from YAML file."""
         monkeypatch.setenv("TEST_API_KEY", "yaml_test_key")
@@ -219,6 +324,80 @@ class TestAppConfig:
         assert loaded.outputs[0].include_subprojects is True
         assert loaded.logging.level == "DEBUG"
 
+    def test_from_yaml_cached_until_file_changes(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test parsed YAML is reused until the file's mtime or size changes."""
+        config_file = tmp_path / "config.yaml"
+        config_data = {
+            "redmine": {"url": "https://a.test", "api_key": "key"},
+            "outputs": [{"path": "./output", "projects": ["proj"]}],
+        }
+        with config_file.open("w") as f:
+            yaml.dump(config_data, f)
+
+        load_calls = 0
+        real_load = yaml.load
+
+        def counting_load(stream: object, Loader: type) -> object:  # noqa: N803
+            nonlocal load_calls
+            load_calls += 1
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr("redmine_knowledge_agent.config.yaml.load", counting_load)
+
+        first = AppConfig.from_yaml(config_file)
+        first.outputs[0].projects.append("mutated")
+        second = AppConfig.from_yaml(config_file)
+
+        assert load_calls == 1
+        assert second.outputs[0].projects == ["proj"]
+
+        config_data["redmine"]["url"] = "https://changed.test"
+        with config_file.open("w") as f:
+            yaml.dump(config_data, f)
+
+        third = AppConfig.from_yaml(config_file)
+
+        assert load_calls == 2
+        assert third.redmine.url == "https://changed.test"
+
+    def test_yaml_cache_evicts_oldest(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the YAML cache is bounded and evicts least recently used entries."""
+        monkeypatch.setattr(config_module, "YAML_CACHE_MAX_ENTRIES", 2)
+        monkeypatch.setattr(config_module, "_YAML_CACHE", OrderedDict())
+
+        config_data = {
+            "redmine": {"url": "https://a.test", "api_key": "key"},
+            "outputs": [{"path": "./output", "projects": ["proj"]}],
+        }
+        files = []
+        for name in ("a.yaml", "b.yaml", "c.yaml"):
+            config_file = tmp_path / name
+            with config_file.open("w") as f:
+                yaml.dump(config_data, f)
+            files.append(config_file)
+            AppConfig.from_yaml(config_file)
+
+        assert list(config_module._YAML_CACHE) == [str(files[1]), str(files[2])]
+
+    def test_yaml_loader_is_safe(self, tmp_path: Path) -> None:
+        """Test configs are parsed with a safe (libyaml-backed if available) loader."""
+        if yaml.__with_libyaml__:
+            assert config_module.SafeLoader is yaml.CSafeLoader
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("redmine: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            AppConfig.from_yaml(config_file)
+
     def test_from_yaml_file_not_found(self, tmp_path: Path) -> None:
         """Test error when YAML file doesn't exist."""
         with pytest.raises(FileNotFoundError):
@@ -283,3 +462,16 @@ class TestMultimodalLLMConfigEnvVars:
         config = MultimodalLLMConfig(api_key="literal_key")
 
         assert config.api_key == "literal_key"
+
+    def test_explicit_none(self) -> None:
+        """Test an explicit None api_key is kept."""
+        config = MultimodalLLMConfig(api_key=None)
+
+        assert config.api_key is None
+
+    @pytest.mark.parametrize("value", ["${}", "${not-a-name}", "prefix${VAR}", "${VAR}suffix"])
+    def test_malformed_reference_kept_literal(self, value: str) -> None:
+        """Test values that are not a whole ${VAR_NAME} reference are kept as-is."""
+        config = MultimodalLLMConfig(api_key=value)
+
+        assert config.api_key == value
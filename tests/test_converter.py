@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import pytest
 
-from redmine_knowledge_agent.converter import TextileConverter, textile_to_markdown
+from redmine_knowledge_agent.converter import (
+    TextileConverter,
+    _shared_converter,
+    textile_to_markdown,
+)
 
 
 class TestTextileConverter:
@@ -141,6 +145,13 @@ class TestTextileConverter:
         result = converter.convert(textile)
         assert "|" in result
 
+    def test_tables_wide(self, converter: TextileConverter) -> None:
+        """Tables wider than the precomputed separators should still convert."""
+        header = "|" + "|".join(f"_.H{i}" for i in range(12)) + "|"
+        result = converter.convert(header + "\n|" + "|".join("c" * 12) + "|")
+        assert "| " + " | ".join(["---"] * 12) + " |" in result
+        assert "| H0 | H1 |" in result
+
     def test_horizontal_rules(self, converter: TextileConverter) -> None:
         """Test horizontal rule conversion."""
         result = converter.convert("---")
@@ -181,6 +192,81 @@ See "our website":https://example.com for more info.
         assert "```python" in result
         assert "[our website](https://example.com)" in result
 
+    def test_code_block_content_untouched(self, converter: TextileConverter) -> None:
+        """Markup inside code blocks should not be converted."""
+        result = converter.convert("<pre># not a list\n*ptr = _x_;</pre>")
+        assert result == "```\n# not a list\n*ptr = _x_;\n```"
+
+    def test_placeholder_shaped_input_not_substituted(self, converter: TextileConverter) -> None:
+        """NUL-delimited numbers in the input should not be read as code placeholders."""
+        assert converter.convert("<pre>x</pre> \x001\x00") == "```\nx\n``` 1"
+        assert converter.convert("<pre>x</pre> \x000\x00") == "```\nx\n``` 0"
+        assert converter.convert("@a@ \x011\x01") == "`a` 1"
+
+    @pytest.mark.parametrize(
+        ("textile", "expected"),
+        [
+            ("*Note: use @foo@ here*", "**Note: use `foo` here**"),
+            (
+                '*see "the docs":http://x.com for details*',
+                "**see [the docs](http://x.com) for details**",
+            ),
+            ("_see [[Page]] now_", "*see [Page](Page) now*"),
+        ],
+    )
+    def test_emphasis_spans_other_constructs(
+        self,
+        converter: TextileConverter,
+        textile: str,
+        expected: str,
+    ) -> None:
+        """Emphasis around links and inline code should still be converted."""
+        assert converter.convert(textile) == expected
+
+    def test_mixed_emphasis_leftmost_span_wins(self, converter: TextileConverter) -> None:
+        """Overlapping spans of different delimiters should nest, not interleave."""
+        assert converter.convert("*a _b_ c*") == "**a *b* c**"
+        assert converter.convert("_a *b_ c*") == "*a *b* c*"
+        assert converter.convert("-a *b- c*") == "~~a *b~~ c*"
+
+    def test_inline_code_content_untouched(self, converter: TextileConverter) -> None:
+        """Markup inside inline code should not be converted."""
+        assert converter.convert("Call @a*b*c@") == "Call `a*b*c`"
+
+    def test_link_url_and_image_name_untouched(self, converter: TextileConverter) -> None:
+        """Underscores and dashes in URLs and file names should be preserved."""
+        result = converter.convert('"docs":http://x.com/a_b_c !my_file-1-.png!')
+        assert "[docs](http://x.com/a_b_c)" in result
+        assert "![my_file-1-.png](./attachments/my_file-1-.png)" in result
+
+    def test_emphasis_stays_on_one_line(self, converter: TextileConverter) -> None:
+        """Emphasis should not span lines."""
+        assert converter.convert("*open\nclose* and *b*") == "*open\nclose* and **b**"
+        assert converter.convert("x -a\n-b-") == "x -a\n~~b~~"
+
+    def test_emphasis_prefers_longer_span(self, converter: TextileConverter) -> None:
+        """A one-character span is only used when no longer span closes."""
+        assert converter.convert("a_b_c d_") == "a*b_c d*"
+        assert converter.convert("a _b_") == "a *b*"
+
+    def test_unmatched_delimiters_linear(self, converter: TextileConverter) -> None:
+        """Many unmatched delimiters on one line should be left as-is quickly."""
+        text = "x *a _b -c " * 20000
+        assert converter.convert(text) == text.strip()
+
+    def test_nested_markup(self, converter: TextileConverter) -> None:
+        """Inline markup inside headers, quotes, links and spans should convert."""
+        assert converter.convert("h2. *Bold* title") == "## **Bold** title"
+        assert converter.convert("bq. _quoted_") == "> *quoted*"
+        assert converter.convert("*_both_*") == "***both***"
+        assert converter.convert("[[Page|*Text*]]") == "[**Text**](Page)"
+
+    def test_plain_text_fast_path(self, converter: TextileConverter) -> None:
+        """Text without markup should only be stripped and have blank lines collapsed."""
+        assert converter.convert("  Plain prose.\n\n\n\nMore text.  ") == (
+            "Plain prose.\n\nMore text."
+        )
+
     def test_cleanup_excessive_newlines(self, converter: TextileConverter) -> None:
         """Test that excessive newlines are cleaned up."""
         textile = "Line 1\n\n\n\n\nLine 2"
@@ -201,6 +287,12 @@ class TestTextileToMarkdownFunction:
         result = textile_to_markdown("!img.png!", "./images")
         assert "![img.png](./images/img.png)" in result
 
+    def test_reuses_converter_per_prefix(self) -> None:
+        """Repeated calls with the same prefix should reuse one converter."""
+        assert textile_to_markdown("!a.png!", "./x") == "![a.png](./x/a.png)"
+        assert textile_to_markdown("!a.png!", "./y") == "![a.png](./y/a.png)"
+        assert _shared_converter("./x") is _shared_converter("./x")
+
 
 class TestTextileConverterEdgeCases:
     """Additional edge case tests for TextileConverter."""
@@ -6,8 +6,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
+import yaml
 
-from redmine_knowledge_agent.generator import MarkdownGenerator
+from redmine_knowledge_agent.generator import MarkdownGenerator, _format_kb
 from redmine_knowledge_agent.models import (
     AttachmentInfo,
     ExtractedContent,
@@ -117,6 +118,7 @@ class TestMarkdownGenerator:
 
         content = path.read_text(encoding="utf-8")
         assert "Issue #12345" in content
+        assert content == generator.generate_issue_markdown(sample_issue)
 
     def test_save_wiki_page(
         self,
@@ -132,6 +134,7 @@ class TestMarkdownGenerator:
 
         content = path.read_text(encoding="utf-8")
         assert "TestWikiPage" in content
+        assert content == generator.generate_wiki_markdown(sample_wiki_page)
 
     def test_sanitize_filename(self, generator: MarkdownGenerator) -> None:
         """Test filename sanitization."""
@@ -139,12 +142,16 @@ class TestMarkdownGenerator:
         assert generator._sanitize_filename("with/slash") == "with_slash"
         assert generator._sanitize_filename("with:colon") == "with_colon"
         assert generator._sanitize_filename('with"quote') == "with_quote"
+        assert generator._sanitize_filename("a\\b*c?d<e>f|g") == "a_b_c_d_e_f_g"
 
     def test_format_datetime(self, generator: MarkdownGenerator) -> None:
         """Test datetime formatting."""
         dt = datetime(2024, 1, 15, 14, 30, tzinfo=UTC)
         formatted = generator._format_datetime(dt)
         assert formatted == "2024-01-15 14:30"
+        # Years are always four digits, unlike strftime("%Y") on glibc
+        early = datetime(5, 3, 4, 1, 2, 59, tzinfo=UTC)
+        assert generator._format_datetime(early) == "0005-03-04 01:02"
 
     def test_build_attachment_section_with_error(
         self,
@@ -220,6 +227,69 @@ class TestMarkdownGenerator:
         assert "parent_id" in fm
         assert "custom_fields" in fm
 
+    def test_front_matter_round_trips(
+        self,
+        generator: MarkdownGenerator,
+        sample_issue: IssueMetadata,
+    ) -> None:
+        """Front matter should be safe, block-style YAML in insertion order."""
+        sample_issue.subject = "中文: 標題 #1"
+        sample_issue.custom_fields = {"Tags": ["a", "b"], "Empty": None}
+
+        fm = generator._build_issue_front_matter(sample_issue)
+        data = yaml.safe_load(fm.strip("-\n"))
+
+        assert "中文" in fm
+        assert "!!python" not in fm
+        assert list(data)[:2] == ["id", "project"]
+        assert data["subject"] == "中文: 標題 #1"
+        assert data["custom_fields"] == {"Tags": ["a", "b"], "Empty": None}
+
+    def test_front_matter_plain_scalars(
+        self,
+        generator: MarkdownGenerator,
+        sample_issue: IssueMetadata,
+    ) -> None:
+        """Simple values should be written without quotes."""
+        sample_issue.estimated_hours = 2.5
+
+        fm = generator._build_issue_front_matter(sample_issue)
+
+        assert "status: In Progress\n" in fm
+        assert "created_on: 2024-01-10 09:00\n" in fm
+        assert "estimated_hours: 2.5\n" in fm
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "yes",
+            "NULL",
+            "1.0",
+            "12:30",
+            "a: b",
+            "a #b",
+            "- item",
+            " padded ",
+            'quote " and \\ backslash',
+            "line\nbreak",
+            "\x7f\x85\u2028\ufeff",
+            "",
+            0,
+            2.5,
+            1e20,
+            float("inf"),
+            True,
+            None,
+        ],
+    )
+    def test_front_matter_scalar_round_trip(
+        self,
+        generator: MarkdownGenerator,
+        value: object,
+    ) -> None:
+        """Values needing quotes or the YAML dumper should load back unchanged."""
+        assert yaml.safe_load(generator._dump_yaml({"key": value})) == {"key": value}
+
     def test_attachment_section_image_preview(
         self,
         generator: MarkdownGenerator,
@@ -288,6 +358,27 @@ class TestMarkdownGenerator:
         # Should still generate valid markdown
         assert "# Issue #1" in md
 
+    def test_trailing_whitespace_sections_trimmed(
+        self,
+        generator: MarkdownGenerator,
+    ) -> None:
+        """Whitespace-only trailing sections should not leave blank lines at the end."""
+        issue = IssueMetadata(
+            id=1,
+            project="proj",
+            tracker="Bug",
+            status="Open",
+            priority="Normal",
+            subject="Test",
+            description_textile="   ",
+            created_on=datetime(2024, 1, 1, tzinfo=UTC),
+            updated_on=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        md = generator.generate_issue_markdown(issue)
+
+        assert md.endswith("# Issue #1: Test\n\n## 描述\n")
+
     def test_wiki_page_without_text(
         self,
         generator: MarkdownGenerator,
@@ -435,6 +526,22 @@ class TestMarkdownGenerator:
         assert "內容:" not in section
         assert sample_attachment.filename in section
 
+    def test_journals_section_reuses_converted_notes(
+        self,
+        generator: MarkdownGenerator,
+    ) -> None:
+        """Identical notes should only be converted once."""
+        now = datetime(2024, 1, 1, tzinfo=UTC)
+        journals = [
+            JournalEntry(id=i, user="u", notes="*Closed*", created_on=now) for i in range(3)
+        ]
+
+        section = generator._build_journals_section(journals)
+
+        assert section.count("**Closed**") == 3
+        info = generator._convert_notes.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
     def test_journals_section_filters_empty_notes(
         self,
         generator: MarkdownGenerator,
@@ -482,3 +589,12 @@ class TestMarkdownGenerator:
 
         # Should not have discussion section
         assert "討論記錄" not in md
+
+
+class TestFormatKb:
+    """Tests for _format_kb."""
+
+    @pytest.mark.parametrize("size", [0, 256, 768, 1024, 1100, 1536, 52480, 10**9 + 7])
+    def test_matches_float_formatting(self, size: int) -> None:
+        """Integer formatting should match one-decimal float formatting, ties included."""
+        assert _format_kb(size) == f"{size / 1024:.1f}"
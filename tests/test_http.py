@@ -0,0 +1,412 @@
+"""Tests for HTTP transport helpers."""
+
+from __future__ import annotations
+
+import sqlite3
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from redmine_knowledge_agent import _http
+from redmine_knowledge_agent._http import (
+    ConditionalCacheAdapter,
+    ResponseCache,
+    TokenBucket,
+    _cache_key,
+    _CachedResponse,
+    rate_limit_retry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+URL = "https://redmine.test.com/issues.json?project_id=demo"
+
+
+def _response(
+    status_code: int,
+    content: bytes = b"",
+    headers: dict[str, str] | None = None,
+) -> requests.Response:
+    """Build a response as returned by the underlying transport."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+def _get(url: str = URL) -> requests.PreparedRequest:
+    """Prepare a GET request."""
+    return requests.Request("GET", url).prepare()
+
+
+class TestConditionalCacheAdapter:
+    """Tests for ConditionalCacheAdapter."""
+
+    @pytest.fixture
+    def adapter(self, tmp_path: Path) -> Iterator[ConditionalCacheAdapter]:
+        """Create an adapter backed by a cache in a temporary state file."""
+        adapter = ConditionalCacheAdapter(cache=ResponseCache(tmp_path / "state.db"))
+        yield adapter
+        adapter.close()
+
+    def test_serves_cached_body_on_not_modified(
+        self,
+        adapter: ConditionalCacheAdapter,
+    ) -> None:
+        """A 304 should be returned to the caller as 200 with the cached body."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.side_effect = [
+                _response(200, b'{"issues": []}', {"ETag": '"v1"'}),
+                _response(304),
+            ]
+
+            first = adapter.send(_get())
+            second_request = _get()
+            second = adapter.send(second_request)
+
+        assert first.json() == {"issues": []}
+        assert second_request.headers["If-None-Match"] == '"v1"'
+        assert second.status_code == 200
+        assert second.json() == {"issues": []}
+
+    def test_sends_if_modified_since(
+        self,
+        adapter: ConditionalCacheAdapter,
+    ) -> None:
+        """Last-Modified should be echoed back as If-Modified-Since."""
+        last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.side_effect = [
+                _response(200, b"{}", {"Last-Modified": last_modified}),
+                _response(200, b"{}"),
+            ]
+
+            adapter.send(_get())
+            request = _get()
+            adapter.send(request)
+
+        assert request.headers["If-Modified-Since"] == last_modified
+        assert "If-None-Match" not in request.headers
+
+    def test_changed_resource_replaces_cache(
+        self,
+        adapter: ConditionalCacheAdapter,
+    ) -> None:
+        """A fresh 200 should replace the cached body and validator."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.side_effect = [
+                _response(200, b'{"v": 1}', {"ETag": '"v1"'}),
+                _response(200, b'{"v": 2}', {"ETag": '"v2"'}),
+                _response(304),
+            ]
+
+            adapter.send(_get())
+            adapter.send(_get())
+            request = _get()
+            response = adapter.send(request)
+
+        assert request.headers["If-None-Match"] == '"v2"'
+        assert response.json() == {"v": 2}
+
+    def test_responses_without_validators_not_cached(
+        self,
+        adapter: ConditionalCacheAdapter,
+    ) -> None:
+        """Responses without ETag or Last-Modified should not be cached."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.side_effect = [_response(200, b"{}"), _response(200, b"{}")]
+
+            adapter.send(_get())
+            request = _get()
+            adapter.send(request)
+
+        assert "If-None-Match" not in request.headers
+        assert "If-Modified-Since" not in request.headers
+
+    def test_error_responses_pass_through(
+        self,
+        adapter: ConditionalCacheAdapter,
+    ) -> None:
+        """Non-200 responses should be returned untouched and not cached."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.side_effect = [
+                _response(404, b"", {"ETag": '"x"'}),
+                _response(404),
+            ]
+
+            adapter.send(_get())
+            request = _get()
+            response = adapter.send(request)
+
+        assert response.status_code == 404
+        assert "If-None-Match" not in request.headers
+
+    @pytest.mark.parametrize(
+        ("method", "stream"),
+        [("POST", False), ("GET", True)],
+    )
+    def test_bypasses_non_get_and_streaming(
+        self,
+        adapter: ConditionalCacheAdapter,
+        method: str,
+        stream: bool,
+    ) -> None:
+        """Non-GET and streaming requests should not touch the cache."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.return_value = _response(200, b"{}", {"ETag": '"v1"'})
+
+            adapter.send(requests.Request(method, URL).prepare(), stream=stream)
+
+        assert adapter.cache is not None
+        assert adapter.cache.get(_cache_key(_get())) is None
+
+    def test_cache_survives_new_adapter(self, tmp_path: Path) -> None:
+        """A later run should revalidate against bodies cached by an earlier one."""
+        state = tmp_path / "nested" / "state.db"
+        first_run = ConditionalCacheAdapter(cache=ResponseCache(state))
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.return_value = _response(200, b'{"v": 1}', {"ETag": '"v1"'})
+            first_run.send(_get())
+        first_run.close()
+
+        second_run = ConditionalCacheAdapter(cache=ResponseCache(state))
+        request = _get()
+        with patch.object(HTTPAdapter, "send", return_value=_response(304)):
+            response = second_run.send(request)
+        second_run.close()
+
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert response.json() == {"v": 1}
+
+    def test_cache_keyed_per_api_key(self, adapter: ConditionalCacheAdapter) -> None:
+        """Responses cached for one API key should not be revalidated for another."""
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.return_value = _response(200, b"{}", {"ETag": '"v1"'})
+            adapter.send(_get())
+            request = _get()
+            request.headers["X-Redmine-API-Key"] = "other"
+            adapter.send(request)
+
+        assert "If-None-Match" not in request.headers
+
+    def test_without_cache_sends_unconditionally(self) -> None:
+        """Without a cache the adapter should not add conditional headers."""
+        adapter = ConditionalCacheAdapter()
+        with patch.object(HTTPAdapter, "send") as mock_send:
+            mock_send.return_value = _response(200, b"{}", {"ETag": '"v1"'})
+            adapter.send(_get())
+            request = _get()
+            adapter.send(request)
+        adapter.close()
+
+        assert "If-None-Match" not in request.headers
+
+
+class TestResponseCache:
+    """Tests for the SQLite-backed ResponseCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored bodies and validators should be returned unchanged."""
+        cache = ResponseCache(tmp_path / "state.db")
+        entry = _CachedResponse('"v1"', None, b'{"issues": []}' * 100)
+        cache.put("key", entry)
+
+        assert cache.get("key") == entry
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """The cache should be bounded by max_entries, keeping recently read keys."""
+        cache = ResponseCache(tmp_path / "state.db", max_entries=2)
+        with patch("redmine_knowledge_agent._http.time.time", side_effect=range(10)):
+            cache.put("a", _CachedResponse('"a"', None, b"a"))
+            cache.put("b", _CachedResponse('"b"', None, b"b"))
+            cache.get("a")
+            cache.put("c", _CachedResponse('"c"', None, b"c"))
+
+            assert cache.get("b") is None
+            assert cache.get("a") is not None
+            assert cache.get("c") is not None
+        cache.close()
+
+    def test_invalid_state_file_raises(self, tmp_path: Path) -> None:
+        """A state file that is not a database should raise sqlite3.Error."""
+        path = tmp_path / "state.db"
+        path.write_bytes(b"not a database" * 100)
+
+        with pytest.raises(sqlite3.Error):
+            ResponseCache(path)
+
+
+class TestRateLimitRetry:
+    """Tests for rate_limit_retry."""
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_retries_rate_limited_gets(self, status: int) -> None:
+        """GETs answered with 429/503 should be retried."""
+        retry = rate_limit_retry(3)
+        assert retry.is_retry("GET", status, has_retry_after=False)
+
+    def test_does_not_retry_other_requests(self) -> None:
+        """Non-GET requests and other statuses should not be retried."""
+        retry = rate_limit_retry(3)
+        assert not retry.is_retry("POST", 429, has_retry_after=True)
+        assert not retry.is_retry("GET", 500, has_retry_after=False)
+
+    def test_honours_retry_after(self) -> None:
+        """Retry-After in seconds and HTTP-date form should be parsed."""
+        retry = rate_limit_retry(3)
+        assert retry.parse_retry_after("7") == 7
+        assert retry.parse_retry_after("Mon, 01 Jan 2024 00:00:00 GMT") == 0
+        assert retry.respect_retry_after_header
+
+    def test_returns_last_response_when_exhausted(self) -> None:
+        """Exhausted retries should surface the final response, not raise."""
+        retry = rate_limit_retry(2)
+        assert retry.total == 2
+        assert retry.status == 2
+        assert retry.connect == 0
+        assert retry.raise_on_status is False
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_paced(self) -> None:
+        """Requests within capacity pass immediately, then wait for refill."""
+        with (
+            patch("redmine_knowledge_agent._http.time.monotonic", return_value=100.0),
+            patch("redmine_knowledge_agent._http.time.sleep") as mock_sleep,
+        ):
+            bucket = TokenBucket(rate=2.0)
+            bucket.acquire()
+            bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            bucket.acquire()
+            mock_sleep.assert_called_once_with(0.5)
+
+    def test_refills_over_time(self) -> None:
+        """Elapsed time should refill tokens up to capacity."""
+        with (
+            patch("redmine_knowledge_agent._http.time.monotonic") as mock_clock,
+            patch("redmine_knowledge_agent._http.time.sleep") as mock_sleep,
+        ):
+            mock_clock.return_value = 0.0
+            bucket = TokenBucket(rate=1.0)
+            bucket.acquire()
+            mock_clock.return_value = 10.0
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_throttle_and_relax(self) -> None:
+        """Throttling halves the rate within bounds; relax restores it."""
+        bucket = TokenBucket(rate=16.0)
+        for _ in range(10):
+            bucket.throttle()
+        assert bucket.rate == 1.0
+
+        for _ in range(40):
+            bucket.relax()
+        assert bucket.rate == 16.0
+
+
+class TestConditionalCacheAdapterRateLimit:
+    """Tests for rate limiting in ConditionalCacheAdapter."""
+
+    def test_acquires_token_and_relaxes_on_success(self) -> None:
+        """Each request should take a token; success relaxes the limiter."""
+        limiter = MagicMock(spec=TokenBucket)
+        adapter = ConditionalCacheAdapter(rate_limiter=limiter)
+        with patch.object(HTTPAdapter, "send", return_value=_response(200, b"{}")):
+            adapter.send(_get())
+
+        limiter.acquire.assert_called_once_with()
+        limiter.relax.assert_called_once_with()
+        limiter.throttle.assert_not_called()
+
+    def test_throttles_on_too_many_requests(self) -> None:
+        """A final 429 should throttle the limiter."""
+        limiter = MagicMock(spec=TokenBucket)
+        adapter = ConditionalCacheAdapter(rate_limiter=limiter)
+        with patch.object(HTTPAdapter, "send", return_value=_response(429)):
+            adapter.send(_get())
+
+        limiter.throttle.assert_called_once_with()
+        limiter.relax.assert_not_called()
+
+    def test_throttles_on_retried_too_many_requests(self) -> None:
+        """A 429 absorbed by a retry should still throttle the limiter."""
+        limiter = MagicMock(spec=TokenBucket)
+        adapter = ConditionalCacheAdapter(rate_limiter=limiter)
+        response = _response(200, b"{}")
+        response.raw = SimpleNamespace(
+            retries=SimpleNamespace(history=(SimpleNamespace(status=429),)),
+        )
+        with patch.object(HTTPAdapter, "send", return_value=response):
+            adapter.send(_get())
+
+        limiter.throttle.assert_called_once_with()
+
+    def test_error_response_neither_throttles_nor_relaxes(self) -> None:
+        """Other errors should leave the limiter rate unchanged."""
+        limiter = MagicMock(spec=TokenBucket)
+        adapter = ConditionalCacheAdapter(rate_limiter=limiter)
+        with patch.object(HTTPAdapter, "send", return_value=_response(500)):
+            adapter.send(_get())
+
+        limiter.throttle.assert_not_called()
+        limiter.relax.assert_not_called()
+
+
+class TestOrjsonResponse:
+    """Tests for orjson-backed response decoding."""
+
+    def _build(self, content: bytes) -> requests.Response:
+        """Build a response through the adapter."""
+        with patch.object(HTTPAdapter, "build_response", return_value=_response(200, content)):
+            return ConditionalCacheAdapter().build_response(_get(), MagicMock())
+
+    def test_decodes_with_orjson(self) -> None:
+        """Responses built by the adapter should decode JSON with orjson."""
+        response = self._build(b'{"issues": [{"id": 1}]}')
+
+        assert isinstance(response, requests.Response)
+        with patch.object(_http.orjson, "loads", wraps=_http.orjson.loads) as mock_loads:
+            assert response.json() == {"issues": [{"id": 1}]}
+        mock_loads.assert_called_once()
+
+    def test_falls_back_for_non_utf8(self) -> None:
+        """Bodies orjson rejects should be decoded by requests instead."""
+        response = self._build('{"subject": "caf\u00e9"}'.encode("utf-16"))
+
+        assert response.json() == {"subject": "caf\u00e9"}
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        """Invalid JSON should still raise a ValueError subclass."""
+        response = self._build(b"not json")
+
+        with pytest.raises(ValueError, match="Expecting value"):
+            response.json()
+
+    def test_kwargs_use_requests_decoder(self) -> None:
+        """Decoder keyword arguments should be honoured via requests."""
+        response = self._build(b'{"n": 1.5}')
+
+        assert response.json(parse_float=str) == {"n": "1.5"}
+
+    def test_plain_response_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without orjson the standard response class should be kept."""
+        monkeypatch.setattr(_http, "orjson", None)
+
+        response = self._build(b"{}")
+
+        assert type(response) is requests.Response
@@ -0,0 +1,37 @@
+"""Tests for package-level lazy exports."""
+
+from __future__ import annotations
+
+import pytest
+
+import redmine_knowledge_agent
+from redmine_knowledge_agent.processors import ProcessorFactory
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy attribute loading."""
+
+    def test_all_public_names_resolve(self) -> None:
+        """Every name in __all__ should be importable from the package."""
+        for name in redmine_knowledge_agent.__all__:
+            assert getattr(redmine_knowledge_agent, name) is not None
+
+    def test_lazy_symbol_is_source_object(self) -> None:
+        """Lazily loaded symbols should be the objects defined in their submodule."""
+        assert redmine_knowledge_agent.ProcessorFactory is ProcessorFactory
+
+    def test_lazy_symbol_cached_in_namespace(self) -> None:
+        """Resolved symbols should be cached as regular module attributes."""
+        _ = redmine_knowledge_agent.TextileConverter
+        assert "TextileConverter" in vars(redmine_knowledge_agent)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute"):
+            _ = redmine_knowledge_agent.DoesNotExist
+
+    def test_dir_includes_lazy_names(self) -> None:
+        """dir() should list lazy symbols before they are loaded."""
+        names = dir(redmine_knowledge_agent)
+        assert "RedmineClient" in names
+        assert "__version__" in names
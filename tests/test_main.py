@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,7 +11,13 @@ import pytest
 import yaml
 from typer.testing import CliRunner
 
-from redmine_knowledge_agent.__main__ import FetchMode, app, main, setup_logging
+from redmine_knowledge_agent.__main__ import (
+    FetchMode,
+    _build_app,
+    _sniff_subcommand,
+    app,
+    main,
+)
 from redmine_knowledge_agent.models import (
     AttachmentInfo,
     ExtractedContent,
@@ -22,20 +29,6 @@ from redmine_knowledge_agent.models import (
 runner = CliRunner()
 
 
-class TestSetupLogging:
-    """Tests for setup_logging function."""
-
-    def test_setup_logging_console(self) -> None:
-        """Test logging setup with console format."""
-        setup_logging(level="DEBUG", log_format="console")
-        # Should not raise
-
-    def test_setup_logging_json(self) -> None:
-        """Test logging setup with JSON format."""
-        setup_logging(level="INFO", log_format="json")
-        # Should not raise
-
-
 class TestFetchMode:
     """Tests for FetchMode enum."""
 
@@ -45,6 +38,44 @@ class TestFetchMode:
         assert FetchMode.INCREMENTAL.value == "incremental"
 
 
+class TestSubcommandSniffing:
+    """Tests for subcommand detection and trimmed app construction."""
+
+    def test_sniff_known_command(self) -> None:
+        """Test the first positional argument is detected as the subcommand."""
+        assert _sniff_subcommand(["fetch", "--config", "c.yaml"]) == "fetch"
+        assert _sniff_subcommand(["convert-textile", "in.textile"]) == "convert-textile"
+
+    def test_sniff_skips_leading_options(self) -> None:
+        """Test options before the subcommand are ignored."""
+        assert _sniff_subcommand(["--verbose", "list-projects"]) == "list-projects"
+
+    def test_sniff_no_command(self) -> None:
+        """Test None is returned for help-only or unknown invocations."""
+        assert _sniff_subcommand([]) is None
+        assert _sniff_subcommand(["--help"]) is None
+        assert _sniff_subcommand(["unknown", "fetch"]) is None
+
+    def test_build_full_app(self) -> None:
+        """Test the full app is returned when no subcommand is sniffed."""
+        assert _build_app(None) is app
+
+    def test_build_single_command_app(self, tmp_path: Path) -> None:
+        """Test a trimmed app only exposes the requested subcommand."""
+        single = _build_app("convert-textile")
+
+        help_result = runner.invoke(single, ["--help"])
+        assert help_result.exit_code == 0
+        assert "convert-textile" in help_result.stdout
+        assert "list-projects" not in help_result.stdout
+
+        input_file = tmp_path / "input.textile"
+        input_file.write_text("h1. Title")
+        result = runner.invoke(single, ["convert-textile", str(input_file)])
+        assert result.exit_code == 0
+        assert "# Title" in result.stdout
+
+
 class TestListProjectsCommand:
     """Tests for list-projects command."""
 
@@ -65,7 +96,7 @@ class TestListProjectsCommand:
             yaml.dump(config_data, f)
 
         # Mock the client
-        with patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class:
+        with patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class:
             mock_client = MagicMock()
             mock_client.list_projects.return_value = [
                 {"identifier": "proj_a", "name": "Project A", "description": "Desc A"},
@@ -117,8 +148,8 @@ class TestFetchCommand:
     def test_fetch_full(self, config_file: Path) -> None:
         """Test fetch command in full mode."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -129,12 +160,43 @@ class TestFetchCommand:
 
             assert result.exit_code == 0
             assert "完成" in result.stdout
+            client_kwargs = mock_client_class.call_args.kwargs
+            assert client_kwargs["cache_path"] == Path("./.state.db").resolve()
+            assert client_kwargs["download_workers"] == 8
+
+    @pytest.mark.parametrize(
+        "state",
+        [
+            {"backend": "json", "path": "./state.json"},
+            {"backend": "sqlite", "path": "./.state.db", "cache_responses": False},
+        ],
+    )
+    def test_fetch_skips_response_cache(
+        self,
+        config_file: Path,
+        state: dict[str, object],
+    ) -> None:
+        """Test the response cache needs the sqlite backend and cache_responses."""
+        config_data = yaml.safe_load(config_file.read_text())
+        config_data["state"] = state
+        config_file.write_text(yaml.dump(config_data))
+        with (
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
+        ):
+            mock_client_class.return_value.get_project_issues.return_value = iter([])
+            mock_client_class.return_value.get_project_wiki_pages.return_value = iter([])
+
+            result = runner.invoke(app, ["fetch", "--config", str(config_file)])
+
+            assert result.exit_code == 0
+            assert mock_client_class.call_args.kwargs["cache_path"] is None
 
     def test_fetch_skip_attachments(self, config_file: Path) -> None:
         """Test fetch with --skip-attachments."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -156,8 +218,8 @@ class TestFetchCommand:
     def test_fetch_skip_wiki(self, config_file: Path) -> None:
         """Test fetch with --skip-wiki."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -180,8 +242,8 @@ class TestFetchCommand:
     def test_fetch_specific_projects(self, config_file: Path) -> None:
         """Test fetch with --projects filter."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -200,6 +262,24 @@ class TestFetchCommand:
             )
 
             assert result.exit_code == 0
+            mock_client.get_project_issues.assert_called_once()
+
+    def test_fetch_projects_filter_excludes_other_outputs(self, config_file: Path) -> None:
+        """Test --projects skips outputs that share no project with the filter."""
+        with (
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
+        ):
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app,
+                ["fetch", "--config", str(config_file), "--projects", "other, proj_x"],
+            )
+
+            assert result.exit_code == 0
+            mock_client.get_project_issues.assert_not_called()
 
 
 class TestConvertTextileCommand:
@@ -296,9 +376,9 @@ class TestFetchCommandWithIssues:
         )
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory") as mock_factory_class,
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([issue])
@@ -321,6 +401,114 @@ class TestFetchCommandWithIssues:
             assert result.exit_code == 0
             mock_client.download_attachment.assert_called()
 
+    def test_fetch_processes_multiple_attachments(
+        self,
+        config_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test every attachment of an issue is downloaded and processed."""
+        issue = IssueMetadata(
+            id=3,
+            project="proj_a",
+            tracker="Bug",
+            status="Open",
+            priority="Normal",
+            subject="Many attachments",
+            description_textile="",
+            created_on=datetime.now(tz=UTC),
+            updated_on=datetime.now(tz=UTC),
+            attachments=[
+                AttachmentInfo(
+                    id=300 + i,
+                    filename=f"file{i}.txt",
+                    content_type="text/plain",
+                    filesize=10,
+                    content_url=f"https://test/att/{300 + i}",
+                )
+                for i in range(5)
+            ],
+        )
+
+        with (
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.get_project_issues.return_value = iter([issue])
+            mock_client.get_project_wiki_pages.return_value = iter([])
+            mock_client_class.return_value = mock_client
+
+            mock_factory = MagicMock()
+            mock_factory.process_file.return_value = ExtractedContent(
+                text="Extracted",
+                processing_method=ProcessingMethod.TEXT_EXTRACT,
+            )
+            mock_factory_class.return_value = mock_factory
+
+            mock_gen = MagicMock()
+            mock_gen_class.return_value = mock_gen
+
+            result = runner.invoke(app, ["fetch", "--config", str(config_file)])
+
+            assert result.exit_code == 0
+            assert mock_client.download_attachment.call_count == 5
+            extracted = mock_gen.save_issue.call_args.args[1]
+            assert sorted(extracted) == [300, 301, 302, 303, 304]
+
+    def test_fetch_shares_attachment_pool_across_issues(
+        self,
+        config_file: Path,
+    ) -> None:
+        """Test one attachment worker pool is reused for every issue in a run."""
+        issues = [
+            IssueMetadata(
+                id=issue_id,
+                project="proj_a",
+                tracker="Bug",
+                status="Open",
+                priority="Normal",
+                subject=f"Issue {issue_id}",
+                description_textile="",
+                created_on=datetime.now(tz=UTC),
+                updated_on=datetime.now(tz=UTC),
+                attachments=[
+                    AttachmentInfo(
+                        id=issue_id * 10,
+                        filename="file.txt",
+                        content_type="text/plain",
+                        filesize=10,
+                        content_url=f"https://test/att/{issue_id * 10}",
+                    ),
+                ],
+            )
+            for issue_id in (1, 2, 3)
+        ]
+
+        with (
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator"),
+            patch(
+                "redmine_knowledge_agent._cli_impl.ThreadPoolExecutor",
+                wraps=ThreadPoolExecutor,
+            ) as mock_pool_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.get_project_issues.return_value = iter(issues)
+            mock_client.get_project_wiki_pages.return_value = iter([])
+            mock_client_class.return_value = mock_client
+            mock_factory_class.return_value.process_file.return_value = ExtractedContent(
+                text="Extracted",
+                processing_method=ProcessingMethod.TEXT_EXTRACT,
+            )
+
+            result = runner.invoke(app, ["fetch", "--config", str(config_file)])
+
+            assert result.exit_code == 0
+            assert mock_client.download_attachment.call_count == 3
+            mock_pool_class.assert_called_once()
+
     def test_fetch_attachment_processing_error(
         self,
         config_file: Path,
@@ -349,9 +537,9 @@ class TestFetchCommandWithIssues:
         )
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory") as mock_factory_class,
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([issue])
@@ -377,8 +565,8 @@ class TestFetchCommandWithIssues:
     ) -> None:
         """Test fetch handles issue processing errors."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.side_effect = RuntimeError("API error")
@@ -415,9 +603,9 @@ class TestFetchCommandWithIssues:
         )
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory") as mock_factory_class,
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -439,6 +627,52 @@ class TestFetchCommandWithIssues:
             assert result.exit_code == 0
             mock_gen.save_wiki_page.assert_called()
 
+    def test_fetch_wiki_pages_share_attachment_dir(
+        self,
+        config_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test wiki pages sharing an attachment directory create it only once."""
+        wiki_pages = [
+            WikiPageMetadata(
+                title=f"Page{i}",
+                project="proj_a",
+                text_textile="Content",
+                version=1,
+                created_on=datetime.now(tz=UTC),
+                updated_on=datetime.now(tz=UTC),
+                attachments=[
+                    AttachmentInfo(
+                        id=400 + i,
+                        filename=f"page{i}.txt",
+                        content_type="text/plain",
+                        filesize=10,
+                        content_url=f"https://test/att/{400 + i}",
+                    ),
+                ],
+            )
+            for i in range(2)
+        ]
+
+        with (
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator"),
+            patch("pathlib.Path.mkdir", autospec=True) as mock_mkdir,
+        ):
+            mock_client = MagicMock()
+            mock_client.get_project_issues.return_value = iter([])
+            mock_client.get_project_wiki_pages.return_value = iter(wiki_pages)
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(app, ["fetch", "--config", str(config_file)])
+
+            assert result.exit_code == 0
+            assert mock_client.download_attachment.call_count == 2
+            wiki_dir = tmp_path / "output" / "proj_a" / "wiki" / "attachments"
+            created = [c.args[0] for c in mock_mkdir.call_args_list]
+            assert created.count(wiki_dir) == 1
+
     def test_fetch_wiki_attachment_error(
         self,
         config_file: Path,
@@ -464,9 +698,9 @@ class TestFetchCommandWithIssues:
         )
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -488,8 +722,8 @@ class TestFetchCommandWithIssues:
     ) -> None:
         """Test fetch handles wiki processing errors."""
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -552,9 +786,9 @@ class TestMainEntryPoint:
         ]
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory"),
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory"),
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter(issues)
@@ -626,9 +860,9 @@ class TestMainEntryPoint:
         existing_file.write_text("Already exists")
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory") as mock_factory_class,
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([issue])
@@ -703,9 +937,9 @@ class TestMainEntryPoint:
         existing_file.write_text("Already exists")
 
         with (
-            patch("redmine_knowledge_agent.__main__.RedmineClient") as mock_client_class,
-            patch("redmine_knowledge_agent.__main__.ProcessorFactory") as mock_factory_class,
-            patch("redmine_knowledge_agent.__main__.MarkdownGenerator") as mock_gen_class,
+            patch("redmine_knowledge_agent._cli_impl.RedmineClient") as mock_client_class,
+            patch("redmine_knowledge_agent._cli_impl.ProcessorFactory") as mock_factory_class,
+            patch("redmine_knowledge_agent._cli_impl.MarkdownGenerator") as mock_gen_class,
         ):
             mock_client = MagicMock()
             mock_client.get_project_issues.return_value = iter([])
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 
 from redmine_knowledge_agent.models import (
     AttachmentInfo,
+    AttachmentKind,
     ExtractedContent,
     IssueMetadata,
     JournalEntry,
@@ -117,6 +118,34 @@ class TestAttachmentInfo:
         )
         assert pdf.is_spreadsheet is False
 
+    def test_kind_derived_from_content_type(self) -> None:
+        """Test kind is classified once from the content type."""
+        expected = {
+            "image/jpeg": AttachmentKind.IMAGE,
+            "application/pdf": AttachmentKind.PDF,
+            "application/msword": AttachmentKind.DOCX,
+            "application/vnd.ms-excel": AttachmentKind.SPREADSHEET,
+            "application/zip": AttachmentKind.OTHER,
+        }
+        for content_type, kind in expected.items():
+            att = AttachmentInfo(
+                id=1,
+                filename="file",
+                content_type=content_type,
+                filesize=100,
+                content_url="http://test/1",
+            )
+            assert att.kind is kind
+
+        zip_att = AttachmentInfo(
+            id=1,
+            filename="a.zip",
+            content_type="application/zip",
+            filesize=100,
+            content_url="http://test/1",
+        )
+        assert not (zip_att.is_image or zip_att.is_pdf or zip_att.is_docx or zip_att.is_spreadsheet)
+
 
 class TestExtractedContent:
     """Tests for ExtractedContent."""
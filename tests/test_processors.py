@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import mimetypes
+import threading
+from datetime import date, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from redmine_knowledge_agent import processors as processors_module
+from redmine_knowledge_agent.config import ProcessingConfig
 from redmine_knowledge_agent.models import ProcessingMethod
 from redmine_knowledge_agent.processors import (
     BaseProcessor,
@@ -17,6 +22,10 @@ from redmine_knowledge_agent.processors import (
     PdfProcessor,
     ProcessorFactory,
     SpreadsheetProcessor,
+    _binarize_for_ocr,
+    _is_blank_row,
+    _limit_ocr_size,
+    _register_mime_types,
 )
 
 
@@ -41,6 +50,7 @@ class TestImageProcessor:
         assert result.error is not None
         assert "not found" in result.error.lower()
 
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
     @patch("redmine_knowledge_agent.processors.pytesseract")
     @patch("redmine_knowledge_agent.processors.Image")
     def test_successful_ocr(
@@ -69,7 +79,101 @@ class TestImageProcessor:
         assert result.processing_method == ProcessingMethod.OCR
         assert result.error is None
 
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
+    @patch("redmine_knowledge_agent.processors.pytesseract")
+    def test_ocr_preprocess_binarizes(
+        self,
+        mock_tesseract: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test ocr_preprocess hands tesseract a black-and-white image."""
+        image_module = pytest.importorskip("PIL.Image")
+        test_file = tmp_path / "scan.png"
+        image_module.new("RGBA", (40, 40), (200, 200, 200, 255)).save(test_file)
+        mock_tesseract.image_to_string.return_value = "text"
+
+        processor = ImageProcessor(ProcessingConfig(ocr_preprocess=True))
+        result = processor.process(test_file)
+
+        assert result.text == "text"
+        ocr_input = mock_tesseract.image_to_string.call_args.args[0]
+        assert ocr_input.mode == "L"
+        assert {value for _, value in ocr_input.getcolors()} <= {0, 255}
+
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
+    @patch("redmine_knowledge_agent.processors.pytesseract")
+    def test_large_image_downscaled_before_ocr(
+        self,
+        mock_tesseract: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test images larger than max_ocr_dim are shrunk, keeping the aspect ratio."""
+        image_module = pytest.importorskip("PIL.Image")
+        test_file = tmp_path / "photo.png"
+        image_module.new("P", (400, 100)).save(test_file)
+        mock_tesseract.image_to_string.return_value = "text"
+
+        processor = ImageProcessor(ProcessingConfig(max_ocr_dim=200))
+        processor.process(test_file)
+
+        ocr_input = mock_tesseract.image_to_string.call_args.args[0]
+        assert ocr_input.size == (200, 50)
+        assert ocr_input.mode == "RGB"
+
+    def test_limit_ocr_size_keeps_small_images(self) -> None:
+        """Test images within the limit are passed through untouched."""
+        image_module = pytest.importorskip("PIL.Image")
+        img = image_module.new("RGB", (300, 120))
+
+        assert _limit_ocr_size(img, 300) is img
+        assert _limit_ocr_size(image_module.new("RGB", (5000, 1)), 2400).size == (2400, 1)
+
+    def test_binarize_for_ocr_evens_out_shading(self) -> None:
+        """Test dark strokes stay black and a brightness gradient turns white."""
+        image_module = pytest.importorskip("PIL.Image")
+        img = image_module.new("L", (64, 64))
+        img.putdata([60 + 2 * x for _ in range(64) for x in range(64)])
+        for y in range(20, 44):
+            for x in (10, 50):
+                img.putpixel((x, y), 0)
+
+        binary = _binarize_for_ocr(img)
+
+        assert binary.mode == "L"
+        assert binary.getpixel((10, 30)) == 0
+        assert binary.getpixel((50, 30)) == 0
+        assert binary.getpixel((30, 5)) == 255
+        assert binary.getpixel((60, 60)) == 255
+
+    @patch("redmine_knowledge_agent.processors.pytesseract", None)
+    @patch("redmine_knowledge_agent.processors.tesserocr")
+    def test_tesserocr_engine_reused_per_thread(
+        self,
+        mock_tesserocr: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test tesserocr replaces pytesseract with one engine per thread."""
+        image_module = pytest.importorskip("PIL.Image")
+        monkeypatch.setattr(processors_module, "_tesserocr_local", threading.local())
+        test_file = tmp_path / "shot.png"
+        image_module.new("RGB", (20, 20)).save(test_file)
+        api = mock_tesserocr.PyTessBaseAPI.return_value
+        api.GetUTF8Text.return_value = " text\n"
+
+        processor = ImageProcessor()
+        results = [processor.process(test_file) for _ in range(2)]
+        worker = threading.Thread(target=processor.process, args=(test_file,))
+        worker.start()
+        worker.join()
+
+        assert [result.text for result in results] == ["text", "text"]
+        assert mock_tesserocr.PyTessBaseAPI.call_count == 2
+        mock_tesserocr.PyTessBaseAPI.assert_called_with(lang="eng+chi_tra")
+        assert api.SetImage.call_count == 3
+
     @patch("redmine_knowledge_agent.processors.pytesseract", None)
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
     @patch("redmine_knowledge_agent.processors.Image", None)
     def test_ocr_import_error(
         self,
@@ -132,6 +236,34 @@ class TestPdfProcessor:
         assert result.processing_method == ProcessingMethod.TEXT_EXTRACT
         assert result.metadata.get("page_count") == 1
 
+    @patch("redmine_knowledge_agent.processors.fitz")
+    def test_blank_pages_skipped(
+        self,
+        mock_fitz: MagicMock,
+        processor: PdfProcessor,
+        tmp_path: Path,
+    ) -> None:
+        """Test empty and whitespace-only pages are left out of the text."""
+        test_file = tmp_path / "test.pdf"
+        test_file.write_bytes(b"fake pdf data")
+
+        pages = []
+        for text in ["First\n", " \n\n", "", "Last\n"]:
+            page = MagicMock()
+            page.get_text.return_value = text
+            pages.append(page)
+
+        mock_doc = MagicMock()
+        mock_doc.__enter__.return_value = mock_doc
+        mock_doc.__iter__.return_value = pages
+        mock_doc.__len__.return_value = len(pages)
+        mock_fitz.open.return_value = mock_doc
+
+        result = processor.process(test_file)
+
+        assert result.text == "First\n\n\nLast\n"
+        assert result.metadata.get("page_count") == 4
+
 
 class TestDocxProcessor:
     """Tests for DocxProcessor."""
@@ -153,33 +285,21 @@ class TestDocxProcessor:
         result = processor.process(tmp_path / "nonexistent.docx")
         assert result.error is not None
 
-    @patch("redmine_knowledge_agent.processors.Document")
-    def test_successful_extraction(
-        self,
-        mock_document_class: MagicMock,
-        processor: DocxProcessor,
-        tmp_path: Path,
-    ) -> None:
+    def test_successful_extraction(self, processor: DocxProcessor, tmp_path: Path) -> None:
         """Test successful DOCX text extraction."""
+        docx = pytest.importorskip("docx")
         test_file = tmp_path / "test.docx"
-        test_file.write_bytes(b"fake docx data")
-
-        # Mock document
-        mock_para1 = MagicMock()
-        mock_para1.text = "Paragraph 1"
-        mock_para2 = MagicMock()
-        mock_para2.text = "Paragraph 2"
-
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [mock_para1, mock_para2]
-        mock_doc.tables = []
-
-        mock_document_class.return_value = mock_doc
+        doc = docx.Document()
+        doc.add_paragraph("Paragraph 1")
+        doc.add_paragraph("   ")
+        doc.add_paragraph("Paragraph 2")
+        doc.save(str(test_file))
 
         result = processor.process(test_file)
 
-        assert "Paragraph 1" in result.text
-        assert "Paragraph 2" in result.text
+        assert result.text == "Paragraph 1\n\nParagraph 2"
+        assert result.metadata["paragraph_count"] == 2
+        assert result.metadata["table_count"] == 0
         assert result.processing_method == ProcessingMethod.TEXT_EXTRACT
 
 
@@ -222,6 +342,26 @@ class TestSpreadsheetProcessor:
         result = processor.process(csv_file)
         assert "Empty" in result.text or result.metadata.get("row_count") == 0
 
+    def test_csv_skips_empty_rows(self, processor: SpreadsheetProcessor, tmp_path: Path) -> None:
+        """Test blank and all-empty CSV rows are left out of the table."""
+        csv_file = tmp_path / "gaps.csv"
+        csv_file.write_text("\nName,Age\n\n,\nAlice,30\nBob\n")
+
+        result = processor.process(csv_file)
+
+        assert result.text == "| Name | Age |\n| --- | --- |\n| Alice | 30 |\n| Bob |  |"
+        assert result.metadata["row_count"] == 3
+
+    def test_csv_only_empty_rows(self, processor: SpreadsheetProcessor, tmp_path: Path) -> None:
+        """Test a CSV with nothing but empty rows counts as empty."""
+        csv_file = tmp_path / "blank.csv"
+        csv_file.write_text("\n,,\n\n")
+
+        result = processor.process(csv_file)
+
+        assert result.text == "(Empty spreadsheet)"
+        assert result.metadata["row_count"] == 0
+
     def test_rows_to_markdown(self, processor: SpreadsheetProcessor) -> None:
         """Test _rows_to_markdown helper."""
         rows = [["A", "B"], ["1", "2"], ["3", "4"]]
@@ -231,6 +371,13 @@ class TestSpreadsheetProcessor:
         assert "| --- | --- |" in md
         assert "| 1 | 2 |" in md
 
+    def test_rows_to_markdown_ragged_rows(self, processor: SpreadsheetProcessor) -> None:
+        """Test short rows are padded, long rows truncated and % kept literally."""
+        rows = [["A", "B"], ["1"], ["1", "2", "3"], ["%s", "100%"]]
+        md = processor._rows_to_markdown(rows)
+
+        assert md == "| A | B |\n| --- | --- |\n| 1 |  |\n| 1 | 2 |\n| %s | 100% |"
+
 
 class TestFallbackProcessor:
     """Tests for FallbackProcessor."""
@@ -260,6 +407,41 @@ class TestFallbackProcessor:
         assert "test.xyz" in result.text
         assert result.metadata.get("filename") == "test.xyz"
 
+    def test_stats_file_once(self, processor: FallbackProcessor, tmp_path: Path) -> None:
+        """Test the existence check and size come from a single stat call."""
+        test_file = tmp_path / "test.xyz"
+        test_file.write_bytes(b"some data")
+
+        with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as mock_stat:
+            result = processor.process(test_file)
+
+        assert result.metadata["size"] == 9
+        mock_stat.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("archive.tar.gz", "application/x-tar"),
+            ("Report.v2.PDF", "application/pdf"),
+            ("notes", None),
+        ],
+    )
+    def test_mime_type_matches_guess_type(
+        self,
+        processor: FallbackProcessor,
+        tmp_path: Path,
+        filename: str,
+        expected: str | None,
+    ) -> None:
+        """Test the cached suffix lookup agrees with mimetypes on full names."""
+        test_file = tmp_path / filename
+        test_file.write_bytes(b"data")
+
+        result = processor.process(test_file)
+
+        assert result.metadata["mime_type"] == expected
+        assert result.metadata["mime_type"] == mimetypes.guess_type(str(test_file))[0]
+
 
 class TestProcessorFactory:
     """Tests for ProcessorFactory."""
@@ -296,11 +478,53 @@ class TestProcessorFactory:
         processor = factory.get_processor("application/unknown")
         assert isinstance(processor, FallbackProcessor)
 
+    def test_fallback_processor_reused(self, factory: ProcessorFactory) -> None:
+        """Test unmatched lookups share one fallback instance."""
+        first = factory.get_processor("application/unknown")
+        second = factory.get_processor("application/octet-stream", "file.xyz123")
+        assert first is second
+
     def test_get_processor_by_filename(self, factory: ProcessorFactory) -> None:
         """Test getting processor by filename hint."""
         processor = factory.get_processor("application/octet-stream", "test.png")
         assert isinstance(processor, ImageProcessor)
 
+    def test_get_processor_by_uppercase_suffix(self, factory: ProcessorFactory) -> None:
+        """Test filename suffix lookup is case-insensitive."""
+        processor = factory.get_processor("application/octet-stream", "SCAN.PDF")
+        assert isinstance(processor, PdfProcessor)
+
+    def test_office_suffixes_resolve_without_system_mime_tables(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test .docx/.xlsx/.webp resolve even when no OS mime.types file exists."""
+        monkeypatch.setattr(mimetypes, "knownfiles", [])
+        mimetypes.init()
+        assert mimetypes.guess_type("data.xlsx")[0] is None
+        try:
+            _register_mime_types()
+            factory = ProcessorFactory()
+
+            docx = factory.get_processor("application/octet-stream", "spec.docx")
+            xlsx = factory.get_processor("application/octet-stream", "data.xlsx")
+            webp = factory.get_processor("application/octet-stream", "shot.webp")
+        finally:
+            monkeypatch.undo()
+            mimetypes.init()
+            _register_mime_types()
+
+        assert isinstance(docx, DocxProcessor)
+        assert isinstance(xlsx, SpreadsheetProcessor)
+        assert isinstance(webp, ImageProcessor)
+
+    def test_registered_processor_reachable_by_suffix(self, factory: ProcessorFactory) -> None:
+        """Test registering a MIME type also indexes its file suffixes."""
+        custom = MagicMock(spec=BaseProcessor)
+        factory.register_processor("text/html", custom)
+
+        assert factory.get_processor("application/octet-stream", "page.html") is custom
+
     def test_get_processor_by_filename_unknown_extension(self, factory: ProcessorFactory) -> None:
         """Test getting processor with unknown extension falls back."""
         processor = factory.get_processor("application/octet-stream", "file.xyz123")
@@ -337,6 +561,7 @@ class TestProcessorFactory:
 class TestImageProcessorRGBAConversion:
     """Additional tests for ImageProcessor edge cases."""
 
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
     @patch("redmine_knowledge_agent.processors.pytesseract")
     @patch("redmine_knowledge_agent.processors.Image")
     def test_rgba_image_conversion(
@@ -363,6 +588,7 @@ class TestImageProcessorRGBAConversion:
 
         mock_img.convert.assert_called_once_with("RGB")
 
+    @patch("redmine_knowledge_agent.processors.tesserocr", None)
     @patch("redmine_knowledge_agent.processors.pytesseract")
     @patch("redmine_knowledge_agent.processors.Image")
     def test_ocr_exception(
@@ -436,43 +662,69 @@ class TestDocxProcessorEdgeCases:
         assert result.error is not None
         assert "not installed" in result.error.lower() or "not available" in result.error.lower()
 
-    @patch("redmine_knowledge_agent.processors.Document")
-    def test_docx_with_tables(
-        self,
-        mock_document_class: MagicMock,
-        tmp_path: Path,
-    ) -> None:
+    def test_docx_with_tables(self, tmp_path: Path) -> None:
         """Test DOCX with tables extraction."""
+        docx = pytest.importorskip("docx")
         processor = DocxProcessor()
         test_file = tmp_path / "test.docx"
-        test_file.write_bytes(b"fake docx")
+        doc = docx.Document()
+        doc.add_paragraph("Paragraph text")
+        table = doc.add_table(rows=3, cols=2)  # last row stays empty
+        table.cell(0, 0).text = "Cell 1"
+        table.cell(0, 1).text = "Cell 2"
+        table.cell(1, 1).add_paragraph("Second line")
+        doc.save(str(test_file))
 
-        # Mock document with tables
-        mock_para = MagicMock()
-        mock_para.text = "Paragraph text"
+        result = processor.process(test_file)
 
-        mock_cell1 = MagicMock()
-        mock_cell1.text = "Cell 1"
-        mock_cell2 = MagicMock()
-        mock_cell2.text = "Cell 2"
+        assert result.text == "Paragraph text\n\nCell 1 | Cell 2\nSecond line"
+        assert result.metadata["table_count"] == 1
 
-        mock_row = MagicMock()
-        mock_row.cells = [mock_cell1, mock_cell2]
+    def test_docx_keeps_document_order(self, tmp_path: Path) -> None:
+        """Test tables are emitted where they appear between paragraphs."""
+        docx = pytest.importorskip("docx")
+        processor = DocxProcessor()
+        test_file = tmp_path / "ordered.docx"
+        doc = docx.Document()
+        doc.add_paragraph("Before")
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "First"
+        doc.add_paragraph("Between")
+        doc.add_table(rows=1, cols=1)  # empty table adds no block
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "Second"
+        doc.add_paragraph("After")
+        doc.save(str(test_file))
 
-        mock_table = MagicMock()
-        mock_table.rows = [mock_row]
+        result = processor.process(test_file)
 
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [mock_para]
-        mock_doc.tables = [mock_table]
+        assert result.text == "Before\n\nFirst\n\nBetween\n\nSecond\n\nAfter"
+        assert result.metadata["paragraph_count"] == 3
+        assert result.metadata["table_count"] == 3
 
-        mock_document_class.return_value = mock_doc
+    def test_docx_merged_cells(self, tmp_path: Path) -> None:
+        """Test merged cells repeat their text as python-docx row.cells does."""
+        docx = pytest.importorskip("docx")
+        processor = DocxProcessor()
+        test_file = tmp_path / "merged.docx"
+        doc = docx.Document()
+        table = doc.add_table(rows=3, cols=3)
+        for row_idx, row in enumerate(table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                cell.text = f"r{row_idx}c{col_idx}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        doc.save(str(test_file))
+
+        reopened = docx.Document(str(test_file))
+        expected = [
+            " | ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+            for row in reopened.tables[0].rows
+        ]
 
         result = processor.process(test_file)
 
-        assert "Paragraph text" in result.text
-        assert "Tables" in result.text
-        assert "Cell 1" in result.text
+        assert result.text == "\n".join(expected)
+        assert expected[0].startswith("r0c0\nr0c1 | r0c0\nr0c1 | ")
+        assert expected[2].endswith("r1c2\nr2c2")
 
     @patch("redmine_knowledge_agent.processors.Document")
     def test_docx_extraction_exception(
@@ -496,6 +748,7 @@ class TestDocxProcessorEdgeCases:
 class TestSpreadsheetProcessorEdgeCases:
     """Additional tests for SpreadsheetProcessor edge cases."""
 
+    @patch("redmine_knowledge_agent.processors.CalamineWorkbook", None)
     @patch("redmine_knowledge_agent.processors.openpyxl", None)
     def test_openpyxl_not_installed(self, tmp_path: Path) -> None:
         """Test handling of missing openpyxl dependency."""
@@ -508,6 +761,7 @@ class TestSpreadsheetProcessorEdgeCases:
         assert result.error is not None
         assert "not installed" in result.error.lower() or "not available" in result.error.lower()
 
+    @patch("redmine_knowledge_agent.processors.CalamineWorkbook", None)
     @patch("redmine_knowledge_agent.processors.openpyxl")
     def test_excel_processing(
         self,
@@ -537,6 +791,7 @@ class TestSpreadsheetProcessorEdgeCases:
         assert result.processing_method == ProcessingMethod.TEXT_EXTRACT
         mock_wb.close.assert_called_once()
 
+    @patch("redmine_knowledge_agent.processors.CalamineWorkbook", None)
     @patch("redmine_knowledge_agent.processors.openpyxl")
     def test_excel_empty_rows_skipped(
         self,
@@ -568,6 +823,14 @@ class TestSpreadsheetProcessorEdgeCases:
         assert "Header1" in result.text
         assert "Value1" in result.text
 
+    def test_is_blank_row(self) -> None:
+        """Test only None and empty-string cells count as blank."""
+        assert _is_blank_row((None, "", None))
+        assert _is_blank_row(())
+        assert not _is_blank_row((None, 0))
+        assert not _is_blank_row(("", False))
+        assert not _is_blank_row((" ",))
+
     def test_spreadsheet_extraction_exception(self, tmp_path: Path) -> None:
         """Test spreadsheet extraction exception handling."""
         processor = SpreadsheetProcessor()
@@ -594,6 +857,7 @@ class TestSpreadsheetProcessorEdgeCases:
 
         assert "| A | B | C |" in result.text
 
+    @patch("redmine_knowledge_agent.processors.CalamineWorkbook", None)
     @patch("redmine_knowledge_agent.processors.openpyxl")
     def test_excel_processing_exception(
         self,
@@ -734,6 +998,72 @@ class TestSpreadsheetProcessorEdgeCases:
         assert "Empty" in result.text or result.metadata.get("total_rows") == 0
 
 
+class TestSpreadsheetProcessorCalamine:
+    """Tests for the python-calamine xlsx path."""
+
+    @pytest.fixture
+    def workbook_file(self, tmp_path: Path) -> Path:
+        """Write an xlsx workbook with mixed cell types using openpyxl."""
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        sheet = wb.active
+        sheet.title = "Data"
+        sheet.append(["Name", "Count", "Ratio", "Day", "Stamp", "Flag"])
+        stamp = datetime(2024, 1, 2, 3, 4, 5)  # noqa: DTZ001 - Excel cells are naive
+        sheet.append(["a", 1, 1.5, date(2024, 1, 2), stamp, True])
+        sheet.append([None] * 6)
+        sheet.append(["b", None, 3, None, None, False])
+        sheet.append(["c", 1e20, -1e16, None, None, None])
+        sheet.append(["d", 9999999999999998.0, -1e15, None, None, None])
+        wb.create_sheet("Blank")
+        offset = wb.create_sheet("Offset")
+        offset["C3"] = "late"
+        offset["D5"] = 7
+        path = tmp_path / "data.xlsx"
+        wb.save(path)
+        return path
+
+    def test_matches_openpyxl_output(self, workbook_file: Path) -> None:
+        """Test calamine and openpyxl render the same Markdown and counts."""
+        processor = SpreadsheetProcessor()
+
+        calamine_result = processor.process(workbook_file)
+        with patch("redmine_knowledge_agent.processors.CalamineWorkbook", None):
+            openpyxl_result = processor.process(workbook_file)
+
+        assert calamine_result.error is None
+        assert calamine_result.text == openpyxl_result.text
+        assert calamine_result.metadata == openpyxl_result.metadata
+        assert "| a | 1 | 1.5 | 2024-01-02 00:00:00 | 2024-01-02 03:04:05 | True |" in (
+            calamine_result.text
+        )
+        assert "| c | 1e+20 | -1e+16 |" in calamine_result.text
+        assert "| d | 9999999999999998 | -1000000000000000 |" in calamine_result.text
+        assert calamine_result.metadata["sheet_count"] == 3
+        assert calamine_result.metadata["total_rows"] == 7
+
+    def test_empty_workbook(self, tmp_path: Path) -> None:
+        """Test a workbook without any values is reported as empty."""
+        openpyxl = pytest.importorskip("openpyxl")
+        path = tmp_path / "empty.xlsx"
+        openpyxl.Workbook().save(path)
+
+        result = SpreadsheetProcessor().process(path)
+
+        assert result.text == "(Empty spreadsheet)"
+        assert result.metadata["total_rows"] == 0
+
+    def test_corrupt_file(self, tmp_path: Path) -> None:
+        """Test calamine parse errors become error results."""
+        path = tmp_path / "broken.xlsx"
+        path.write_bytes(b"fake xlsx")
+
+        result = SpreadsheetProcessor().process(path)
+
+        assert result.error is not None
+        assert "failed" in result.error.lower()
+
+
 class TestLegacyDocProcessor:
     """Tests for LegacyDocProcessor."""
 